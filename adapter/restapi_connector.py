@@ -23,18 +23,20 @@ RestAPI module
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import threading
 from itertools import chain
+from time import perf_counter
 from typing import Any
 
-from ..async_request import http_get, set_header_get
+from ..async_request import ConnectionPool, PoolStats, set_header_get
 from ..const_common import TYPE_JSON
+from .restapi_extract import JsonExtractor, OutputFilter, ParserStats, decode_json, extract_keys
+from .restapi_metrics import EndpointMetrics, EndpointStats
+from .restapi_scheduler import JobStats, RestScheduler
 from .rf2_restapi import HttpSetup, ResRawOutput, RestAPIData, select_taskset
 
 logger = logging.getLogger(__name__)
-json_decoder = json.JSONDecoder()
 
 
 class RestAPIInfo:
@@ -49,6 +51,10 @@ class RestAPIInfo:
         "_active_interval",
         "_event",
         "_dataset",
+        "_pool",
+        "_output_filters",
+        "_scheduler",
+        "_metrics",
     )
 
     def __init__(self, parent_api):
@@ -62,12 +68,53 @@ class RestAPIInfo:
         self._event = threading.Event()
 
         self._dataset = RestAPIData()
+        self._pool: ConnectionPool | None = None
+        self._output_filters: dict[str, OutputFilter] = {}
+        self._scheduler: RestScheduler | None = None
+        self._metrics: dict[str, EndpointMetrics] = {}
 
     @property
     def telemetry(self) -> RestAPIData:
         """Rest API telemetry data"""
         return self._dataset
 
+    @property
+    def connectionStats(self) -> PoolStats | None:
+        """Connection pool statistics of current (or last) task run, None if not run yet"""
+        if self._pool is None:
+            return None
+        return self._pool.stats()
+
+    @property
+    def parserStats(self) -> dict[str, ParserStats]:
+        """Output parser statistics of repeating tasks, key - uri_path"""
+        return {uri_path: output_filter.stats() for uri_path, output_filter in tuple(self._output_filters.items())}
+
+    @property
+    def schedulerStats(self) -> dict[str, JobStats]:
+        """Scheduled job statistics of current (or last) task run, key - uri_path"""
+        if self._scheduler is None:
+            return {}
+        return self._scheduler.stats()
+
+    def metricsSnapshot(self) -> dict[str, EndpointStats]:
+        """Endpoint statistics of current (or last) task run, key - uri_path"""
+        job_stats = self.schedulerStats
+        return {
+            uri_path: metrics.snapshot(job_stats[uri_path].delay if uri_path in job_stats else 0.0)
+            for uri_path, metrics in tuple(self._metrics.items())
+        }
+
+    def boost(self, uri_path: str, duration: float = 5.0) -> bool:
+        """Update repeating task immediately, then at min interval for duration (thread-safe)
+
+        Returns:
+            False if task is not running.
+        """
+        if self._scheduler is None:
+            return False
+        return self._scheduler.boost(uri_path, duration)
+
     def __del__(self):
         logger.info("RestAPI: GC: RestAPIInfo")
 
@@ -147,17 +194,24 @@ class RestAPIInfo:
 
     def sort_taskset(self, http: HttpSetup, active_task: dict, taskset: tuple):
         """Sort task set into dictionary, key - uri_path, value - output_set"""
-        for uri_path, output_set, condition, is_repeat, min_interval in taskset:
+        for uri_path, output_set, condition, is_repeat, min_interval, priority in taskset:
             if self._cfg.get(condition, True):
                 active_task[uri_path] = output_set
                 update_interval = max(min_interval, self._active_interval)
                 yield asyncio.create_task(
-                    self.fetch(http, uri_path, output_set, is_repeat, update_interval)
+                    self.fetch(http, uri_path, output_set, is_repeat, update_interval, priority)
                 )
 
     async def task_init(self, *task_generator):
         """Run repeatedly updating task"""
-        task_group = tuple(chain(*task_generator))
+        # Keep-alive connections shared by all tasks, bound to current event loop
+        self._pool = ConnectionPool()
+        self._output_filters.clear()
+        self._metrics.clear()
+        self._scheduler = RestScheduler(
+            max_rate=min(max(self._cfg.get("restapi_max_request_rate", 10), 1), 100),
+        )
+        task_group = (asyncio.create_task(self._scheduler.run()), *chain(*task_generator))
         # Task control
         await asyncio.create_task(self.task_control(task_group))
         # Start task
@@ -166,6 +220,15 @@ class RestAPIInfo:
                 await task
             except (asyncio.CancelledError, BaseException):
                 pass
+        await self._pool.close()
+        for uri_path, output_filter in self._output_filters.items():
+            logger.info("RestAPI: PARSED: %s (%s parsed, %s skipped)",
+                uri_path, output_filter.parsed, output_filter.skipped)
+        for uri_path, stats in sorted(self.metricsSnapshot().items(), key=total_time, reverse=True):
+            logger.info("RestAPI: METRICS: %s (%s requests, %.1fms p50, %.1fms p99, %s errors, %s timeouts, "
+                "%.0f%% unchanged, %.1fs total)",
+                uri_path, stats.requests, stats.latency_p50 * 1000, stats.latency_p99 * 1000,
+                stats.errors, stats.timeouts, stats.unchanged_ratio * 100, stats.total_time)
 
     async def task_control(self, task_group: tuple[asyncio.Task, ...]):
         """Control task running state"""
@@ -180,7 +243,7 @@ class RestAPIInfo:
 
     async def fetch(
         self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...],
-        repeat: bool = False, min_interval: float = 0.01):
+        repeat: bool = False, min_interval: float = 0.01, priority: int = 0):
         """Fetch data and verify"""
         data_available = await self.update_once(http, uri_path, output_set)
         if not data_available:
@@ -188,17 +251,21 @@ class RestAPIInfo:
         elif not repeat:
             logger.info("RestAPI: ACTIVE: %s (one time)", uri_path)
         else:
-            logger.info("RestAPI: ACTIVE: %s (%sms)", uri_path, int(min_interval * 1000))
-            await self.update_repeat(http, uri_path, output_set, min_interval)
+            logger.info("RestAPI: ACTIVE: %s (%sms, priority %s)", uri_path, int(min_interval * 1000), priority)
+            self._scheduler.add(
+                uri_path, self.update_job(http, uri_path, output_set), min_interval, priority)
 
     async def update_once(
         self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...]) -> bool:
         """Update once and verify"""
         request_header = set_header_get(uri_path, http.host)
+        extractor = extract_keys(res.top_keys() for res in output_set)
+        metrics = self._metrics.setdefault(uri_path, EndpointMetrics())
         data_available = False
         total_retry = retry = http.retry
         while not self._task_cancel and retry >= 0:
-            resource_output = await get_resource(request_header, http)
+            await self._scheduler.acquire()
+            resource_output = await get_resource(self._pool, request_header, http, metrics, extractor)
             # Verify & retry
             if not isinstance(resource_output, TYPE_JSON):
                 logger.info("RestAPI: %s: %s (%s/%s retries left)",
@@ -216,22 +283,30 @@ class RestAPIInfo:
             break
         return data_available
 
-    async def update_repeat(
-        self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...], min_interval: float):
-        """Update repeat"""
+    def update_job(self, http: HttpSetup, uri_path: str, output_set: tuple[ResRawOutput, ...]):
+        """Create repeating update job for scheduler
+
+        Returns:
+            Async callable, returns True if new data, False if unchanged, None if failed.
+        """
         request_header = set_header_get(uri_path, http.host)
-        interval = min_interval
-        last_hash = new_hash = -1
-        while not self._task_cancel:  # use task control to cancel & exit loop
-            new_hash = await output_resource(self._dataset, request_header, http, output_set, last_hash)
-            if last_hash != new_hash:
-                last_hash = new_hash
-                interval = min_interval
-            elif interval < 5:  # increase update interval while no new data
-                interval += interval / 2
-                if interval > 5:
-                    interval = 5
-            await asyncio.sleep(interval)
+        extractor = extract_keys(res.top_keys() for res in output_set)
+        output_filter = self._output_filters[uri_path] = OutputFilter(output_set)
+        metrics = self._metrics.setdefault(uri_path, EndpointMetrics())
+        last_hash = -1
+
+        async def update_repeat() -> bool | None:
+            nonlocal last_hash
+            new_hash = await output_resource(
+                self._pool, self._dataset, request_header, http, output_filter, metrics, last_hash, extractor)
+            if new_hash is None:
+                return None
+            if last_hash == new_hash:
+                return False
+            last_hash = new_hash
+            return True
+
+        return update_repeat
 
 
 def reset_to_default(dataset: RestAPIData, active_task: dict[str, tuple[ResRawOutput, ...]]):
@@ -244,27 +319,64 @@ def reset_to_default(dataset: RestAPIData, active_task: dict[str, tuple[ResRawOu
         active_task.clear()
 
 
-async def get_resource(request: bytes, http: HttpSetup) -> Any | str:
+async def get_resource(
+    pool: ConnectionPool, request: bytes, http: HttpSetup, metrics: EndpointMetrics,
+    extractor: JsonExtractor | None = None) -> Any | str:
     """Get resource from REST API"""
+    metrics.add_request()
+    start = perf_counter()
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            return json_decoder.decode(raw_bytes.decode())
+        async with pool.http_get(request, http.host, http.port, http.timeout) as raw_bytes:
+            metrics.add_response(perf_counter() - start, len(raw_bytes))
+            decode_start = perf_counter()
+            resource_output = decode_json(raw_bytes, extractor)
+            metrics.add_decode(perf_counter() - decode_start)
+            return resource_output
+    except asyncio.CancelledError:
+        return "INVALID"
+    except (asyncio.TimeoutError, TimeoutError):
+        metrics.add_timeout(perf_counter() - start)
+        return "INVALID"
     except (AttributeError, TypeError, IndexError, KeyError, ValueError,
-            OSError, TimeoutError, BaseException):
+            OSError, BaseException):
+        metrics.add_error(perf_counter() - start)
         return "INVALID"
 
 
 async def output_resource(
-    dataset: RestAPIData, request: bytes, http: HttpSetup, output_set: tuple[ResRawOutput, ...], last_hash: int) -> int:
-    """Get resource from REST API and output data, skip unnecessary checking"""
+    pool: ConnectionPool, dataset: RestAPIData, request: bytes, http: HttpSetup,
+    output_filter: OutputFilter, metrics: EndpointMetrics, last_hash: int,
+    extractor: JsonExtractor | None = None) -> int | None:
+    """Get resource from REST API and output data, skip unnecessary checking
+
+    Returns:
+        Hash of response, None if failed.
+    """
+    metrics.add_request()
+    start = perf_counter()
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
+        async with pool.http_get(request, http.host, http.port, http.timeout) as raw_bytes:
+            metrics.add_response(perf_counter() - start, len(raw_bytes))
             new_hash = hash(raw_bytes)
             if last_hash != new_hash:
-                resource_output = json_decoder.decode(raw_bytes.decode())
-                for res in output_set:
-                    res.update(dataset, resource_output)
+                decode_start = perf_counter()
+                resource_output = decode_json(raw_bytes, extractor)
+                metrics.add_decode(perf_counter() - decode_start)
+                output_filter.update(dataset, resource_output)
+            else:
+                metrics.add_unchanged()
             return new_hash
+    except asyncio.CancelledError:
+        return None
+    except (asyncio.TimeoutError, TimeoutError):
+        metrics.add_timeout(perf_counter() - start)
+        return None
     except (AttributeError, TypeError, IndexError, KeyError, ValueError,
-            OSError, TimeoutError, BaseException):
-        return last_hash
+            OSError, BaseException):
+        metrics.add_error(perf_counter() - start)
+        return None
+
+
+def total_time(item: tuple[str, EndpointStats]) -> float:
+    """Sort key, endpoint total time"""
+    return item[1].total_time
@@ -0,0 +1,326 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Rest API selective JSON extraction
+
+Decode only top-level values required by task key paths from raw response text,
+skip decoding & building objects for unused sections of large responses.
+Skip updating outputs whose data subtree is unchanged (OutputFilter),
+and re-parsing unchanged per-key subtrees of whole response outputs (SubtreeCache).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple
+
+if TYPE_CHECKING:  # for type checker only
+    from .rf2_restapi import ResRawOutput, RestAPIData
+
+json_decoder = json.JSONDecoder()
+rex_space = re.compile(rb"[ \t\n\r]*")
+rex_quoted = re.compile(rb'"[^"]*"')
+MIN_EXTRACT_SIZE = 1024  # bytes, full decoding is faster for small response
+NON_STRUCTURAL = bytes(char for char in range(256) if char not in b'"[]{}')
+MISSING = object()  # never equal to any data subtree
+
+
+def nesting_depth(segment: bytes) -> int | None:
+    """Nesting depth change (brackets outside strings) of JSON segment
+
+    Segment must start outside string. Strings are removed at C speed:
+    escapes are removed first, then all characters other than quotes & brackets,
+    then adjacent quote pairs, which leaves only strings that contain brackets.
+
+    Returns:
+        Depth change, or None if segment ends inside a string.
+    """
+    if b"\\" in segment:
+        segment = segment.replace(b"\\\\", b"").replace(b'\\"', b"")
+    reduced = segment.translate(None, NON_STRUCTURAL).replace(b'""', b"")
+    if b'"' in reduced:
+        reduced = rex_quoted.sub(b"", reduced)
+        if b'"' in reduced:
+            return None
+    return reduced.count(b"{") + reduced.count(b"[") - reduced.count(b"}") - reduced.count(b"]")
+
+
+class JsonExtractor:
+    """Selective JSON extractor
+
+    Extract top-level object values by key, decoded with standard JSON decoder,
+    other values are skipped without decoding. Extracted result is a partial copy
+    of top-level object, and can be read in same way as fully decoded object.
+
+    Key is matched only at top level, nesting depth is tracked between matches.
+    First matching key is used if key is duplicated.
+    Only ASCII text is supported (non-ASCII characters escaped).
+    """
+
+    __slots__ = (
+        "_keys",
+        "_rex_key",
+    )
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """
+        Args:
+            keys: top-level key names to extract.
+        """
+        self._keys = tuple(dict.fromkeys(keys))
+        patterns = (re.escape(json.dumps(key).encode()) for key in self._keys)
+        self._rex_key = re.compile(b"(?:" + b"|".join(patterns) + rb")[ \t\n\r]*:")
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """Top-level key names"""
+        return self._keys
+
+    def extract(self, raw: bytes) -> dict[str, Any] | None:
+        """Extract values from JSON bytes
+
+        Args:
+            raw: JSON bytes.
+
+        Returns:
+            Dictionary of found keys & decoded values,
+            or None if top level is not an object or contains non-ASCII characters.
+
+        Raises:
+            ValueError: if extracted value is invalid JSON.
+        """
+        if not raw.isascii():
+            return None
+        scan_pos = rex_space.match(raw).end()
+        if raw[scan_pos:scan_pos + 1] != b"{":
+            return None
+        text = raw.decode("ascii")  # same position in text & raw
+        scan_pos += 1
+        depth = 1
+        output = {}
+        remaining = len(self._keys)
+        search = self._rex_key.search
+        raw_decode = json_decoder.raw_decode
+        match = search(raw, scan_pos)
+        while match is not None:
+            key_pos = match.start()
+            change = nesting_depth(raw[scan_pos:key_pos])
+            if change is None:  # match is inside a string value
+                match = search(raw, key_pos + 1)
+                continue
+            depth += change
+            scan_pos = key_pos
+            if depth < 1:  # end of top-level object
+                break
+            if depth != 1:  # nested key
+                match = search(raw, match.end())
+                continue
+            key = json_decoder.decode(text[key_pos:raw.rindex(b'"', key_pos, match.end()) + 1])
+            value_pos = rex_space.match(raw, match.end()).end()
+            value, scan_pos = raw_decode(text, value_pos)
+            if key not in output:
+                output[key] = value
+                remaining -= 1
+                if not remaining:
+                    break
+            match = search(raw, scan_pos)
+        return output
+
+
+def extract_keys(key_sets: Iterable[tuple[str, ...]]) -> JsonExtractor | None:
+    """Create extractor from top-level keys required by each output
+
+    Args:
+        key_sets: top-level keys required by each output, empty if output requires whole object.
+
+    Returns:
+        Extractor for all keys, None if any output requires whole object.
+    """
+    keys = []
+    for key_set in key_sets:
+        if not key_set:
+            return None
+        keys.extend(key_set)
+    if not keys:
+        return None
+    return JsonExtractor(keys)
+
+
+def decode_json(raw: bytes, extractor: JsonExtractor | None = None) -> Any:
+    """Decode JSON bytes, extract required values only if extractor is set
+
+    Fall back to full decoding if extraction is not possible or response is small.
+    """
+    if extractor is not None and len(raw) >= MIN_EXTRACT_SIZE:
+        try:
+            output = extractor.extract(raw)
+        except ValueError:
+            output = None
+        if output is not None:
+            return output
+    return json_decoder.decode(raw.decode())
+
+
+class ParserStats(NamedTuple):
+    """Output parser statistics"""
+
+    parsed: int  # output updates (subtree changed)
+    skipped: int  # output updates skipped (subtree unchanged)
+
+
+class OutputFilter:
+    """Per-output change detection
+
+    Keep last data subtree read by each output as fingerprint (compared by equality),
+    update output only if its own subtree changed since last update.
+    """
+
+    __slots__ = (
+        "_output_set",
+        "_last_subtree",
+        "parsed",
+        "skipped",
+    )
+
+    def __init__(self, output_set: tuple[ResRawOutput, ...]) -> None:
+        self._output_set = output_set
+        self._last_subtree = [MISSING] * len(output_set)
+        self.parsed = 0
+        self.skipped = 0
+
+    def update(self, dataset: RestAPIData, data: Any) -> None:
+        """Update outputs with changed subtree"""
+        last_subtree = self._last_subtree
+        for index, res in enumerate(self._output_set):
+            subtree = res.select(data)
+            if subtree == last_subtree[index]:
+                self.skipped += 1
+                continue
+            last_subtree[index] = subtree
+            res.update(dataset, data)
+            self.parsed += 1
+
+    def stats(self) -> ParserStats:
+        """Output parser statistics"""
+        return ParserStats(self.parsed, self.skipped)
+
+
+class SubtreeCache:
+    """Per-key parser cache, for output reading whole response keyed by name
+
+    Keep last subtree & result of each top-level key (ex. lap history by driver name),
+    re-run parser only for key whose subtree changed (compared by equality).
+    """
+
+    __slots__ = (
+        "_parser",
+        "_default",
+        "_cache",
+        "parsed",
+        "skipped",
+    )
+
+    def __init__(self, parser: Callable[[Any], Any], default: Any) -> None:
+        """
+        Args:
+            parser: parser of single key subtree.
+            default: output if data is not a non-empty dict.
+        """
+        self._parser = parser
+        self._default = default
+        self._cache: dict[str, tuple[Any, Any]] = {}
+        self.parsed = 0
+        self.skipped = 0
+
+    def __call__(self, data: Any) -> Any:
+        """Parse data, key - parsed result of key subtree"""
+        if not isinstance(data, dict) or not data:
+            self._cache = {}
+            return self._default
+        last_cache = self._cache
+        cache = {}
+        output = {}
+        for key, subtree in data.items():
+            cached = last_cache.get(key)
+            if cached is not None and cached[0] == subtree:
+                result = cached[1]
+                self.skipped += 1
+            else:
+                result = self._parser(subtree)
+                self.parsed += 1
+            cache[key] = (subtree, result)
+            output[key] = result
+        self._cache = cache  # drop keys no longer present
+        return output
+
+
+def sample_garage_data(num_settings: int = 300) -> str:
+    """Sample JSON text similar to /rest/garage/getPlayerGarageData"""
+    settings = {}
+    for index in range(num_settings):
+        key = f"VM_SETTING_{index}"
+        settings[key] = {
+            "available": True,
+            "key": key,
+            "name": f"Setting {index}",
+            "settings": [{"text": f"{value * 0.5:.1f} ({value})", "value": value} for value in range(10)],
+            "stringValue": f"{index * 0.5:.1f} ({index})",
+            "value": index,
+        }
+    settings["VM_STEER_LOCK"] = {"key": "VM_STEER_LOCK", "stringValue": "540 deg", "value": 3}
+    settings["VM_FUEL_CAPACITY"] = {"key": "VM_FUEL_CAPACITY", "stringValue": "2.80l/lap (14.3 laps)", "value": 40}
+    settings["VM_VIRTUAL_ENERGY"] = {"key": "VM_VIRTUAL_ENERGY", "stringValue": "3.50%/lap (28.6 laps)", "value": 100}
+    return json.dumps(settings)
+
+
+def run_benchmark(filenames: Iterable[str] = (), keys: Iterable[str] = ()):
+    """Benchmark full decoding & selective extraction
+
+    Args:
+        filenames: recorded JSON response files, use sample garage data if not set.
+        keys: top-level keys to extract, use garage setup keys if not set.
+    """
+    from timeit import repeat
+
+    payloads = []
+    for filename in filenames:
+        with open(filename, "rb") as file:
+            payloads.append((filename, file.read()))
+    if not payloads:
+        payloads.append(("sample garage data", sample_garage_data().encode()))
+    keys = tuple(keys) or ("VM_STEER_LOCK", "VM_FUEL_CAPACITY", "VM_VIRTUAL_ENERGY")
+
+    extractor = JsonExtractor(keys)
+    for name, raw in payloads:
+        number = 50
+        full = min(repeat(lambda: decode_json(raw), number=number, repeat=5)) / number
+        part = min(repeat(lambda: decode_json(raw, extractor), number=number, repeat=5)) / number
+        print(f"{name}: {len(raw)} bytes, keys {', '.join(keys)}")
+        print(f"  full decode: {full * 1e6:.1f}us, extract: {part * 1e6:.1f}us ({full / part:.1f}x)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Selective JSON extraction benchmark")
+    parser.add_argument("files", nargs="*", help="recorded JSON response files")
+    parser.add_argument("-k", "--keys", nargs="+", default=(), help="top-level keys to extract")
+    args = parser.parse_args()
+    run_benchmark(args.files, args.keys)
@@ -0,0 +1,156 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Rest API metrics
+
+Rolling per endpoint request statistics, for finding costly endpoints
+and tuning update intervals.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+from typing import NamedTuple
+
+
+class EndpointStats(NamedTuple):
+    """Endpoint statistics snapshot
+
+    Latency, size & decode time are from rolling window of recent requests,
+    counters are totals since task started.
+    """
+
+    requests: int  # total requests
+    errors: int  # failed requests & invalid responses, excluding timeout
+    timeouts: int  # timed out requests
+    unchanged_ratio: float  # fraction of responses with unchanged hash (skipped decoding)
+    latency_p50: float  # request latency (seconds)
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+    bytes_mean: float  # response size (bytes)
+    bytes_total: int  # total response bytes
+    decode_mean: float  # decode time of changed responses (seconds)
+    decode_max: float
+    total_time: float  # total request & decode time (seconds)
+    interval: float  # current update interval with backoff (seconds), 0 if not repeating
+
+
+class EndpointMetrics:
+    """Rolling endpoint metrics
+
+    Args:
+        window: number of recent samples kept for latency, size & decode time.
+    """
+
+    __slots__ = (
+        "_latency",
+        "_bytes",
+        "_decode",
+        "requests",
+        "errors",
+        "timeouts",
+        "responses",
+        "unchanged",
+        "bytes_total",
+        "total_time",
+    )
+
+    def __init__(self, window: int = 200) -> None:
+        self._latency: deque[float] = deque(maxlen=window)
+        self._bytes: deque[int] = deque(maxlen=window)
+        self._decode: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.responses = 0
+        self.unchanged = 0
+        self.bytes_total = 0
+        self.total_time = 0.0
+
+    def add_request(self) -> None:
+        """Add sent request"""
+        self.requests += 1
+
+    def add_response(self, latency: float, size: int) -> None:
+        """Add received response"""
+        self.responses += 1
+        self.bytes_total += size
+        self.total_time += latency
+        self._latency.append(latency)
+        self._bytes.append(size)
+
+    def add_decode(self, seconds: float) -> None:
+        """Add decode time of changed response"""
+        self.total_time += seconds
+        self._decode.append(seconds)
+
+    def add_unchanged(self) -> None:
+        """Add response with unchanged hash"""
+        self.unchanged += 1
+
+    def add_error(self, latency: float) -> None:
+        """Add failed request, including invalid response"""
+        self.errors += 1
+        self.total_time += latency
+
+    def add_timeout(self, latency: float) -> None:
+        """Add timed out request"""
+        self.timeouts += 1
+        self.total_time += latency
+
+    def snapshot(self, interval: float = 0.0) -> EndpointStats:
+        """Statistics snapshot
+
+        Args:
+            interval: current update interval (seconds), from scheduler.
+        """
+        latency = sorted(self._latency)
+        return EndpointStats(
+            requests=self.requests,
+            errors=self.errors,
+            timeouts=self.timeouts,
+            unchanged_ratio=self.unchanged / self.responses if self.responses else 0.0,
+            latency_p50=percentile(latency, 0.5),
+            latency_p90=percentile(latency, 0.9),
+            latency_p99=percentile(latency, 0.99),
+            latency_max=latency[-1] if latency else 0.0,
+            bytes_mean=mean(self._bytes),
+            bytes_total=self.bytes_total,
+            decode_mean=mean(self._decode),
+            decode_max=max(self._decode, default=0.0),
+            total_time=self.total_time,
+            interval=interval,
+        )
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest rank percentile of sorted values, 0 if empty"""
+    if not sorted_values:
+        return 0.0
+    index = min(max(ceil(fraction * len(sorted_values)) - 1, 0), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def mean(values: deque) -> float:
+    """Mean of values, 0 if empty"""
+    if not values:
+        return 0.0
+    return sum(values) / len(values)
@@ -0,0 +1,598 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Rest API mock server
+
+Local asyncio HTTP server that serves JSON fixtures for all Rest API task endpoints,
+for developing & benchmarking Rest API access without running the game.
+
+Scripting:
+    server = MockServer(config=MockConfig(latency=0.02, chunked=True))
+    server.start()  # background thread, serve at server.port
+    server.play(SCENARIO_PIT_MENU)  # scripted changes relative to now
+    ...
+    server.stop()
+
+Fixtures are plain JSON data keyed by uri path, recorded from game with
+record_fixtures() & save_fixtures(), or built-in default_fixtures().
+Responses evolve over time (energy, wear, clock, stint laps) from elapsed time.
+
+Server only depends on standard library, app modules (task endpoints, request)
+are imported on use by uri_paths() & record_fixtures().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import random
+import threading
+from collections import Counter
+from time import monotonic
+from typing import Any, Callable, NamedTuple, Sequence
+
+logger = logging.getLogger(__name__)
+
+REPAIR_REFUEL = "/rest/garage/UIScreen/RepairAndRefuel"
+STINT_USAGE = "/rest/strategy/usage"
+STATUS_TEXT = {200: "OK", 404: "Not Found", 500: "Internal Server Error"}
+START_TIMEOUT = 5.0  # seconds
+
+
+class MockConfig(NamedTuple):
+    """Mock server response config"""
+
+    latency: float = 0.0  # delay before response (seconds)
+    latency_jitter: float = 0.0  # max random delay added to latency (seconds)
+    chunked: bool = False  # send body with chunked transfer encoding
+    chunk_size: int = 4096  # bytes per chunk
+    error_rate: float = 0.0  # fraction of requests answered with status 500
+    drop_rate: float = 0.0  # fraction of requests closed without response
+    slow_rate: float = 0.0  # fraction of responses sent slowly in parts
+    slow_delay: float = 1.0  # total delay spread over slow response body (seconds)
+    keep_alive: bool = True  # keep connection open after response
+    seed: int = 0  # random seed for fault injection
+
+
+class ScenarioStep(NamedTuple):
+    """Scripted scenario step"""
+
+    at: float  # seconds after scenario started
+    action: Callable[[MockServer], None]
+    description: str
+
+
+def uri_paths() -> tuple[str, ...]:
+    """All Rest API task endpoints"""
+    from .rf2_restapi import TASKSET_LMU, TASKSET_RF2
+
+    return tuple(dict.fromkeys(task[0] for task in TASKSET_LMU + TASKSET_RF2))
+
+
+def weather_forecast(temperature: float, rain_chance: float) -> dict:
+    """Weather forecast nodes for one session"""
+    return {
+        node: {
+            "WNV_SKY": {"currentValue": 1 if rain_chance < 20 else 6},
+            "WNV_TEMPERATURE": {"currentValue": temperature + index},
+            "WNV_RAIN_CHANCE": {"currentValue": rain_chance},
+        }
+        for index, node in enumerate(("START", "NODE_25", "NODE_50", "NODE_75", "FINISH"))
+    }
+
+
+def pit_menu_option(name: str, current: int, texts: Sequence[str], default: int = 0) -> dict:
+    """Pit menu option"""
+    return {
+        "PMC Value": 0,
+        "currentSetting": current,
+        "default": default,
+        "name": name,
+        "settings": [{"text": text} for text in texts],
+    }
+
+
+def default_fixtures(num_settings: int = 200) -> dict[str, Any]:
+    """Built-in fixtures for all Rest API task endpoints
+
+    Args:
+        num_settings: number of extra garage settings, sets garage data size.
+    """
+    garage = {
+        f"VM_SETTING_{index}": {
+            "available": True,
+            "key": f"VM_SETTING_{index}",
+            "name": f"Setting {index}",
+            "settings": [{"text": f"{value * 0.5:.1f}", "value": value} for value in range(10)],
+            "stringValue": f"{index * 0.5:.1f}",
+            "value": index % 10,
+        }
+        for index in range(num_settings)
+    }
+    garage.update({
+        "VM_STEER_LOCK": {"key": "VM_STEER_LOCK", "stringValue": "540 deg", "value": 3},
+        "VM_FUEL_CAPACITY": {"key": "VM_FUEL_CAPACITY", "stringValue": "2.80l/lap (14.3 laps)", "value": 40},
+        "VM_VIRTUAL_ENERGY": {"key": "VM_VIRTUAL_ENERGY", "stringValue": "3.50%/lap (28.6 laps)", "value": 100},
+    })
+    pit_menu = [
+        pit_menu_option("VIRTUAL ENERGY:", 100, [f"{value}%" for value in range(101)]),
+        pit_menu_option("FUEL RATIO:", 0, ["0.95", "1.00", "1.05"]),
+        pit_menu_option("FL TIRE:", 0, ["No Change", "Medium"]),
+        pit_menu_option("FR TIRE:", 0, ["No Change", "Medium"]),
+        pit_menu_option("RL TIRE:", 0, ["No Change", "Medium"]),
+        pit_menu_option("RR TIRE:", 0, ["No Change", "Medium"]),
+        pit_menu_option("DRIVER:", 0, ["Driver 1", "Driver 2"]),
+        pit_menu_option("DAMAGE:", 0, ["Do Not Repair", "Repair Body", "Repair All"]),
+        pit_menu_option("REPLACE BRAKES:", 0, ["No", "Yes"]),
+    ]
+    return {
+        "/rest/sessions/weather": {
+            "PRACTICE": weather_forecast(22, 0),
+            "QUALIFY": weather_forecast(24, 10),
+            "RACE": weather_forecast(26, 30),
+        },
+        "/rest/sessions": {
+            "SESSSET_race_timescale": {"currentValue": 1, "name": "Race Time Scale"},
+            "SESSSET_private_qual": {"currentValue": 0, "name": "Private Qualifying"},
+            **{f"SESSSET_setting_{index}": {"currentValue": index, "name": f"Setting {index}"} for index in range(50)},
+        },
+        "/rest/sessions/setting/SESSSET_race_timescale": {"currentValue": 1},
+        "/rest/sessions/setting/SESSSET_private_qual": {"currentValue": 0},
+        "/rest/garage/fuel": {"VM_FUEL_LEVEL": {"stringValue": "2.80l/lap (14.3 laps)"}},
+        "/rest/garage/getPlayerGarageData": garage,
+        REPAIR_REFUEL: {
+            "fuelInfo": {"currentFuel": 90.0, "maxFuel": 100.0, "currentVirtualEnergy": 900.0, "maxVirtualEnergy": 900.0},
+            "wearables": {"body": {"aero": 0.0}, "brakes": [1.0, 1.0, 1.0, 1.0], "suspension": [1.0, 1.0, 1.0, 1.0]},
+            "sessionTime": {"timeOfDay": 43200.0},
+            "pitMenu": {"pitMenu": pit_menu},
+            "pitStopTimes": {"times": {
+                "FuelFillRate": 2.0, "FuelInsert": 1.0, "FuelRemove": 1.0,
+                "virtualEnergyFillRate": 0.02, "virtualEnergyInsert": 1.0, "virtualEnergyRemove": 1.0,
+                "TwoTireChange": 7.0, "FourTireChange": 12.0, "TireTimeConcurrent": 1,
+                "DriverChange": 20.0, "DriverConcurrent": 0, "BrakeChange": 40.0,
+                "FixAeroDamage": 15.0, "FixAllDamage": 60.0,
+            }},
+        },
+        "/rest/strategy/pitstop-estimate": {"penalties": 0.0, "total": 30.0},
+        STINT_USAGE: {"Driver 1": []},
+    }
+
+
+def missing_fixtures(fixtures: dict[str, Any]) -> list[str]:
+    """Rest API task endpoints without fixture"""
+    return sorted(set(uri_paths()).difference(fixtures))
+
+
+def fixture_filename(uri_path: str) -> str:
+    """Fixture filename from uri path, ex. rest_sessions_weather.json"""
+    return f"{uri_path.strip('/').replace('/', '_')}.json"
+
+
+def load_fixtures(path: str, fixtures: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Load recorded fixtures from folder, replace fixtures with same uri path
+
+    Args:
+        path: fixture folder.
+        fixtures: base fixtures, default fixtures if None.
+    """
+    output = default_fixtures() if fixtures is None else dict(fixtures)
+    for uri_path in uri_paths():
+        filename = os.path.join(path, fixture_filename(uri_path))
+        if os.path.exists(filename):
+            with open(filename, "r", encoding="utf-8") as file:
+                output[uri_path] = json.load(file)
+    return output
+
+
+def save_fixtures(path: str, fixtures: dict[str, Any]) -> None:
+    """Save fixtures to folder, one JSON file per uri path"""
+    os.makedirs(path, exist_ok=True)
+    for uri_path, data in fixtures.items():
+        with open(os.path.join(path, fixture_filename(uri_path)), "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=1)
+
+
+async def record_fixtures(host: str, port: int, timeout: float = 3.0) -> dict[str, Any]:
+    """Record fixtures from running game, skip unavailable endpoints"""
+    from ..async_request import get_response, set_header_get
+
+    fixtures = {}
+    for uri_path in uri_paths():
+        raw_bytes = await get_response(set_header_get(uri_path, host), host, port, timeout)
+        try:
+            fixtures[uri_path] = json.loads(raw_bytes)
+        except ValueError:
+            logger.info("RestAPI: MOCK: %s not available", uri_path)
+    return fixtures
+
+
+def evolve_fixtures(fixtures: dict[str, Any], elapsed: float, lap_time: float) -> None:
+    """Update time dependent values from elapsed time (seconds)"""
+    data = fixtures.get(REPAIR_REFUEL)
+    if isinstance(data, dict):
+        laps = elapsed / lap_time
+        fuel_info = data.get("fuelInfo")
+        if isinstance(fuel_info, dict):
+            max_energy = fuel_info.get("maxVirtualEnergy", 0.0)
+            fuel_info["currentVirtualEnergy"] = round(max(max_energy * (1 - laps * 0.035), 0.0), 3)
+            fuel_info["currentFuel"] = round(max(fuel_info.get("maxFuel", 0.0) * 0.9 - laps * 2.8, 0.0), 3)
+        wearables = data.get("wearables")
+        if isinstance(wearables, dict):
+            wearables["brakes"] = [round(max(1 - laps * 0.004, 0.0), 4)] * 4
+        session_time = data.get("sessionTime")
+        if isinstance(session_time, dict):
+            session_time["timeOfDay"] = round(43200.0 + elapsed, 1)
+    # Append one lap record per completed lap for current driver
+    usage = fixtures.get(STINT_USAGE)
+    if isinstance(usage, dict) and usage and isinstance(data, dict):
+        *previous, history = usage.values()
+        total_laps = int(elapsed / lap_time) - sum(len(stint) for stint in previous)
+        energy = data.get("fuelInfo", {}).get("currentVirtualEnergy", 0.0)
+        max_energy = data.get("fuelInfo", {}).get("maxVirtualEnergy", 0.0) or 1.0
+        while isinstance(history, list) and len(history) < total_laps:
+            history.append({"lap": len(history) + 1, "ve": round(energy / max_energy, 4)})
+
+
+def set_pit_menu(server: MockServer, name: str, current: int) -> None:
+    """Set pit menu option current setting"""
+    data = server.fixtures.get(REPAIR_REFUEL, {})
+    for option in data.get("pitMenu", {}).get("pitMenu", ()):
+        if option.get("name") == name:
+            option["currentSetting"] = current
+
+
+def swap_driver(server: MockServer, driver_name: str) -> None:
+    """Swap to new driver, start new stint usage history & reset driver pit option"""
+    usage = server.fixtures.setdefault(STINT_USAGE, {})
+    usage.setdefault(driver_name, [])
+    usage[driver_name] = usage.pop(driver_name)  # move current driver to last
+    set_pit_menu(server, "DRIVER:", 0)
+
+
+def set_faults(server: MockServer, **faults: Any) -> None:
+    """Change fault injection config, ex. error_rate=1.0"""
+    server.config = server.config._replace(**faults)
+
+
+SCENARIO_PIT_MENU = (
+    ScenarioStep(5.0, lambda server: set_pit_menu(server, "FUEL RATIO:", 2), "fuel ratio 1.05"),
+    ScenarioStep(6.0, lambda server: [set_pit_menu(server, f"{wheel} TIRE:", 1) for wheel in ("FL", "FR", "RL", "RR")],
+        "change 4 tyres"),
+    ScenarioStep(15.0, lambda server: set_pit_menu(server, "FUEL RATIO:", 0), "fuel ratio 0.95"),
+)
+SCENARIO_DRIVER_SWAP = (
+    ScenarioStep(5.0, lambda server: set_pit_menu(server, "DRIVER:", 1), "select driver swap"),
+    ScenarioStep(10.0, lambda server: swap_driver(server, "Driver 2"), "driver swapped"),
+)
+SCENARIO_SERVER_ERRORS = (
+    ScenarioStep(5.0, lambda server: set_faults(server, error_rate=1.0), "server errors"),
+    ScenarioStep(10.0, lambda server: set_faults(server, error_rate=0.0), "server recovered"),
+)
+SCENARIOS = {
+    "pit_menu": SCENARIO_PIT_MENU,
+    "driver_swap": SCENARIO_DRIVER_SWAP,
+    "server_errors": SCENARIO_SERVER_ERRORS,
+}
+
+
+class MockServer:
+    """Rest API mock server
+
+    Attributes:
+        fixtures: JSON data keyed by uri path, modify while holding lock.
+        config: response config, can be replaced while running.
+        requests: number of requests per uri path.
+        lock: fixtures lock.
+    """
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_lap_time",
+        "_random",
+        "_start_time",
+        "_scenario",
+        "_loop",
+        "_server",
+        "_ready",
+        "_error",
+        "_closing",
+        "_handlers",
+        "_update_thread",
+        "fixtures",
+        "config",
+        "requests",
+        "lock",
+    )
+
+    def __init__(
+        self, fixtures: dict[str, Any] | None = None, config: MockConfig = MockConfig(),
+        host: str = "127.0.0.1", port: int = 0, lap_time: float = 210.0) -> None:
+        """
+        Args:
+            fixtures: JSON data keyed by uri path, default fixtures if None.
+            config: response config.
+            host: host to bind.
+            port: port to bind, 0 to select free port.
+            lap_time: lap time for evolving responses (seconds).
+        """
+        self.fixtures = default_fixtures() if fixtures is None else copy.deepcopy(fixtures)
+        self.config = config
+        self.requests: Counter[str] = Counter()
+        self.lock = threading.Lock()
+        self._host = host
+        self._port = port
+        self._lap_time = lap_time
+        self._random = random.Random(config.seed)
+        self._start_time = monotonic()
+        self._scenario: list[ScenarioStep] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._closing: asyncio.Event | None = None
+        self._handlers: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._update_thread = None
+
+    def __del__(self):
+        logger.info("RestAPI: GC: MockServer")
+
+    @property
+    def port(self) -> int:
+        """Bound port (after start)"""
+        return self._port
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since server started"""
+        return monotonic() - self._start_time
+
+    def start(self) -> None:
+        """Start server thread, return after port is bound
+
+        Raises:
+            OSError: if failed to bind host & port.
+            TimeoutError: if server not ready within START_TIMEOUT.
+        """
+        if self._update_thread is not None:
+            logger.warning("RestAPI: MOCK: already started")
+            return
+        self._ready.clear()
+        self._error = None
+        self._update_thread = threading.Thread(target=self.__run, daemon=True)
+        self._update_thread.start()
+        if not self._ready.wait(START_TIMEOUT):
+            self._update_thread = None  # daemon thread, left to exit with process
+            raise TimeoutError(f"RestAPI: MOCK: server not ready in {START_TIMEOUT}s")
+        if self._error is not None:
+            self._update_thread.join()
+            self._update_thread = None
+            raise self._error
+        logger.info("RestAPI: MOCK: serving at %s:%s", self._host, self._port)
+
+    def stop(self) -> None:
+        """Stop server thread"""
+        if self._update_thread is None:
+            return
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.__close)
+        self._update_thread.join()
+        self._update_thread = None
+        logger.info("RestAPI: MOCK: stopped")
+
+    def play(self, scenario: Sequence[ScenarioStep]) -> None:
+        """Play scenario, step time relative to now"""
+        start = self.elapsed
+        with self.lock:
+            self._scenario.extend(step._replace(at=start + step.at) for step in scenario)
+            self._scenario.sort(key=scenario_time)
+
+    def set_fixture(self, uri_path: str, data: Any) -> None:
+        """Set fixture data"""
+        with self.lock:
+            self.fixtures[uri_path] = data
+
+    def __run(self) -> None:
+        """Server thread"""
+        asyncio.run(self.__serve())
+
+    async def __serve(self) -> None:
+        """Serve until closed"""
+        self._closing = asyncio.Event()
+        self._start_time = monotonic()
+        try:
+            self._server = await asyncio.start_server(self.__handle, self._host, self._port)
+            self._port = self._server.sockets[0].getsockname()[1]
+            self._loop = asyncio.get_running_loop()
+        except BaseException as error:
+            self._error = error
+            return
+        finally:
+            self._ready.set()
+        try:
+            await self._closing.wait()
+            # Stop accepting, then close open connections & wait handlers to finish
+            self._server.close()
+            for writer in self._handlers.values():
+                writer.close()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+        finally:
+            self._loop = None
+            self._server = None
+
+    def __close(self) -> None:
+        """Close server (in server thread)"""
+        if self._closing is not None:
+            self._closing.set()
+
+    def __update_state(self) -> None:
+        """Run due scenario steps & evolve fixtures (holding lock)"""
+        elapsed = self.elapsed
+        while self._scenario and self._scenario[0].at <= elapsed:
+            step = self._scenario.pop(0)
+            step.action(self)
+            logger.info("RestAPI: MOCK: scenario: %s", step.description)
+        evolve_fixtures(self.fixtures, elapsed, self._lap_time)
+
+    def __render(self, uri_path: str) -> bytes | None:
+        """Render fixture body, None if not found"""
+        with self.lock:
+            self.__update_state()
+            data = self.fixtures.get(uri_path)
+            if data is None:
+                return None
+            return json.dumps(data, separators=(",", ":")).encode()
+
+    async def __handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle connection"""
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        try:
+            while True:
+                header_bytes = await reader.readuntil(b"\r\n\r\n")
+                uri_path = header_bytes.split(b" ", 2)[1].split(b"?", 1)[0].decode()
+                self.requests[uri_path] += 1
+                config = self.config
+                fault = self._random.random()
+                if fault < config.drop_rate:
+                    break  # close without response
+                delay = config.latency + self._random.uniform(0, config.latency_jitter)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                body = self.__render(uri_path)
+                if body is None:
+                    status, body = 404, b""
+                elif fault < config.drop_rate + config.error_rate:
+                    status, body = 500, b""
+                else:
+                    status = 200
+                keep_alive = config.keep_alive and b"connection: close" not in header_bytes.lower()
+                slow = self._random.random() < config.slow_rate
+                await self.__respond(writer, status, body, config, keep_alive, slow)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, IndexError):
+            pass
+        finally:
+            self._handlers.pop(task, None)
+            writer.close()
+
+    async def __respond(
+        self, writer: asyncio.StreamWriter, status: int, body: bytes,
+        config: MockConfig, keep_alive: bool, slow: bool) -> None:
+        """Write response"""
+        headers = [
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}",
+            "Content-Type: application/json",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if config.chunked and status == 200:
+            headers.append("Transfer-Encoding: chunked")
+            size = max(config.chunk_size, 1)
+            parts = [
+                b"%x\r\n%s\r\n" % (len(body[pos:pos + size]), body[pos:pos + size])
+                for pos in range(0, len(body), size)
+            ]
+            parts.append(b"0\r\n\r\n")
+        else:
+            headers.append(f"Content-Length: {len(body)}")
+            parts = [body]
+        head = ("\r\n".join(headers) + "\r\n\r\n").encode()
+        if not slow:
+            writer.write(head + b"".join(parts))
+            await writer.drain()
+            return
+        # Slow response, split into 10 parts & spread delay
+        data = head + b"".join(parts)
+        step = max(len(data) // 10, 1)
+        for pos in range(0, len(data), step):
+            writer.write(data[pos:pos + step])
+            await writer.drain()
+            await asyncio.sleep(config.slow_delay / 10)
+
+
+def scenario_time(step: ScenarioStep) -> float:
+    """Scenario step time"""
+    return step.at
+
+
+def run_mock():
+    """Run mock server from command line"""
+    import argparse
+    from time import sleep
+
+    parser = argparse.ArgumentParser(description="Rest API mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6397)
+    parser.add_argument("--fixtures", default="", help="recorded fixture folder")
+    parser.add_argument("--record", default="", help="record fixtures from game at --port into folder & exit")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--chunked", action="store_true")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--scenario", choices=tuple(SCENARIOS), action="append", default=[])
+    args = parser.parse_args()
+
+    # Add logger
+    test_handler = logging.StreamHandler()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(test_handler)
+
+    if args.record:
+        fixtures = asyncio.run(record_fixtures(args.host, args.port))
+        save_fixtures(args.record, fixtures)
+        print(f"recorded {len(fixtures)} fixtures to {args.record}")
+        return
+
+    server = MockServer(
+        fixtures=load_fixtures(args.fixtures) if args.fixtures else None,
+        config=MockConfig(
+            latency=args.latency,
+            latency_jitter=args.jitter,
+            chunked=args.chunked,
+            error_rate=args.error_rate,
+            drop_rate=args.drop_rate,
+            slow_rate=args.slow_rate,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    missing = missing_fixtures(server.fixtures)
+    if missing:
+        logger.warning("RestAPI: MOCK: no fixture for %s", ", ".join(missing))
+    server.start()
+    for name in args.scenario:
+        server.play(SCENARIOS[name])
+    try:
+        while True:
+            sleep(1)
+    except KeyboardInterrupt:
+        pass
+    server.stop()
+
+
+if __name__ == "__main__":
+    run_mock()
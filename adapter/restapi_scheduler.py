@@ -0,0 +1,313 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Rest API scheduler
+
+Single scheduler for all repeating Rest API requests, limits total request rate
+against game's embedded web server, which competes with game for CPU time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from random import Random
+from time import monotonic
+from typing import Awaitable, Callable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+BOOST_PRIORITY = -1  # boosted job runs before all other jobs
+
+
+class BackoffPolicy(NamedTuple):
+    """Backoff policy shared by all jobs
+
+    Job interval grows while data unchanged, and resets to minimum interval on new data.
+    Consecutive errors (from any job) increase a shared penalty applied to all jobs,
+    so every job slows down together while server is busy or unavailable.
+    """
+
+    growth: float = 1.5  # interval multiplier while data unchanged
+    max_interval: float = 5.0  # max interval (seconds)
+    error_growth: float = 2.0  # shared penalty multiplier per consecutive error
+    max_penalty: float = 8.0  # max shared penalty multiplier
+    jitter: float = 0.1  # random fraction of interval added or subtracted
+
+
+class JobStats(NamedTuple):
+    """Scheduled job statistics"""
+
+    priority: int
+    requests: int  # total runs
+    changed: int  # runs with new data
+    errors: int  # failed runs
+    interval: float  # current interval (seconds), before shared penalty & jitter
+    delay: float  # current interval with shared penalty (seconds), before jitter
+    boosted: bool
+
+
+class ScheduledJob:
+    """Scheduled job state"""
+
+    __slots__ = (
+        "name",
+        "job",
+        "priority",
+        "min_interval",
+        "interval",
+        "next_time",
+        "boost_until",
+        "running",
+        "requests",
+        "changed",
+        "errors",
+    )
+
+    def __init__(
+        self, name: str, job: Callable[[], Awaitable[bool | None]], min_interval: float, priority: int) -> None:
+        self.name = name
+        self.job = job
+        self.priority = priority
+        self.min_interval = min_interval
+        self.interval = min_interval
+        self.next_time = 0.0  # run as soon as possible
+        self.boost_until = 0.0
+        self.running = False
+        self.requests = 0
+        self.changed = 0
+        self.errors = 0
+
+    def order(self, now: float) -> tuple[int, float]:
+        """Dispatch order, priority then due time
+
+        Priority is raised by one level for each interval overdue,
+        so low priority job is not starved while request budget is exhausted.
+        """
+        if self.boost_until > now:
+            return BOOST_PRIORITY, self.next_time
+        overdue = int((now - self.next_time) / self.interval) if self.interval > 0 and now > self.next_time else 0
+        return max(self.priority - overdue, 0), self.next_time
+
+
+class RestScheduler:
+    """Rest API scheduler
+
+    Run registered jobs repeatedly within a global request rate budget (token bucket),
+    due jobs are dispatched in priority order (lower value first, raised while overdue),
+    each job runs at most once at a time.
+
+    Job is an async callable that returns:
+        True if new data received, False if data unchanged, None if request failed.
+
+    Args:
+        max_rate: max requests per second for all jobs.
+        max_concurrency: max requests in flight for all jobs.
+        backoff: backoff policy shared by all jobs.
+    """
+
+    __slots__ = (
+        "_jobs",
+        "_max_rate",
+        "_max_burst",
+        "_max_concurrency",
+        "_backoff",
+        "_random",
+        "_tokens",
+        "_token_time",
+        "_running",
+        "_penalty",
+        "_wakeup",
+        "_loop",
+    )
+
+    def __init__(
+        self, max_rate: float = 10.0, max_concurrency: int = 2, backoff: BackoffPolicy = BackoffPolicy()) -> None:
+        self._jobs: dict[str, ScheduledJob] = {}
+        self._max_rate = max(max_rate, 0.1)
+        self._max_burst = max(self._max_rate * 0.2, 1.0)
+        self._max_concurrency = max(max_concurrency, 1)
+        self._backoff = backoff
+        self._random = Random()
+        self._tokens = self._max_burst
+        self._token_time = monotonic()
+        self._running = 0
+        self._penalty = 1.0
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def penalty(self) -> float:
+        """Shared error penalty multiplier"""
+        return self._penalty
+
+    def add(
+        self, name: str, job: Callable[[], Awaitable[bool | None]], min_interval: float, priority: int = 0) -> None:
+        """Add job, replace existing job with same name
+
+        Args:
+            name: job name, ex. uri path.
+            job: async callable, returns True if new data, False if unchanged, None if failed.
+            min_interval: min run interval (seconds).
+            priority: dispatch priority, lower value runs first.
+        """
+        self._jobs[name] = ScheduledJob(name, job, min_interval, priority)
+        self.__wake()
+
+    def boost(self, name: str, duration: float = 5.0) -> bool:
+        """Run job immediately, then at min interval with top priority for duration (thread-safe)
+
+        Returns:
+            False if job not found.
+        """
+        job = self._jobs.get(name)
+        if job is None:
+            return False
+        job.boost_until = monotonic() + duration
+        job.interval = job.min_interval
+        job.next_time = 0.0
+        self.__wake()
+        return True
+
+    def stats(self) -> dict[str, JobStats]:
+        """Job statistics, key - job name"""
+        now = monotonic()
+        return {
+            job.name: JobStats(
+                priority=job.priority,
+                requests=job.requests,
+                changed=job.changed,
+                errors=job.errors,
+                interval=job.interval,
+                delay=self.__delay(job),
+                boosted=job.boost_until > now,
+            )
+            for job in tuple(self._jobs.values())
+        }
+
+    async def acquire(self) -> None:
+        """Wait for request budget, for requests outside scheduled jobs"""
+        while True:
+            self.__refill(monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._max_rate)
+
+    async def run(self) -> None:
+        """Run scheduler until cancelled"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        running_tasks: set[asyncio.Task] = set()
+        try:
+            while True:
+                now = monotonic()
+                self.__refill(now)
+                wait_time = self._backoff.max_interval
+                if self._running < self._max_concurrency:
+                    job = self.__next_job(now)
+                    if job is not None and job.next_time > now:
+                        wait_time = job.next_time - now
+                    elif job is not None and self._tokens < 1:
+                        wait_time = (1 - self._tokens) / self._max_rate
+                    elif job is not None:
+                        self._tokens -= 1
+                        self._running += 1
+                        job.running = True
+                        task = asyncio.create_task(self.__run_job(job))
+                        running_tasks.add(task)
+                        task.add_done_callback(running_tasks.discard)
+                        continue
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait_time)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tuple(running_tasks):
+                task.cancel()
+            self._loop = None
+
+    def __refill(self, now: float) -> None:
+        """Refill request tokens"""
+        self._tokens = min(self._tokens + (now - self._token_time) * self._max_rate, self._max_burst)
+        self._token_time = now
+
+    def __next_job(self, now: float) -> ScheduledJob | None:
+        """Next job to dispatch, due jobs first in priority order, otherwise earliest job"""
+        next_job = None
+        for job in self._jobs.values():
+            if job.running:
+                continue
+            if next_job is None:
+                next_job = job
+            elif job.next_time <= now:
+                if next_job.next_time > now or job.order(now) < next_job.order(now):
+                    next_job = job
+            elif next_job.next_time > job.next_time:
+                next_job = job
+        return next_job
+
+    async def __run_job(self, job: ScheduledJob) -> None:
+        """Run job & schedule next run"""
+        try:
+            result = await job.job()
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            result = None
+        finally:
+            job.running = False
+            self._running -= 1
+        self.__reschedule(job, result)
+        self.__wake()
+
+    def __reschedule(self, job: ScheduledJob, result: bool | None) -> None:
+        """Update job interval & next run time from result"""
+        backoff = self._backoff
+        now = monotonic()
+        job.requests += 1
+        if result is None:
+            job.errors += 1
+            self._penalty = min(self._penalty * backoff.error_growth, backoff.max_penalty)
+        else:
+            self._penalty = 1.0
+        if result:
+            job.changed += 1
+            job.interval = job.min_interval
+        elif job.boost_until > now:
+            job.interval = job.min_interval
+        else:  # increase update interval while no new data
+            job.interval = min(job.interval * backoff.growth, max(backoff.max_interval, job.min_interval))
+        jitter = backoff.jitter
+        job.next_time = now + self.__delay(job) * (1 + self._random.uniform(-jitter, jitter))
+
+    def __delay(self, job: ScheduledJob) -> float:
+        """Job interval with shared penalty, before jitter"""
+        return min(job.interval * self._penalty, max(self._backoff.max_interval, job.min_interval))
+
+    def __wake(self) -> None:
+        """Wake scheduler loop (thread-safe)"""
+        loop = self._loop
+        if loop is None or self._wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:  # loop closed
+            pass
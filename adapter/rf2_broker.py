@@ -0,0 +1,355 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 shared memory broker
+
+Read game shared memory once (via SyncData), then publish versioned,
+torn-read-safe compact snapshot into broker shared memory segment,
+which any number of local processes can attach to with zero copy.
+
+Segment layout:
+    BrokerHeader, followed by BROKER_SLOTS x BrokerSlot (triple buffered).
+    Writer fills next slot (seqlock), then switches active slot.
+    Slot contains scoring & telemetry (header plus valid vehicles),
+    extended data, and telemetry mID to index lookup.
+
+Run broker:
+    python -m adapter.rf2_broker
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+else:  # run time only
+    from pyRfactor2SharedMemory import rF2data
+
+from pyRfactor2SharedMemory.rF2MMap import (
+    INVALID_INDEX,
+    MAX_VEHICLES,
+    platform_mmap,
+    vehicles_layout,
+)
+
+from .rf2_connector import MAX_IDS, SyncData, copy_vehicles_data
+
+logger = logging.getLogger(__name__)
+
+BROKER_FILE_NAME = "$LMUBridge_Broker$"
+BROKER_MAGIC = 0x4C4D5542  # "LMUB"
+BROKER_LAYOUT_VERSION = 1
+BROKER_SLOTS = 3
+MAX_PUBLISH_RETRY = 3  # max publish retries if snapshot recycled while copying
+SCOR_LAYOUT = vehicles_layout(rF2data.rF2Scoring)
+TELE_LAYOUT = vehicles_layout(rF2data.rF2Telemetry)
+
+
+class BrokerHeader(ctypes.Structure):
+    """Broker segment header"""
+
+    __slots__ = ()
+    _pack_ = 4
+    _fields_ = [
+        ("mMagic", ctypes.c_uint),  # BROKER_MAGIC once broker initialized
+        ("mLayoutVersion", ctypes.c_uint),  # BROKER_LAYOUT_VERSION
+        ("mBrokerPID", ctypes.c_uint),  # broker process ID
+        ("mActiveSlot", ctypes.c_uint),  # index of latest completely written slot
+        ("mPublishCount", ctypes.c_uint),  # total published snapshots
+        ("mRunning", ctypes.c_uint),  # 1 while broker is publishing
+    ]
+
+
+class BrokerSlot(ctypes.Structure):
+    """Broker snapshot slot"""
+
+    __slots__ = ()
+    _pack_ = 4
+    _fields_ = [
+        ("mVersionUpdateBegin", ctypes.c_uint),  # incremented right before slot is written to
+        ("mVersionUpdateEnd", ctypes.c_uint),  # incremented after slot write is done
+        ("mSnapshotSeq", ctypes.c_uint),  # SyncData snapshot sequence number
+        ("mScoringVersion", ctypes.c_uint),  # scoring mVersionUpdateEnd
+        ("mTelemetryVersion", ctypes.c_uint),  # telemetry mVersionUpdateEnd
+        ("mTeleIndexes", ctypes.c_short * MAX_IDS),  # telemetry index by mID, -1 if not found
+        ("mScoring", rF2data.rF2Scoring),
+        ("mTelemetry", rF2data.rF2Telemetry),
+        ("mExtended", rF2data.rF2Extended),
+    ]
+
+
+class BrokerData(ctypes.Structure):
+    """Broker segment data"""
+
+    __slots__ = ()
+    _pack_ = 4
+    _fields_ = [
+        ("mHeader", BrokerHeader),
+        ("mSlots", BrokerSlot * BROKER_SLOTS),
+    ]
+
+
+class SharedMemoryBroker:
+    """Shared memory broker (single reader, multi-process fan-out)"""
+
+    __slots__ = (
+        "_sync",
+        "_name",
+        "_mmap_buffer",
+        "_data",
+        "_num_vehicles",
+        "_updating",
+        "_update_thread",
+        "_event",
+        "dropped",
+    )
+
+    def __init__(self, name: str = BROKER_FILE_NAME) -> None:
+        """Initialize broker
+
+        Args:
+            name: broker segment name.
+        """
+        self._sync = SyncData()
+        self._name = name
+        self._mmap_buffer = None
+        self._data = None
+        self._num_vehicles = [[MAX_VEHICLES, MAX_VEHICLES] for _ in range(BROKER_SLOTS)]
+        self._updating = False
+        self._update_thread = None
+        self._event = threading.Event()
+        self.dropped = 0  # snapshots dropped after recycled while copying
+
+    def __del__(self):
+        logger.info("broker: GC: SharedMemoryBroker")
+
+    def start(self, access_mode: int = 0, rf2_pid: str = "") -> None:
+        """Start reading game shared memory & publishing snapshot
+
+        Args:
+            access_mode: 0 = copy access, 1 = direct access.
+            rf2_pid: rF2 Process ID for accessing server data.
+        """
+        if self._updating:
+            logger.warning("broker: UPDATING: already started")
+            return
+        self._updating = True
+        self._mmap_buffer = platform_mmap(self._name, ctypes.sizeof(BrokerData), "")
+        self._data = BrokerData.from_buffer(self._mmap_buffer)
+        header = self._data.mHeader
+        header.mLayoutVersion = BROKER_LAYOUT_VERSION
+        header.mBrokerPID = os.getpid()
+        header.mRunning = 1
+        header.mMagic = BROKER_MAGIC
+        self._sync.start(access_mode, rf2_pid)
+        self._event.clear()
+        self._update_thread = threading.Thread(target=self.__update, daemon=True)
+        self._update_thread.start()
+        logger.info("broker: UPDATING: publishing to %s", self._name)
+
+    def stop(self) -> None:
+        """Stop publishing, close broker segment"""
+        if not self._updating:
+            logger.warning("broker: UPDATING: already stopped")
+            return
+        self._event.set()
+        self._update_thread.join()
+        self._sync.stop()
+        self._data.mHeader.mRunning = 0
+        self._data = None
+        try:
+            self._mmap_buffer.close()
+        except BufferError:
+            logger.error("broker: buffer error while closing %s", self._name)
+        self._updating = False
+        logger.info("broker: UPDATING: stopped")
+
+    def __update(self) -> None:
+        """Publish new snapshot whenever SyncData published one"""
+        _event_is_set = self._event.is_set
+        tele_wait = self._sync.tele_signal.wait
+        last_seq = -1
+        frame = 0
+        while not _event_is_set():
+            frame = tele_wait(frame, 0.05)  # also wake for scoring-only updates
+            for _ in range(MAX_PUBLISH_RETRY):
+                snapshot = self._sync.snapshot
+                if snapshot is None or snapshot.seq == last_seq:
+                    break
+                if self.__publish(snapshot):
+                    last_seq = snapshot.seq
+                    break
+                self.dropped += 1  # retry with latest snapshot
+
+    def __publish(self, snapshot) -> bool:
+        """Write snapshot into next slot (seqlock), then switch active slot
+
+        Returns:
+            False if snapshot slots were recycled while copying (torn frame),
+            slot is left unpublished.
+        """
+        header = self._data.mHeader
+        index = (header.mActiveSlot + 1) % BROKER_SLOTS
+        slot = self._data.mSlots[index]
+        num_vehicles = self._num_vehicles[index]
+        slot.mVersionUpdateBegin += 1
+        slot.mSnapshotSeq = snapshot.seq
+        slot.mScoringVersion = snapshot.scor_version
+        slot.mTelemetryVersion = snapshot.tele_version
+        ctypes.memmove(
+            ctypes.addressof(slot.mTeleIndexes),
+            snapshot.tele_indexes.lookup.buffer_info()[0],
+            ctypes.sizeof(slot.mTeleIndexes),
+        )
+        num_vehicles[0] = copy_vehicles_data(slot.mScoring, snapshot.scor, SCOR_LAYOUT, num_vehicles[0])
+        num_vehicles[1] = copy_vehicles_data(slot.mTelemetry, snapshot.tele, TELE_LAYOUT, num_vehicles[1])
+        ctypes.memmove(
+            ctypes.addressof(slot.mExtended),
+            ctypes.addressof(snapshot.ext),
+            ctypes.sizeof(slot.mExtended),
+        )
+        if not snapshot.is_valid():
+            return False
+        slot.mVersionUpdateEnd = slot.mVersionUpdateBegin
+        header.mActiveSlot = index
+        header.mPublishCount += 1
+        return True
+
+
+class BrokerFrame(NamedTuple):
+    """Broker snapshot frame (zero copy view of broker slot)
+
+    Frame data is valid until slot is recycled by broker,
+    check is_valid() after reading to detect torn read.
+    """
+
+    seq: int
+    scor: rF2data.rF2Scoring
+    tele: rF2data.rF2Telemetry
+    ext: rF2data.rF2Extended
+    tele_indexes: ctypes.Array
+    slot: BrokerSlot
+    slot_version: int
+
+    def sync_tele_index(self, scor_idx: int) -> int:
+        """Sync telemetry index with scoring index in same frame"""
+        mid = self.scor.mVehicles[scor_idx].mID
+        if 0 <= mid < MAX_IDS:
+            return self.tele_indexes[mid]
+        return INVALID_INDEX
+
+    def is_valid(self) -> bool:
+        """Check whether frame slot is not rewritten since acquired"""
+        return self.slot.mVersionUpdateBegin == self.slot_version
+
+
+class BrokerClient:
+    """Broker client, attach to broker segment with zero copy"""
+
+    __slots__ = (
+        "_name",
+        "_mmap_buffer",
+        "_data",
+    )
+
+    def __init__(self, name: str = BROKER_FILE_NAME) -> None:
+        """Initialize broker client
+
+        Args:
+            name: broker segment name.
+        """
+        self._name = name
+        self._mmap_buffer = None
+        self._data = None
+
+    def open(self) -> None:
+        """Attach to broker segment"""
+        self._mmap_buffer = platform_mmap(self._name, ctypes.sizeof(BrokerData), "")
+        self._data = BrokerData.from_buffer(self._mmap_buffer)
+
+    def close(self) -> None:
+        """Detach from broker segment, release all frames before closing"""
+        self._data = None
+        try:
+            self._mmap_buffer.close()
+        except BufferError:
+            logger.error("broker: buffer error while closing %s", self._name)
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether broker is running with matching layout"""
+        header = self._data.mHeader
+        return (
+            header.mMagic == BROKER_MAGIC
+            and header.mLayoutVersion == BROKER_LAYOUT_VERSION
+            and header.mRunning == 1
+        )
+
+    @property
+    def publish_count(self) -> int:
+        """Total published snapshots"""
+        return self._data.mHeader.mPublishCount
+
+    def acquire(self) -> BrokerFrame | None:
+        """Acquire latest completely written frame
+
+        Returns:
+            Frame view, or None if broker not ready or no completed frame.
+        """
+        if not self.is_ready:
+            return None
+        header = self._data.mHeader
+        for _ in range(BROKER_SLOTS):
+            slot = self._data.mSlots[header.mActiveSlot % BROKER_SLOTS]
+            slot_version = slot.mVersionUpdateEnd
+            if slot_version and slot_version == slot.mVersionUpdateBegin:
+                return BrokerFrame(
+                    seq=slot.mSnapshotSeq,
+                    scor=slot.mScoring,
+                    tele=slot.mTelemetry,
+                    ext=slot.mExtended,
+                    tele_indexes=slot.mTeleIndexes,
+                    slot=slot,
+                    slot_version=slot_version,
+                )
+        return None
+
+
+def run_broker():
+    """Run broker until interrupted"""
+    test_handler = logging.StreamHandler()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(test_handler)
+
+    broker = SharedMemoryBroker()
+    broker.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    broker.stop()
+
+
+if __name__ == "__main__":
+    run_broker()
@@ -0,0 +1,244 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 access mode calibration
+
+Measure copy access & direct access on current machine & field size,
+and select access mode from measured cost & consistency:
+    copy time: time spent copying buffer per update (copy access only).
+    torn read: update or consumer read overlapped with game writing buffer.
+    consumer latency: time from new data version detected to consumer read done.
+"""
+
+from __future__ import annotations
+
+import logging
+from statistics import median
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, NamedTuple
+
+if __name__ == "__main__":  # local import check
+    import sys
+    sys.path.append(".")
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+else:  # run time only
+    from pyRfactor2SharedMemory import rF2data
+
+from pyRfactor2SharedMemory.rF2MMap import MAX_VEHICLES, MMapControl, rFactor2Constants
+
+logger = logging.getLogger(__name__)
+
+COPY_ACCESS = 0
+DIRECT_ACCESS = 1
+POLL_INTERVAL = 0.001  # seconds between version checks while sampling
+MIN_SAMPLES = 10  # min number of new data versions per mode for valid result
+
+
+class ModeStats(NamedTuple):
+    """Access mode measurement"""
+
+    mode: int  # 0 = copy access, 1 = direct access
+    samples: int  # number of new data versions measured
+    num_vehicles: int  # field size while measuring
+    copy_time: float  # median buffer copy time per update (seconds)
+    latency: float  # median consumer latency (seconds)
+    latency_max: float  # max consumer latency (seconds)
+    torn_rate: float  # torn reads per sample
+    retry_rate: float  # copy retries per sample (copy access only)
+    failed: int  # updates without consistent copy, not counted as samples (copy access only)
+
+    def __str__(self) -> str:
+        name = "direct" if self.mode else "copy"
+        return (
+            f"{name}: {self.samples} samples, {self.num_vehicles} vehicles, "
+            f"copy {self.copy_time * 1e6:.1f}us, "
+            f"latency {self.latency * 1e6:.1f}us (max {self.latency_max * 1e6:.1f}us), "
+            f"torn {self.torn_rate:.2%}, retry {self.retry_rate:.2%}, failed {self.failed}"
+        )
+
+
+class CalibrationResult(NamedTuple):
+    """Access mode calibration result"""
+
+    mode: int  # selected access mode, 0 = copy access, 1 = direct access
+    reason: str
+    copy: ModeStats | None
+    direct: ModeStats | None
+
+    @property
+    def is_valid(self) -> bool:
+        """Check whether both modes were measured with enough samples"""
+        return (
+            self.copy is not None and self.copy.samples >= MIN_SAMPLES
+            and self.direct is not None and self.direct.samples >= MIN_SAMPLES
+        )
+
+
+def consumer_read(vehicles, num_vehicles: int) -> float:
+    """Typical consumer read, touch per-vehicle fields read by widgets"""
+    total = 0.0
+    for index in range(num_vehicles):
+        veh = vehicles[index]
+        pos = veh.mPos
+        total += veh.mElapsedTime + pos.x + pos.z + veh.mLocalVel.z + veh.mEngineRPM + veh.mFuel
+    return total
+
+
+def measure_mode(
+    mode: int, duration: float, rf2_pid: str = "",
+    mmap_name: str = rFactor2Constants.MM_TELEMETRY_FILE_NAME,
+    data_struct: type = rF2data.rF2Telemetry,
+) -> ModeStats:
+    """Measure access mode on live telemetry buffer
+
+    Args:
+        mode: 0 = copy access, 1 = direct access.
+        duration: measuring duration (seconds).
+        rf2_pid: rF2 Process ID for accessing server data.
+        mmap_name: mmap filename.
+        data_struct: ctypes data structure, must contain mVehicles array.
+
+    Returns:
+        Mode measurement.
+    """
+    control = MMapControl(mmap_name, data_struct)
+    control.create(mode, rf2_pid)
+    copy_times = []
+    latencies = []
+    torn = 0
+    failed = 0
+    last_version = control.version
+    num_vehicles = 0
+    data = None
+    try:
+        end_time = perf_counter() + duration
+        while perf_counter() < end_time:
+            version = control.version
+            if version == last_version:
+                sleep(POLL_INTERVAL)
+                continue
+            last_version = version
+            detect_time = perf_counter()
+            if not control.update():  # no consistent copy, data unchanged
+                failed += 1
+                continue
+            copy_time = perf_counter() - detect_time
+            data = control.data
+            if mode:  # direct access, verify consumer read against writer
+                begin = data.mVersionUpdateBegin
+                num_vehicles = min(max(data.mNumVehicles, 0), MAX_VEHICLES)
+                consumer_read(data.mVehicles, num_vehicles)
+                if not begin == data.mVersionUpdateBegin == data.mVersionUpdateEnd:
+                    torn += 1
+            else:
+                num_vehicles = min(max(data.mNumVehicles, 0), MAX_VEHICLES)
+                consumer_read(data.mVehicles, num_vehicles)
+            latencies.append(perf_counter() - detect_time)
+            copy_times.append(copy_time)
+        if not mode:
+            torn = control.torn_reads
+        retries = control.retries if not mode else 0
+    finally:
+        data = None
+        control.close()
+
+    samples = len(latencies)
+    if not samples:
+        return ModeStats(mode, 0, num_vehicles, 0.0, 0.0, 0.0, 0.0, 0.0, failed)
+    return ModeStats(
+        mode=mode,
+        samples=samples,
+        num_vehicles=num_vehicles,
+        copy_time=median(copy_times) if not mode else 0.0,
+        latency=median(latencies),
+        latency_max=max(latencies),
+        torn_rate=torn / samples,
+        retry_rate=retries / samples,
+        failed=failed,
+    )
+
+
+def select_mode(
+    copy: ModeStats, direct: ModeStats, copy_budget: float, max_torn_rate: float
+) -> tuple[int, str]:
+    """Select access mode from measurements
+
+    Copy access is preferred for consistent data while copy cost is within budget,
+    direct access is selected only if copy cost exceeds budget
+    and direct consumer reads rarely overlap with game writing buffer.
+
+    Returns:
+        Access mode & reason.
+    """
+    if copy.samples < MIN_SAMPLES or direct.samples < MIN_SAMPLES:
+        return COPY_ACCESS, "not enough samples, game not updating data"
+    if copy.copy_time <= copy_budget:
+        return COPY_ACCESS, f"copy time within budget ({copy_budget * 1e6:.0f}us)"
+    if direct.torn_rate > max_torn_rate:
+        return COPY_ACCESS, f"direct torn rate above limit ({max_torn_rate:.2%})"
+    return DIRECT_ACCESS, f"copy time over budget ({copy_budget * 1e6:.0f}us)"
+
+
+def calibrate(
+    duration: float = 2.0, rf2_pid: str = "",
+    copy_budget: float = 0.0005, max_torn_rate: float = 0.01,
+) -> CalibrationResult:
+    """Calibrate access mode, measure both modes on live telemetry buffer
+
+    Game must be running & updating data while calibrating,
+    otherwise copy access is selected.
+
+    Args:
+        duration: total measuring duration (seconds), split between both modes.
+        rf2_pid: rF2 Process ID for accessing server data.
+        copy_budget: max acceptable median copy time per update (seconds).
+        max_torn_rate: max acceptable direct access torn reads per update.
+
+    Returns:
+        Calibration result.
+    """
+    copy = measure_mode(COPY_ACCESS, duration * 0.5, rf2_pid)
+    direct = measure_mode(DIRECT_ACCESS, duration * 0.5, rf2_pid)
+    mode, reason = select_mode(copy, direct, copy_budget, max_torn_rate)
+    logger.info("sharedmemory: CALIBRATE: %s", copy)
+    logger.info("sharedmemory: CALIBRATE: %s", direct)
+    logger.info(
+        "sharedmemory: CALIBRATE: %s access selected, %s",
+        "direct" if mode else "copy", reason,
+    )
+    return CalibrationResult(mode, reason, copy, direct)
+
+
+def run_calibrate():
+    """Access mode calibration run"""
+    # Add logger
+    test_handler = logging.StreamHandler()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(test_handler)
+
+    result = calibrate()
+    print(f"copy  : {result.copy}")
+    print(f"direct: {result.direct}")
+    print(f"select: {'direct' if result.mode else 'copy'} access ({result.reason})")
+
+
+if __name__ == "__main__":
+    run_calibrate()
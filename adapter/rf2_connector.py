@@ -22,11 +22,15 @@ rF2 API connector
 
 from __future__ import annotations
 
+import asyncio
 import ctypes
 import logging
+import struct
 import threading
+from array import array
+from functools import lru_cache
 from time import monotonic, sleep
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, NamedTuple, Sequence
 
 if __name__ == "__main__":  # local import check
     import sys
@@ -39,12 +43,28 @@ else:  # run time only
 
 from pyRfactor2SharedMemory.rF2MMap import (
     INVALID_INDEX,
+    MAX_COPY_RETRY,
     MAX_VEHICLES,
     MMapControl,
     rFactor2Constants,
+    vehicles_layout,
 )
 
 logger = logging.getLogger(__name__)
+MAX_IDS = rFactor2Constants.MAX_MAPPED_IDS
+TELE_HEADER_SIZE, TELE_VEHICLE_SIZE, _ = vehicles_layout(rF2data.rF2Telemetry)
+SCOR_HEADER_SIZE, SCOR_VEHICLE_SIZE, _ = vehicles_layout(rF2data.rF2Scoring)
+# Per-vehicle motion fields for change tracking, (offset, struct format) sorted by offset
+SCOR_STATE_FIELDS = (
+    (rF2data.rF2VehicleScoring.mID.offset, "i"),
+    (rF2data.rF2VehicleScoring.mTotalLaps.offset, "h"),
+    (rF2data.rF2VehicleScoring.mLapDist.offset, "d"),
+    (rF2data.rF2VehicleScoring.mInPits.offset, "B"),
+)
+TELE_STATE_FIELDS = (
+    (rF2data.rF2VehicleTelemetry.mPos.offset, "3d"),
+    (rF2data.rF2VehicleTelemetry.mLocalVel.offset, "3d"),
+)
 
 
 def copy_struct(struct_data):
@@ -69,21 +89,188 @@ def local_scoring_index(scor_veh: Sequence[rF2data.rF2VehicleScoring]) -> int:
     return INVALID_INDEX
 
 
+class TeleIndexes(NamedTuple):
+    """Telemetry mID to index lookup, not modified once published
+
+    Attributes:
+        ids: telemetry mID of each valid vehicle, also used as fingerprint.
+        lookup: telemetry index array indexed by mID (0 to MAX_IDS - 1),
+            for batch reading without dict hashing.
+        extra: telemetry index dictionary for mID out of lookup range.
+    """
+
+    ids: tuple[int, ...]
+    lookup: array
+    extra: dict
+
+    def get(self, mid: int) -> int:
+        """Get telemetry index from mID, INVALID_INDEX if not found"""
+        if 0 <= mid < MAX_IDS:
+            return self.lookup[mid]
+        return self.extra.get(mid, INVALID_INDEX)
+
+
+@lru_cache(maxsize=MAX_VEHICLES + 1)
+def tele_ids_struct(num_vehicles: int) -> struct.Struct:
+    """Struct for unpacking mID of all valid telemetry vehicles in single call"""
+    return struct.Struct("<" + f"i{TELE_VEHICLE_SIZE - 4}x" * num_vehicles)
+
+
+def tele_ids(tele_data: rF2data.rF2Telemetry) -> tuple[int, ...]:
+    """Get mID of all valid telemetry vehicles (cheap fingerprint)"""
+    num_vehicles = min(max(tele_data.mNumVehicles, 0), MAX_VEHICLES)
+    return tele_ids_struct(num_vehicles).unpack_from(tele_data, TELE_HEADER_SIZE)
+
+
+def vehicle_fields_format(vehicle_size: int, fields: tuple[tuple[int, str], ...]) -> str:
+    """Struct format of selected fields of one vehicle, other bytes skipped"""
+    output = ""
+    pos = 0
+    for offset, field_format in fields:
+        output += f"{offset - pos}x{field_format}"
+        pos = offset + struct.calcsize("<" + field_format)
+    return output + f"{vehicle_size - pos}x"
+
+
+SCOR_STATE_FORMAT = vehicle_fields_format(SCOR_VEHICLE_SIZE, SCOR_STATE_FIELDS)
+TELE_STATE_FORMAT = vehicle_fields_format(TELE_VEHICLE_SIZE, TELE_STATE_FIELDS)
+SCOR_STATE_SIZE = len(struct.Struct("<" + SCOR_STATE_FORMAT).unpack(bytes(SCOR_VEHICLE_SIZE)))
+TELE_STATE_SIZE = len(struct.Struct("<" + TELE_STATE_FORMAT).unpack(bytes(TELE_VEHICLE_SIZE)))
+TELE_STATE_EMPTY = (0.0,) * TELE_STATE_SIZE
+
+
+@lru_cache(maxsize=MAX_VEHICLES + 1)
+def scor_states_struct(num_vehicles: int) -> struct.Struct:
+    """Struct for unpacking motion fields of all valid scoring vehicles in single call"""
+    return struct.Struct("<" + SCOR_STATE_FORMAT * num_vehicles)
+
+
+@lru_cache(maxsize=MAX_VEHICLES + 1)
+def tele_states_struct(num_vehicles: int) -> struct.Struct:
+    """Struct for unpacking motion fields of all valid telemetry vehicles in single call"""
+    return struct.Struct("<" + TELE_STATE_FORMAT * num_vehicles)
+
+
+def vehicle_states(
+    scor_data: rF2data.rF2Scoring, tele_data: rF2data.rF2Telemetry,
+    tele_indexes: TeleIndexes) -> list[tuple]:
+    """Get motion state of each valid scoring vehicle
+
+    State: scoring mID, mTotalLaps, mLapDist, mInPits,
+    then telemetry mPos & mLocalVel (zero if no matching telemetry).
+    Time fields are excluded, as they advance for every vehicle on every update.
+    """
+    num_scor = min(max(scor_data.mScoringInfo.mNumVehicles, 0), MAX_VEHICLES)
+    num_tele = min(max(tele_data.mNumVehicles, 0), MAX_VEHICLES)
+    scor_states = scor_states_struct(num_scor).unpack_from(scor_data, SCOR_HEADER_SIZE)
+    tele_states = tele_states_struct(num_tele).unpack_from(tele_data, TELE_HEADER_SIZE)
+    get_index = tele_indexes.get
+    states = []
+    for scor_pos in range(0, len(scor_states), SCOR_STATE_SIZE):
+        state = scor_states[scor_pos:scor_pos + SCOR_STATE_SIZE]
+        tele_idx = get_index(state[0])
+        if 0 <= tele_idx < num_tele:
+            tele_pos = tele_idx * TELE_STATE_SIZE
+            state += tele_states[tele_pos:tele_pos + TELE_STATE_SIZE]
+        else:
+            state += TELE_STATE_EMPTY
+        states.append(state)
+    return states
+
+
+def create_tele_indexes(ids: tuple[int, ...]) -> TeleIndexes:
+    """Create telemetry mID to index lookup"""
+    lookup = array("h", (INVALID_INDEX,)) * MAX_IDS
+    extra = {}
+    for tele_idx, mid in enumerate(ids):
+        if 0 <= mid < MAX_IDS:
+            lookup[mid] = tele_idx
+        else:
+            extra[mid] = tele_idx
+    return TeleIndexes(ids, lookup, extra)
+
+
+class BufferSpec(NamedTuple):
+    """Optional buffer spec"""
+
+    mmap_name: str
+    data_struct: type
+    subscribed_buffer: str  # SubscribedBuffer member name, see mUnsubscribedBuffersMask
+    access_mode: int  # default copy policy, 0 = copy access, 1 = direct access
+
+
+OPTIONAL_BUFFERS = {
+    "ffb": BufferSpec(
+        rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME,
+        rF2data.rF2ForceFeedback,
+        "ForceFeedback",
+        1,
+    ),
+    "rules": BufferSpec(
+        rFactor2Constants.MM_RULES_FILE_NAME,
+        rF2data.rF2Rules,
+        "Rules",
+        0,
+    ),
+    "pitinfo": BufferSpec(
+        rFactor2Constants.MM_PITINFO_FILE_NAME,
+        rF2data.rF2PitInfo,
+        "PitInfo",
+        0,
+    ),
+    "weather": BufferSpec(
+        rFactor2Constants.MM_WEATHER_FILE_NAME,
+        rF2data.rF2Weather,
+        "Weather",
+        0,
+    ),
+    "graphics": BufferSpec(
+        rFactor2Constants.MM_GRAPHICS_FILE_NAME,
+        rF2data.rF2Graphics,
+        "Graphics",
+        1,
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def subscribed_buffer_flag(name: str) -> int:
+    """Optional buffer SubscribedBuffer flag, enum is resolved on first use (lazy import)"""
+    return rF2data.SubscribedBuffer[OPTIONAL_BUFFERS[name].subscribed_buffer].value
+
+
 class MMapDataSet:
-    """Create mmap data set"""
+    """Create mmap data set
+
+    Scoring, telemetry & extended buffers are always mapped.
+    Optional buffers (see OPTIONAL_BUFFERS) are mapped lazily on subscription
+    or first access, and only while plugin publishes them (mUnsubscribedBuffersMask).
+    Optional buffer map, unmap & update are guarded by lock,
+    as subscription may change from other threads while SyncData is updating.
+    """
 
     __slots__ = (
         "scor",
         "tele",
         "ext",
-        "ffb",
+        "_lock",
+        "_optional",
+        "_optional_modes",
+        "_mapped",
+        "_active",
+        "_rf2_pid",
     )
 
     def __init__(self) -> None:
         self.scor = MMapControl(rFactor2Constants.MM_SCORING_FILE_NAME, rF2data.rF2Scoring)
         self.tele = MMapControl(rFactor2Constants.MM_TELEMETRY_FILE_NAME, rF2data.rF2Telemetry)
         self.ext = MMapControl(rFactor2Constants.MM_EXTENDED_FILE_NAME, rF2data.rF2Extended)
-        self.ffb = MMapControl(rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME, rF2data.rF2ForceFeedback)
+        self._lock = threading.Lock()
+        self._optional: dict[str, MMapControl] = {}
+        self._optional_modes: dict[str, int] = {}
+        self._mapped: set[str] = set()
+        self._active = False
+        self._rf2_pid = ""
 
     def __del__(self):
         logger.info("sharedmemory: GC: MMapDataSet")
@@ -98,20 +285,438 @@ class MMapDataSet:
         self.scor.create(access_mode, rf2_pid)
         self.tele.create(access_mode, rf2_pid)
         self.ext.create(1, rf2_pid)
-        self.ffb.create(1, rf2_pid)
+        with self._lock:
+            self._rf2_pid = rf2_pid
+            self._active = True
+            for name in self._optional:
+                self.__map_optional(name)
 
     def close_mmap(self) -> None:
         """Close mmap instance"""
+        with self._lock:
+            self._active = False
+            for name in self._mapped:
+                self._optional[name].close()
+            self._mapped.clear()
         self.scor.close()
         self.tele.close()
         self.ext.close()
-        self.ffb.close()
 
     def update_mmap(self) -> None:
         """Update mmap data"""
         self.scor.update()
         self.tele.update()
 
+    def subscribe(self, name: str, access_mode: int | None = None) -> MMapControl:
+        """Subscribe optional buffer, map now if active & published by plugin
+
+        Args:
+            name: optional buffer name, see OPTIONAL_BUFFERS.
+            access_mode: 0 = copy access, 1 = direct access, None for buffer default.
+
+        Returns:
+            Buffer mmap instance, data is None until mapped.
+        """
+        with self._lock:
+            control = self._optional.get(name)
+            if control is None:
+                spec = OPTIONAL_BUFFERS[name]
+                control = MMapControl(spec.mmap_name, spec.data_struct)
+                self._optional_modes[name] = spec.access_mode if access_mode is None else access_mode
+                self._optional[name] = control
+                if self._active:
+                    self.__map_optional(name)
+            return control
+
+    def unsubscribe(self, name: str) -> None:
+        """Unsubscribe & unmap optional buffer"""
+        with self._lock:
+            control = self._optional.pop(name, None)
+            self._optional_modes.pop(name, None)
+            if control is not None and name in self._mapped:
+                self._mapped.discard(name)
+                control.close()
+
+    def optional(self, name: str) -> MMapControl:
+        """Get optional buffer, subscribe on first access"""
+        control = self._optional.get(name)
+        if control is None:
+            return self.subscribe(name)
+        return control
+
+    def is_published(self, name: str) -> bool:
+        """Check whether plugin publishes optional buffer (not in mUnsubscribedBuffersMask)"""
+        if self.ext.data is None:
+            return False
+        return not self.ext.data.mUnsubscribedBuffersMask & subscribed_buffer_flag(name)
+
+    def update_optional(self) -> None:
+        """Update mapped optional buffers, map pending subscriptions if published"""
+        with self._lock:
+            for name, control in self._optional.items():
+                if name in self._mapped:
+                    control.update()
+                else:
+                    self.__map_optional(name)
+
+    def __map_optional(self, name: str) -> bool:
+        """Map optional buffer if published by plugin, lock must be held"""
+        if name in self._mapped or not self.is_published(name):
+            return False
+        self._optional[name].create(self._optional_modes[name], self._rf2_pid)
+        self._mapped.add(name)
+        return True
+
+
+def copy_vehicles_data(
+    target: ctypes.Structure, source: ctypes.Structure,
+    layout: tuple[int, int, int], last_num_vehicles: int) -> int:
+    """Copy header plus valid vehicles from source to target data
+
+    Args:
+        target: target ctypes data.
+        source: source ctypes data of same type.
+        layout: vehicles layout of data type, see vehicles_layout().
+        last_num_vehicles: number of vehicles last copied into target,
+            vehicles left from last copy are also overwritten.
+
+    Returns:
+        Number of valid vehicles copied.
+    """
+    header_size, vehicle_size, num_vehicles_offset = layout
+    if header_size < 0:  # no vehicles array, copy all
+        ctypes.memmove(ctypes.addressof(target), ctypes.addressof(source), ctypes.sizeof(target))
+        return 0
+    num_vehicles = ctypes.c_int.from_address(ctypes.addressof(source) + num_vehicles_offset).value
+    num_vehicles = min(max(num_vehicles, 0), MAX_VEHICLES)
+    copy_size = header_size + vehicle_size * max(num_vehicles, last_num_vehicles)
+    ctypes.memmove(ctypes.addressof(target), ctypes.addressof(source), copy_size)
+    return num_vehicles
+
+
+class BufferRing:
+    """Ring of preallocated data copies for snapshot publishing
+
+    Each publish copies source data (header plus valid vehicles) into next slot,
+    slot is recycled after ring size publishes.
+    In tiered mode, only header plus focus vehicle is copied
+    if slot already holds same field version.
+
+    Attributes:
+        torn_reads: number of copies discarded due to source changed while copying.
+    """
+
+    __slots__ = (
+        "_slots",
+        "_generations",
+        "_num_vehicles",
+        "_field_versions",
+        "_index",
+        "_layout",
+        "torn_reads",
+    )
+
+    def __init__(self, data_struct: type, size: int = 3) -> None:
+        """Initialize buffer ring
+
+        Args:
+            data_struct: ctypes data structure, ex. rF2data.rF2Scoring.
+            size: number of slots, minimum 2 (double buffering).
+        """
+        size = max(size, 2)
+        self._slots = tuple(data_struct() for _ in range(size))
+        self._generations = [0] * size
+        self._num_vehicles = [MAX_VEHICLES] * size
+        self._field_versions = [None] * size
+        self._index = 0
+        self._layout = vehicles_layout(data_struct)
+        self.torn_reads = 0
+
+    def publish(
+        self, source: ctypes.Structure, field_version: int | None = None,
+        focus_index: int = INVALID_INDEX) -> tuple[ctypes.Structure, int, int] | None:
+        """Copy source data into next slot
+
+        Seqlock read: copy only if source is not being written,
+        then verify version again after copy, retry if source changed while copying
+        (source is live shared memory in direct access mode).
+
+        Args:
+            source: source ctypes data (local copy or shared memory).
+            field_version: source full copy version (tiered mode), None to always copy all.
+            focus_index: vehicle index refreshed on every publish in tiered mode.
+
+        Returns:
+            Slot data, slot index, slot generation. None if all copy attempts failed.
+        """
+        index = self._index = (self._index + 1) % len(self._slots)
+        target = self._slots[index]
+        self._generations[index] += 1
+        for _ in range(MAX_COPY_RETRY):
+            version_begin = source.mVersionUpdateBegin
+            if version_begin != source.mVersionUpdateEnd:  # writing in progress
+                continue
+            self.__copy(target, source, index, field_version, focus_index)
+            if version_begin == source.mVersionUpdateBegin == source.mVersionUpdateEnd:
+                return target, index, self._generations[index]
+            self.torn_reads += 1
+            self._num_vehicles[index] = MAX_VEHICLES  # full resync on next attempt
+            self._field_versions[index] = None
+        return None
+
+    def __copy(
+        self, target: ctypes.Structure, source: ctypes.Structure, index: int,
+        field_version: int | None, focus_index: int) -> None:
+        """Copy source data into slot, header plus focus vehicle if slot holds same field version"""
+        if (field_version is not None and focus_index >= 0
+                and self._field_versions[index] == field_version):
+            header_size, vehicle_size, _ = self._layout
+            target_address = ctypes.addressof(target)
+            source_address = ctypes.addressof(source)
+            offset = header_size + vehicle_size * focus_index
+            ctypes.memmove(target_address, source_address, header_size)
+            ctypes.memmove(target_address + offset, source_address + offset, vehicle_size)
+        else:
+            self._num_vehicles[index] = copy_vehicles_data(
+                target, source, self._layout, self._num_vehicles[index])
+            self._field_versions[index] = field_version
+
+    def is_valid(self, index: int, generation: int) -> bool:
+        """Check whether slot is not yet recycled"""
+        return self._generations[index] == generation
+
+
+class Snapshot(NamedTuple):
+    """Paired scoring, telemetry & extended snapshot
+
+    Published by atomic reference swap, data is not modified while slot is valid.
+    Slots are recycled after ring size updates of each buffer,
+    use is_valid() to check if snapshot is held for long period.
+    """
+
+    seq: int
+    scor_version: int
+    tele_version: int
+    scor: rF2data.rF2Scoring
+    tele: rF2data.rF2Telemetry
+    ext: rF2data.rF2Extended
+    tele_indexes: TeleIndexes
+    scor_slot: tuple[BufferRing, int, int]
+    tele_slot: tuple[BufferRing, int, int]
+    ext_slot: tuple[BufferRing, int, int]
+
+    def sync_tele_index(self, scor_idx: int) -> int:
+        """Sync telemetry index with scoring index in same snapshot"""
+        return self.tele_indexes.get(self.scor.mVehicles[scor_idx].mID)
+
+    def is_valid(self) -> bool:
+        """Check whether snapshot data is not yet recycled"""
+        scor_ring, scor_index, scor_gen = self.scor_slot
+        tele_ring, tele_index, tele_gen = self.tele_slot
+        ext_ring, ext_index, ext_gen = self.ext_slot
+        return (
+            scor_ring.is_valid(scor_index, scor_gen)
+            and tele_ring.is_valid(tele_index, tele_gen)
+            and ext_ring.is_valid(ext_index, ext_gen)
+        )
+
+
+class FrameSignal:
+    """New data frame signal
+
+    Notify subscribed consumers when new data version committed,
+    so consumers can block until fresh data exists instead of polling.
+    Thread consumers call wait(), asyncio consumers await wait_async().
+
+    Example:
+        frame = 0
+        while running:
+            frame = signal.wait(frame, timeout=0.5)
+    """
+
+    __slots__ = (
+        "_cond",
+        "_frame",
+        "_async_waiters",
+    )
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._frame = 0
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def frame(self) -> int:
+        """Current frame number"""
+        return self._frame
+
+    def notify(self) -> None:
+        """Notify all waiting consumers with new frame number"""
+        with self._cond:
+            self._frame += 1
+            frame = self._frame
+            async_waiters = self._async_waiters
+            self._async_waiters = []
+            self._cond.notify_all()
+        for loop, future in async_waiters:
+            try:
+                loop.call_soon_threadsafe(set_future_result, future, frame)
+            except RuntimeError:  # event loop closed
+                pass
+
+    def wait(self, last_frame: int, timeout: float | None = None) -> int:
+        """Block until frame number changed from last frame, or timeout
+
+        Args:
+            last_frame: last frame number seen by consumer.
+            timeout: max waiting time (seconds), None for no timeout.
+
+        Returns:
+            Current frame number, same as last frame if timeout.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._frame != last_frame, timeout)
+            return self._frame
+
+    async def wait_async(self, last_frame: int, timeout: float | None = None) -> int:
+        """Await until frame number changed from last frame, or timeout
+
+        Args:
+            last_frame: last frame number seen by consumer.
+            timeout: max waiting time (seconds), None for no timeout.
+
+        Returns:
+            Current frame number, same as last frame if timeout.
+        """
+        with self._cond:
+            if self._frame != last_frame:
+                return self._frame
+            future = asyncio.get_running_loop().create_future()
+            waiter = (future.get_loop(), future)
+            self._async_waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return self._frame
+        finally:
+            with self._cond:  # remove waiter if not notified (timeout, cancelled)
+                if waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+
+
+def set_future_result(future: asyncio.Future, result: int) -> None:
+    """Set future result if not done (cancelled by timeout)"""
+    if not future.done():
+        future.set_result(result)
+
+
+class UpdateStats(NamedTuple):
+    """Buffer update statistics"""
+
+    name: str
+    update_rate: float  # observed producer update rate (Hz)
+    poll_interval: float  # current poll interval (seconds)
+    updates: int  # total polls found new data version
+    idle_polls: int  # total polls found no new data version
+
+
+class UpdateCadence:
+    """Adaptive update cadence for single mmap buffer
+
+    Poll buffer version independently, schedule next poll
+    right after next expected producer update (locked onto observed update rate),
+    and back off exponentially while no new data version found.
+    """
+
+    __slots__ = (
+        "_mmap",
+        "_min_interval",
+        "_max_interval",
+        "_period",
+        "_last_version",
+        "_last_update_time",
+        "_idle_interval",
+        "interval",
+        "next_poll",
+        "updates",
+        "idle_polls",
+    )
+
+    def __init__(self, mmap_control: MMapControl, min_interval: float = 0.002, max_interval: float = 0.1) -> None:
+        """Initialize update cadence
+
+        Args:
+            mmap_control: mmap control instance.
+            min_interval: minimum poll interval (seconds).
+            max_interval: maximum poll interval (seconds).
+        """
+        self._mmap = mmap_control
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset cadence & statistics"""
+        self._period = self._max_interval
+        self._last_version = None
+        self._last_update_time = 0.0
+        self._idle_interval = self._min_interval
+        self.interval = self._min_interval
+        self.next_poll = 0.0
+        self.updates = 0
+        self.idle_polls = 0
+
+    def poll(self, now: float, force: bool = False) -> bool:
+        """Poll buffer, update if new data version found
+
+        Args:
+            now: current monotonic time.
+            force: poll regardless of schedule.
+
+        Returns:
+            True if buffer updated.
+        """
+        if not force and now < self.next_poll:
+            return False
+        version = self._mmap.version
+        if version is None:  # closed
+            return False
+        if self._last_version == version:  # no new data
+            self.idle_polls += 1
+            self.interval = self._idle_interval
+            self.next_poll = now + self.interval
+            self._idle_interval = min(self._idle_interval * 2, self._max_interval)
+            return False
+        if not self._mmap.update():  # buffer kept being written, retry soon
+            self.interval = self._min_interval
+            self.next_poll = now + self.interval
+            return False
+        version = self._mmap.copied_version  # version of data actually copied
+        self.updates += 1
+        # Lock onto producer update period (moving average),
+        # divide by version steps in case of missed versions between polls
+        if self._last_version is not None:
+            elapsed = now - self._last_update_time
+            steps = (version - self._last_version) & 0xFFFFFFFF
+            if elapsed < 1 and steps:  # ignore gap after pause
+                self._period += (elapsed / steps - self._period) * 0.2
+        self._last_version = version
+        self._last_update_time = now
+        self._idle_interval = self._min_interval
+        self.interval = min(max(self._period * 0.9, self._min_interval), self._max_interval)
+        self.next_poll = now + self.interval
+        return True
+
+    def stats(self, name: str) -> UpdateStats:
+        """Update statistics"""
+        return UpdateStats(
+            name=name,
+            update_rate=round(1 / self._period, 2) if self._period > 0 else 0.0,
+            poll_interval=round(self.interval, 4),
+            updates=self.updates,
+            idle_polls=self.idle_polls,
+        )
+
 
 class SyncData:
     """Synchronize data with player ID
@@ -123,6 +728,9 @@ class SyncData:
         player_scor_index: Local player scoring index.
         player_scor: Local player scoring data.
         player_tele: Local player telemetry data.
+        snapshot: Latest paired scoring & telemetry snapshot.
+        scor_signal: New scoring frame signal.
+        tele_signal: New telemetry frame signal.
     """
 
     __slots__ = (
@@ -130,19 +738,31 @@ class SyncData:
         "_update_thread",
         "_event",
         "_tele_indexes",
+        "_scor_cadence",
+        "_tele_cadence",
+        "_scor_ring",
+        "_tele_ring",
+        "_ext_ring",
         "paused",
         "override_player_index",
         "player_scor_index",
         "player_scor",
         "player_tele",
         "dataset",
+        "snapshot",
+        "scor_signal",
+        "tele_signal",
+        "recorder",
+        "_vehicle_states",
+        "vehicle_versions",
+        "changed_vehicles",
     )
 
     def __init__(self) -> None:
         self._updating = False
         self._update_thread = None
         self._event = threading.Event()
-        self._tele_indexes = {_index: _index for _index in range(128)}
+        self._tele_indexes = create_tele_indexes(tuple(range(MAX_VEHICLES)))
 
         self.paused = False
         self.override_player_index = False
@@ -150,6 +770,23 @@ class SyncData:
         self.player_scor = None
         self.player_tele = None
         self.dataset = MMapDataSet()
+        # Scoring updates at ~5Hz, telemetry at physics rate
+        self._scor_cadence = UpdateCadence(self.dataset.scor, 0.01, 0.25)
+        self._tele_cadence = UpdateCadence(self.dataset.tele, 0.002, 0.1)
+        # Triple buffered snapshot
+        self._scor_ring = BufferRing(rF2data.rF2Scoring, 3)
+        self._tele_ring = BufferRing(rF2data.rF2Telemetry, 3)
+        self._ext_ring = BufferRing(rF2data.rF2Extended, 3)
+        self.snapshot: Snapshot | None = None
+        # New frame signal, notified after snapshot published
+        self.scor_signal = FrameSignal()
+        self.tele_signal = FrameSignal()
+        # Optional frame recorder, see rf2_recorder.FrameRecorder
+        self.recorder = None
+        # Per-vehicle staleness (by scoring index)
+        self._vehicle_states: list[tuple] = []
+        self.vehicle_versions: list[int] = [0] * MAX_VEHICLES
+        self.changed_vehicles: tuple[bool, ...] = ()
 
     def __del__(self):
         logger.info("sharedmemory: GC: SyncData")
@@ -168,29 +805,42 @@ class SyncData:
                 return False  # index not found, not synced
             self.player_scor_index = scor_idx
         # Set player data
+        tele_idx = self.sync_tele_index(self.player_scor_index)
         self.player_scor = self.dataset.scor.data.mVehicles[self.player_scor_index]
-        self.player_tele = self.dataset.tele.data.mVehicles[self.sync_tele_index(self.player_scor_index)]
+        self.player_tele = self.dataset.tele.data.mVehicles[tele_idx]
+        self.dataset.tele.focus_index = tele_idx  # refreshed on every update in tiered mode
         return True  # found index, synced
 
-    @staticmethod
-    def __update_tele_indexes(tele_data: rF2data.rF2Telemetry, tele_indexes: dict) -> None:
-        """Update telemetry player index dictionary for quick reference
+    def __update_tele_indexes(self, tele_data: rF2data.rF2Telemetry) -> bool:
+        """Update telemetry player index lookup for quick reference
 
         Telemetry index can be different from scoring index.
         Use mID matching to match telemetry index.
+        Rebuild & publish new lookup only if mID fingerprint changed
+        (vehicles joined, left or reordered).
 
         Args:
             tele_data: Telemetry data.
-            tele_indexes: Telemetry mID:index reference dictionary.
+
+        Returns:
+            True if lookup rebuilt.
         """
-        for tele_idx, veh_info in zip(range(tele_data.mNumVehicles), tele_data.mVehicles):
-            tele_indexes[veh_info.mID] = tele_idx
+        ids = tele_ids(tele_data)
+        if ids == self._tele_indexes.ids:
+            return False
+        self._tele_indexes = create_tele_indexes(ids)
+        return True
+
+    @property
+    def tele_indexes(self) -> TeleIndexes:
+        """Telemetry mID to index lookup"""
+        return self._tele_indexes
 
     def sync_tele_index(self, scor_idx: int) -> int:
         """Sync telemetry index
 
         Use scoring index to find scoring mID,
-        then match with telemetry mID in reference dictionary
+        then match with telemetry mID in lookup
         to find telemetry index.
 
         Args:
@@ -199,8 +849,102 @@ class SyncData:
         Returns:
             Player telemetry index.
         """
-        return self._tele_indexes.get(
-            self.dataset.scor.data.mVehicles[scor_idx].mID, INVALID_INDEX)
+        return self._tele_indexes.get(self.dataset.scor.data.mVehicles[scor_idx].mID)
+
+    def __publish_snapshot(self, scor_updated: bool, tele_updated: bool) -> tuple[bool, bool]:
+        """Publish new paired snapshot
+
+        Copy updated buffer into next ring slot, pair with latest slot of other buffer,
+        then swap snapshot reference (atomic) for lock-free reading.
+        Extended data is copied along with scoring.
+        Buffer that failed to copy (kept being written) is paired from last snapshot.
+
+        Returns:
+            Whether scoring & telemetry are published.
+        """
+        last = self.snapshot
+        scor_published = ext_published = tele_published = None
+        if scor_updated or last is None:
+            scor_published = self._scor_ring.publish(self.dataset.scor.data)
+            ext_published = self._ext_ring.publish(self.dataset.ext.data)
+        if tele_updated or last is None:
+            tele_mmap = self.dataset.tele
+            tele_published = self._tele_ring.publish(
+                tele_mmap.data, tele_mmap.field_version, tele_mmap.focus_index)
+        if last is None and None in (scor_published, ext_published, tele_published):
+            return False, False  # no complete snapshot yet
+        if scor_published is not None:
+            scor, scor_index, scor_gen = scor_published
+            scor_slot = (self._scor_ring, scor_index, scor_gen)
+        else:
+            scor = last.scor
+            scor_slot = last.scor_slot
+        if ext_published is not None:
+            ext, ext_index, ext_gen = ext_published
+            ext_slot = (self._ext_ring, ext_index, ext_gen)
+        else:
+            ext = last.ext
+            ext_slot = last.ext_slot
+        if tele_published is not None:
+            tele, tele_index, tele_gen = tele_published
+            tele_slot = (self._tele_ring, tele_index, tele_gen)
+            tele_indexes = self._tele_indexes
+        else:
+            tele = last.tele
+            tele_slot = last.tele_slot
+            tele_indexes = last.tele_indexes
+        if scor_published is None and tele_published is None:
+            return False, False
+        self.snapshot = Snapshot(
+            seq=last.seq + 1 if last is not None else 0,
+            scor_version=scor.mVersionUpdateEnd,
+            tele_version=tele.mVersionUpdateEnd,
+            scor=scor,
+            tele=tele,
+            ext=ext,
+            tele_indexes=tele_indexes,
+            scor_slot=scor_slot,
+            tele_slot=tele_slot,
+            ext_slot=ext_slot,
+        )
+        return scor_published is not None, tele_published is not None
+
+    def __update_vehicle_versions(self, snapshot: Snapshot) -> None:
+        """Update per-vehicle last changed version & changed vehicles mask
+
+        Vehicle is changed if mID (slot reassigned) or any motion field
+        (see vehicle_states) is different from last update.
+        Parked, disconnected or garage-bound vehicles keep identical data.
+        """
+        states = vehicle_states(snapshot.scor, snapshot.tele, snapshot.tele_indexes)
+        last_states = self._vehicle_states
+        num_last = len(last_states)
+        versions = self.vehicle_versions
+        seq = snapshot.seq
+        changed = tuple(
+            index >= num_last or state != last_states[index]
+            for index, state in enumerate(states)
+        )
+        for index, is_changed in enumerate(changed):
+            if is_changed:
+                versions[index] = seq
+        self._vehicle_states = states
+        self.changed_vehicles = changed
+
+    def changed_since(self, version: int) -> tuple[bool, ...]:
+        """Changed vehicles mask (by scoring index) since snapshot version (seq)"""
+        versions = self.vehicle_versions
+        return tuple(
+            versions[index] > version
+            for index in range(len(self._vehicle_states))
+        )
+
+    def update_stats(self) -> tuple[UpdateStats, UpdateStats]:
+        """Scoring & telemetry buffer update statistics"""
+        return (
+            self._scor_cadence.stats("scoring"),
+            self._tele_cadence.stats("telemetry"),
+        )
 
     def start(self, access_mode: int, rf2_pid: str) -> None:
         """Update & sync mmap data copy in separate thread
@@ -215,11 +959,17 @@ class SyncData:
             self._updating = True
             # Initialize mmap data
             self.dataset.create_mmap(access_mode, rf2_pid)
-            self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            self.__update_tele_indexes(self.dataset.tele.data)
+            self.snapshot = None
+            self.__publish_snapshot(True, True)
+            self._vehicle_states = []
+            self.__update_vehicle_versions(self.snapshot)
             if not self.__sync_player_data():
                 self.player_scor = self.dataset.scor.data.mVehicles[INVALID_INDEX]
                 self.player_tele = self.dataset.tele.data.mVehicles[INVALID_INDEX]
             # Setup updating thread
+            self._scor_cadence.reset()
+            self._tele_cadence.reset()
             self._event.clear()
             self._update_thread = threading.Thread(target=self.__update, daemon=True)
             self._update_thread.start()
@@ -233,6 +983,9 @@ class SyncData:
             self._event.set()
             self._updating = False
             self._update_thread.join()
+            # Wake up waiting consumers
+            self.scor_signal.notify()
+            self.tele_signal.notify()
             # Make final copy before close, otherwise mmap won't close if using direct access
             self.player_scor = copy_struct(self.player_scor)
             self.player_tele = copy_struct(self.player_tele)
@@ -241,9 +994,15 @@ class SyncData:
             logger.warning("sharedmemory: UPDATING: already stopped")
 
     def __update(self) -> None:
-        """Update synced player data"""
+        """Update synced player data
+
+        Scoring & telemetry are polled on independent adaptive cadence,
+        player data is synced only if any of them updated.
+        """
         self.paused = False  # make sure initial pause state is false
         _event_wait = self._event.wait
+        scor_poll = self._scor_cadence.poll
+        tele_poll = self._tele_cadence.poll
         freezed_version = 0  # store freezed update version number
         last_version_update = 0  # store last update version number
         last_update_time = 0.0
@@ -252,10 +1011,26 @@ class SyncData:
         update_delay = 0.5  # longer delay while inactive
 
         while not _event_wait(update_delay):
-            self.dataset.update_mmap()
-            self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            now = monotonic()
+            scor_updated = scor_poll(now, data_freezed)
+            tele_updated = tele_poll(now, data_freezed)
+            if tele_updated:
+                self.__update_tele_indexes(self.dataset.tele.data)
+            if scor_updated:
+                self.dataset.update_optional()
+            if scor_updated or tele_updated:
+                scor_updated, tele_updated = self.__publish_snapshot(scor_updated, tele_updated)
+            if scor_updated or tele_updated:
+                self.__update_vehicle_versions(self.snapshot)
+                if self.recorder is not None:
+                    self.recorder.capture(
+                        self.snapshot, scor_updated, tele_updated, self.dataset.tele.focus_index)
+                if scor_updated:
+                    self.scor_signal.notify()
+                if tele_updated:
+                    self.tele_signal.notify()
             # Update player data & index
-            if not data_freezed:
+            if not data_freezed and (scor_updated or tele_updated):
                 # Get player data
                 data_synced = self.__sync_player_data()
                 # Pause if local player index no longer exists, 5 tries
@@ -268,18 +1043,18 @@ class SyncData:
                         self.player_scor_index = INVALID_INDEX
                         self.player_scor = self.dataset.scor.data.mVehicles[INVALID_INDEX]
                         self.player_tele = self.dataset.tele.data.mVehicles[INVALID_INDEX]
+                        self.dataset.tele.focus_index = INVALID_INDEX
                         self.paused = True
                         logger.info("sharedmemory: UPDATING: player data paused")
 
             version_update = self.dataset.scor.data.mVersionUpdateEnd
             if last_version_update != version_update:
                 last_version_update = version_update
-                last_update_time = monotonic()
+                last_update_time = now
 
             if data_freezed:
                 # Check while IN freeze state
                 if freezed_version != last_version_update:
-                    update_delay = 0.01
                     self.paused = data_freezed = False
                     logger.info(
                         "sharedmemory: UPDATING: resumed, data version %s",
@@ -288,7 +1063,6 @@ class SyncData:
             # Check while NOT IN freeze state
             # Set freeze state if data stopped updating after 2s
             elif monotonic() - last_update_time > 2:
-                update_delay = 0.5
                 self.paused = data_freezed = True
                 freezed_version = last_version_update
                 logger.info(
@@ -296,6 +1070,14 @@ class SyncData:
                     freezed_version,
                 )
 
+            if data_freezed:
+                update_delay = 0.5
+            else:  # wait until next scheduled poll
+                update_delay = max(
+                    min(self._scor_cadence.next_poll, self._tele_cadence.next_poll) - monotonic(),
+                    0.001,
+                )
+
         logger.info("sharedmemory: UPDATING: thread stopped")
 
 
@@ -311,7 +1093,7 @@ class RF2Info:
         "_scor",
         "_tele",
         "_ext",
-        "_ffb",
+        "_ffb_empty",
     )
 
     def __init__(self) -> None:
@@ -324,7 +1106,8 @@ class RF2Info:
         self._scor = self._sync.dataset.scor
         self._tele = self._sync.dataset.tele
         self._ext = self._sync.dataset.ext
-        self._ffb = self._sync.dataset.ffb
+        # Zeroed force feedback data until optional buffer mapped
+        self._ffb_empty = rF2data.rF2ForceFeedback()
 
     def __del__(self):
         logger.info("sharedmemory: GC: RF2Info")
@@ -349,6 +1132,26 @@ class RF2Info:
         """
         self._access_mode = mode
 
+    def calibrateMode(self, duration: float = 2.0, apply: bool = True):
+        """Measure copy & direct access on live data, select access mode
+
+        Blocks for duration, game must be running & updating data.
+        Takes effect on next start if applied.
+
+        Args:
+            duration: total measuring duration (seconds).
+            apply: set selected access mode, False to log recommendation only.
+
+        Returns:
+            Calibration result, see rf2_calibrate.CalibrationResult.
+        """
+        from .rf2_calibrate import calibrate
+
+        result = calibrate(duration, self._rf2_pid)
+        if apply and result.is_valid:
+            self._access_mode = result.mode
+        return result
+
     def setStateOverride(self, state: bool = False) -> None:
         """Enable state override"""
         self._state_override = state
@@ -365,6 +1168,21 @@ class RF2Info:
         """Manual override player index"""
         self._sync.player_scor_index = min(max(index, INVALID_INDEX), MAX_VEHICLES - 1)
 
+    def setFieldInterval(self, interval: float = 0.0) -> None:
+        """Set tiered telemetry refresh (copy access mode only)
+
+        Player telemetry is refreshed on every update,
+        other vehicles are refreshed at interval.
+
+        Args:
+            interval: field refresh interval (seconds), 0 to refresh all vehicles on every update.
+        """
+        self._sync.dataset.tele.field_interval = max(interval, 0.0)
+
+    def setRecorder(self, recorder=None) -> None:
+        """Set frame recorder, None to disable"""
+        self._sync.recorder = recorder
+
     @property
     def rf2ScorInfo(self) -> rF2data.rF2ScoringInfo:
         """rF2 scoring info data"""
@@ -401,8 +1219,63 @@ class RF2Info:
 
     @property
     def rf2Ffb(self) -> rF2data.rF2ForceFeedback:
-        """rF2 force feedback data"""
-        return self._ffb.data
+        """rF2 force feedback data, mapped on first access, zeroed until plugin publishes it"""
+        data = self._sync.dataset.optional("ffb").data
+        if data is None:
+            return self._ffb_empty
+        return data
+
+    def rf2Buffer(self, name: str):
+        """rF2 optional buffer data (rules, pitinfo, weather, graphics, ffb)
+
+        Buffer is mapped on first access, data is None until plugin publishes it.
+        """
+        return self._sync.dataset.optional(name).data
+
+    def subscribeBuffer(self, name: str, mode: int | None = None) -> None:
+        """Subscribe optional buffer
+
+        Args:
+            name: optional buffer name.
+            mode: 0 = copy access, 1 = direct access, None for buffer default.
+        """
+        self._sync.dataset.subscribe(name, mode)
+
+    def unsubscribeBuffer(self, name: str) -> None:
+        """Unsubscribe optional buffer"""
+        self._sync.dataset.unsubscribe(name)
+
+    @property
+    def snapshot(self) -> Snapshot | None:
+        """Latest paired scoring & telemetry snapshot, consistent within single frame"""
+        return self._sync.snapshot
+
+    @property
+    def scorSignal(self) -> FrameSignal:
+        """New scoring frame signal, subscribe to wait for fresh scoring data"""
+        return self._sync.scor_signal
+
+    @property
+    def teleSignal(self) -> FrameSignal:
+        """New telemetry frame signal, subscribe to wait for fresh telemetry data"""
+        return self._sync.tele_signal
+
+    @property
+    def changedVehicles(self) -> tuple[bool, ...]:
+        """Vehicles changed in latest update (by scoring index)"""
+        return self._sync.changed_vehicles
+
+    def vehicleVersion(self, index: int) -> int:
+        """Snapshot version (seq) when vehicle data last changed (by scoring index)"""
+        return self._sync.vehicle_versions[index]
+
+    def changedSince(self, version: int) -> tuple[bool, ...]:
+        """Vehicles changed since snapshot version (by scoring index)"""
+        return self._sync.changed_since(version)
+
+    def updateStats(self) -> tuple[UpdateStats, UpdateStats]:
+        """Scoring & telemetry buffer update statistics"""
+        return self._sync.update_stats()
 
     @property
     def playerIndex(self) -> int:
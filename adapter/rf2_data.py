@@ -719,6 +719,12 @@ class Vehicle(DataAdapter):
         """Vehicle slot id"""
         return self.shmm.rf2ScorVeh(index).mID
 
+    def data_version(self, index: int | None = None) -> int:
+        """Vehicle data version, changes only if vehicle lap distance or elapsed time changed"""
+        if index is None:
+            index = self.shmm.playerIndex
+        return self.shmm.vehicleVersion(index)
+
     def driver_name(self, index: int | None = None) -> str:
         """Driver name"""
         return tostr(self.shmm.rf2ScorVeh(index).mDriverName)
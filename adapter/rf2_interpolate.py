@@ -0,0 +1,205 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 vehicle interpolation
+
+Dead-reckoning of lap distance & world position for all vehicles
+between scoring updates (~5Hz), vectorized with NumPy (required).
+"""
+
+from __future__ import annotations
+
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+else:  # run time only
+    from pyRfactor2SharedMemory import rF2data
+
+from pyRfactor2SharedMemory import rF2dtype
+from pyRfactor2SharedMemory.rF2MMap import MAX_VEHICLES, vehicles_layout
+
+from .rf2_connector import MAX_IDS, RF2Info
+
+logger = logging.getLogger(__name__)
+
+SCOR_HEADER_SIZE = vehicles_layout(rF2data.rF2Scoring)[0]
+MAX_SAMPLE_INTERVAL = 1.0  # max seconds between samples for track speed estimate
+MAX_TRACK_SPEED = 150.0  # m/s, track speed above this is treated as desync
+
+
+class VehicleInterpolator:
+    """Vehicle lap distance & position interpolator
+
+    Keep last 2 scoring samples per vehicle (matched by mID via mID to slot lookup,
+    so history survives scoring order changes),
+    extrapolate from latest sample to current session time:
+        lap distance: track speed from lap distance history, or local velocity magnitude.
+        world position: local velocity rotated to world space with orientation matrix.
+
+    Desync handling:
+        extrapolation time is clamped within 0 to max_extrapolation,
+        vehicles with lap distance jumping (pit teleport, reset)
+        are not extrapolated until next sample,
+        vehicles with new mID (or mID outside 0 to MAX_IDS) use local velocity magnitude as track speed.
+
+    Attributes:
+        lap_dist: extrapolated lap distance array, valid up to num_vehicles.
+        pos: extrapolated world position array (N, 3), valid up to num_vehicles.
+        num_vehicles: number of valid vehicles in latest sample.
+    """
+
+    __slots__ = (
+        "_info",
+        "_np",
+        "_version",
+        "_sample_et",
+        "_sample_time",
+        "_id_slots",
+        "_lap_dist",
+        "_pos",
+        "_world_vel",
+        "_track_speed",
+        "_track_length",
+        "max_extrapolation",
+        "num_vehicles",
+        "lap_dist",
+        "pos",
+    )
+
+    def __init__(self, info: RF2Info, max_extrapolation: float = 0.5) -> None:
+        """Initialize interpolator
+
+        Args:
+            info: RF2Info instance, snapshot is used as scoring source.
+            max_extrapolation: max extrapolation time (seconds) from latest scoring sample.
+
+        Raises:
+            ImportError: if NumPy is not installed.
+        """
+        if not rF2dtype.is_numpy_available():
+            raise ImportError("NumPy is required for vehicle interpolation")
+        np = rF2dtype.np
+        self._info = info
+        self._np = np
+        self._version = None
+        self._sample_et = 0.0
+        self._sample_time = 0.0
+        self._id_slots = np.full(MAX_IDS, -1, dtype=np.int32)  # mID to last sample slot
+        self._lap_dist = np.zeros(MAX_VEHICLES)
+        self._pos = np.zeros((MAX_VEHICLES, 3))
+        self._world_vel = np.zeros((MAX_VEHICLES, 3))
+        self._track_speed = np.zeros(MAX_VEHICLES)
+        self._track_length = 0.0
+        self.max_extrapolation = max_extrapolation
+        self.num_vehicles = 0
+        self.lap_dist = np.zeros(MAX_VEHICLES)
+        self.pos = np.zeros((MAX_VEHICLES, 3))
+
+    def update(self, session_et: float | None = None) -> int:
+        """Sample new scoring data if updated, then extrapolate to session time
+
+        Args:
+            session_et: current session elapsed time, ex. player telemetry mElapsedTime.
+                None to estimate from time since latest scoring sample was received.
+
+        Returns:
+            Number of valid vehicles.
+        """
+        snapshot = self._info.snapshot
+        if snapshot is not None and snapshot.scor_version != self._version:
+            self._version = snapshot.scor_version
+            self.__sample(snapshot.scor)
+        if session_et is None:
+            session_et = self._sample_et + monotonic() - self._sample_time
+        self.__extrapolate(session_et)
+        return self.num_vehicles
+
+    def __sample(self, scor: rF2data.rF2Scoring) -> None:
+        """Copy latest scoring sample & estimate velocity"""
+        np = self._np
+        info = scor.mScoringInfo
+        num = min(max(info.mNumVehicles, 0), MAX_VEHICLES)
+        sample_et = info.mCurrentET
+        track_length = info.mLapDist
+        vehicles = rF2dtype.array_view(
+            scor, rF2data.rF2VehicleScoring, offset=SCOR_HEADER_SIZE, count=num)
+
+        ids = vehicles["mID"].astype(np.int32)
+        lap_dist = vehicles["mLapDist"].astype(np.float64)
+        pos = vehicles["mPos"]
+        local_vel = vehicles["mLocalVel"]
+        ori = vehicles["mOri"]  # (N, 3) rows of rF2Vec3
+        lv = np.stack((local_vel["x"], local_vel["y"], local_vel["z"]), axis=-1)
+        rot = np.stack((ori["x"], ori["y"], ori["z"]), axis=-1)  # (N, 3, 3)
+
+        # Track speed from lap distance change of same vehicle (mID) in last sample
+        delta_et = sample_et - self._sample_et
+        valid_id = (ids >= 0) & (ids < MAX_IDS)
+        last_slots = np.full(num, -1, dtype=np.int32)
+        last_slots[valid_id] = self._id_slots[ids[valid_id]]
+        same = last_slots >= 0
+        delta_dist = lap_dist - self._lap_dist[last_slots]  # masked by same
+        if track_length > 0:  # wrap across finish line
+            half = track_length * 0.5
+            delta_dist[delta_dist < -half] += track_length
+            delta_dist[delta_dist > half] -= track_length
+        speed = np.linalg.norm(lv, axis=1)
+        if 0 < delta_et < MAX_SAMPLE_INTERVAL:
+            track_speed = delta_dist / delta_et
+            valid = same & (track_speed >= 0) & (track_speed < MAX_TRACK_SPEED)
+            # Lap distance jumped (teleport, reset) while moving slowly
+            jumped = same & ~valid
+            track_speed = np.where(valid, track_speed, speed)
+            track_speed[jumped] = 0.0
+        else:
+            track_speed = speed
+            jumped = np.zeros(num, dtype=bool)
+
+        world_vel = np.einsum("nij,nj->ni", rot, lv)
+        world_vel[jumped] = 0.0
+
+        self._id_slots.fill(-1)
+        self._id_slots[ids[valid_id]] = np.flatnonzero(valid_id)
+        self._lap_dist[:num] = lap_dist
+        self._pos[:num, 0] = pos["x"]
+        self._pos[:num, 1] = pos["y"]
+        self._pos[:num, 2] = pos["z"]
+        self._world_vel[:num] = world_vel
+        self._track_speed[:num] = track_speed
+        self._track_length = track_length
+        self._sample_et = sample_et
+        self._sample_time = monotonic()
+        self.num_vehicles = num
+
+    def __extrapolate(self, session_et: float) -> None:
+        """Extrapolate all vehicles from latest sample to session time"""
+        np = self._np
+        num = self.num_vehicles
+        delta = min(max(session_et - self._sample_et, 0.0), self.max_extrapolation)
+        lap_dist = self.lap_dist[:num]
+        np.multiply(self._track_speed[:num], delta, out=lap_dist)
+        lap_dist += self._lap_dist[:num]
+        if self._track_length > 0:
+            np.mod(lap_dist, self._track_length, out=lap_dist)
+        pos = self.pos[:num]
+        np.multiply(self._world_vel[:num], delta, out=pos)
+        pos += self._pos[:num]
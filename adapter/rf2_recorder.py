@@ -0,0 +1,578 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 shared memory frame recorder
+
+Record file format (little endian):
+    File header: FILE_HEADER (magic, format version, buffer struct sizes).
+    Chunks: CHUNK_HEADER followed by lzma compressed frame records.
+        Each chunk starts with state frames (full data) of every buffer
+        recorded so far, so any chunk can be decoded independently for seeking.
+    Frame record: FRAME_HEADER (record time, buffer id & flags, data size),
+        followed by data XORed against predicted data of same buffer.
+        Double fields are predicted by linear extrapolation of last two frames,
+        other bytes by last frame.
+    Index: INDEX_HEADER, INDEX_ENTRY per chunk, then FILE_FOOTER.
+        Index is rebuilt by scanning chunk headers if file is not closed properly.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import lzma
+import os
+import queue
+import struct
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, BinaryIO, Iterator, NamedTuple
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+else:  # run time only
+    from pyRfactor2SharedMemory import rF2data
+
+from pyRfactor2SharedMemory.rF2MMap import MAX_VEHICLES, vehicles_layout
+
+logger = logging.getLogger(__name__)
+
+RECORD_MAGIC = b"LMUREC"
+RECORD_VERSION = 2
+FILE_HEADER = struct.Struct("<6sHIII")  # magic, version, scoring, telemetry, extended size
+CHUNK_HEADER = struct.Struct("<4sIIIddi")  # tag, compressed size, raw size, frames, time, ET, lap
+FRAME_HEADER = struct.Struct("<dBI")  # record time, buffer id & flags, data size
+INDEX_HEADER = struct.Struct("<4sI")  # tag, number of entries
+INDEX_ENTRY = struct.Struct("<Qddi")  # chunk offset, record time, session ET, lap
+FILE_FOOTER = struct.Struct("<Q4s")  # index offset, tag
+CHUNK_TAG = b"CHNK"
+INDEX_TAG = b"INDX"
+FOOTER_TAG = b"RECE"
+COMPRESS_PRESET = 1  # lzma preset, higher presets are slower with little gain
+
+# Buffer id
+SCORING = 0
+TELEMETRY = 1
+EXTENDED = 2
+BUFFER_TYPES = (rF2data.rF2Scoring, rF2data.rF2Telemetry, rF2data.rF2Extended)
+BUFFER_LAYOUTS = tuple(map(vehicles_layout, BUFFER_TYPES))
+
+# Frame flags (combined with buffer id)
+BUFFER_ID_MASK = 0x0F
+STATE_FRAME = 0x80  # full data at chunk start, repeats last recorded data
+PARTIAL_FRAME = 0x40  # only header & focus vehicle updated, field vehicles repeated
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+MANTISSA_BITS = 52
+
+# Scoring offsets for index
+SCOR_ET_OFFSET = rF2data.rF2Scoring.mScoringInfo.offset + rF2data.rF2ScoringInfo.mCurrentET.offset
+SCOR_LAPS_OFFSET = rF2data.rF2VehicleScoring.mTotalLaps.offset
+unpack_et = struct.Struct("d").unpack_from
+unpack_laps = struct.Struct("h").unpack_from
+
+
+class RecordFrame(NamedTuple):
+    """Recorded frame"""
+
+    time: float
+    buffer_id: int
+    data: bytes
+
+
+class IndexEntry(NamedTuple):
+    """Chunk index entry"""
+
+    offset: int
+    time: float
+    session_et: float
+    lap: int
+
+
+def double_offsets(data_type: type, base: int = 0) -> list[int]:
+    """Byte offsets of all c_double fields in ctypes type"""
+    if data_type is ctypes.c_double:
+        return [base]
+    if issubclass(data_type, ctypes.Array):
+        item_size = ctypes.sizeof(data_type._type_)
+        return [
+            offset
+            for index in range(data_type._length_)
+            for offset in double_offsets(data_type._type_, base + item_size * index)
+        ]
+    if issubclass(data_type, ctypes.Structure):
+        return [
+            offset
+            for name, field_type, *_ in data_type._fields_
+            for offset in double_offsets(field_type, base + getattr(data_type, name).offset)
+        ]
+    return []
+
+
+def double_runs(offsets: list[int], size: int) -> tuple[tuple[int, struct.Struct], ...]:
+    """Offsets & structs of consecutive double fields (unpacked as uint64) within block size
+
+    Separate runs are used, as struct padding would overwrite bytes in between.
+    """
+    runs = []
+    for offset in offsets:
+        if offset + 8 > size:
+            continue
+        if runs and runs[-1][0] + runs[-1][1] * 8 == offset:
+            runs[-1][1] += 1
+        else:
+            runs.append([offset, 1])
+    return tuple((offset, struct.Struct(f"<{count}Q")) for offset, count in runs)
+
+
+def double_layout(data_struct: ctypes.Structure) -> tuple[tuple, tuple] | None:
+    """Header & vehicle double runs of buffer, None if buffer has no vehicles array"""
+    header_size, vehicle_size, _ = vehicles_layout(data_struct)
+    if header_size < 0:
+        return None
+    vehicle_type = next(field[1] for field in data_struct._fields_ if field[0] == "mVehicles")._type_
+    return (
+        double_runs(double_offsets(data_struct), header_size),
+        double_runs(double_offsets(vehicle_type), vehicle_size),
+    )
+
+
+DOUBLE_LAYOUTS = tuple(map(double_layout, BUFFER_TYPES))
+
+
+def double_blocks(buffer_id: int, size: int) -> Iterator[tuple[int, struct.Struct, bool]]:
+    """Double runs covering header & vehicles of buffer data size
+
+    Yields:
+        Run offset, run struct, whether run belongs to vehicle.
+    """
+    header_runs, vehicle_runs = DOUBLE_LAYOUTS[buffer_id]
+    header_size, vehicle_size, _ = BUFFER_LAYOUTS[buffer_id]
+    for offset, run in header_runs:
+        yield offset, run, False
+    for vehicle_offset in range(header_size, size - vehicle_size + 1, vehicle_size):
+        for offset, run in vehicle_runs:
+            yield vehicle_offset + offset, run, True
+
+
+def truncate_mantissa(data: bytes, buffer_id: int, precision_bits: int) -> bytes:
+    """Clear low mantissa bits of double fields, keep precision_bits of mantissa"""
+    if precision_bits >= MANTISSA_BITS or DOUBLE_LAYOUTS[buffer_id] is None:
+        return data
+    mask = ~((1 << (MANTISSA_BITS - max(precision_bits, 0))) - 1) & UINT64_MASK
+    output = bytearray(data)
+    for offset, run, _ in double_blocks(buffer_id, len(output)):
+        run.pack_into(output, offset, *[value & mask for value in run.unpack_from(output, offset)])
+    return bytes(output)
+
+
+def predict_bytes(buffer_id: int, last: bytes, prev: bytes, size: int, partial: bool = False) -> bytes:
+    """Predict frame data from last two frames of same buffer
+
+    Double fields are linearly extrapolated (on raw bits, so prediction is exact on any platform),
+    other bytes repeat last frame. Vehicles of partial frame repeat last frame.
+    """
+    if not last or not prev or DOUBLE_LAYOUTS[buffer_id] is None:
+        return last
+    predict = bytearray(last[:size].ljust(size, b"\0"))
+    prev = prev[:size].ljust(size, b"\0")
+    for offset, run, is_vehicle in double_blocks(buffer_id, size):
+        if partial and is_vehicle:
+            break
+        run.pack_into(predict, offset, *[
+            (value + value - prev_value) & UINT64_MASK
+            for value, prev_value in zip(run.unpack_from(predict, offset), run.unpack_from(prev, offset))
+        ])
+    return predict
+
+
+def refresh_focus(data: bytes, last: bytes, focus_index: int) -> bytes:
+    """Telemetry data with header & focus vehicle from data, field vehicles from last data
+
+    Full data is returned if number of vehicles changed.
+    """
+    if len(data) != len(last):
+        return data
+    header_size, vehicle_size, _ = BUFFER_LAYOUTS[TELEMETRY]
+    focus_offset = header_size + vehicle_size * focus_index
+    if focus_index < 0 or focus_offset + vehicle_size > len(data):
+        return data[:header_size] + last[header_size:]
+    focus_end = focus_offset + vehicle_size
+    return data[:header_size] + last[header_size:focus_offset] + data[focus_offset:focus_end] + last[focus_end:]
+
+
+def buffer_bytes(data: ctypes.Structure, buffer_id: int) -> bytes:
+    """Copy header plus valid vehicles of buffer data into bytes"""
+    header_size, vehicle_size, num_vehicles_offset = BUFFER_LAYOUTS[buffer_id]
+    if header_size < 0:
+        return ctypes.string_at(ctypes.addressof(data), ctypes.sizeof(data))
+    num_vehicles = ctypes.c_int.from_address(ctypes.addressof(data) + num_vehicles_offset).value
+    num_vehicles = min(max(num_vehicles, 0), MAX_VEHICLES)
+    return ctypes.string_at(ctypes.addressof(data), header_size + vehicle_size * num_vehicles)
+
+
+def xor_bytes(data: bytes, last: bytes) -> bytes:
+    """XOR data against last data of same buffer, pad or truncate last to data size"""
+    size = len(data)
+    if not last:
+        return data
+    if len(last) < size:
+        last += bytes(size - len(last))
+    return (
+        int.from_bytes(data, "little") ^ int.from_bytes(last[:size], "little")
+    ).to_bytes(size, "little")
+
+
+def scoring_info(data: bytes) -> tuple[float, int]:
+    """Session elapsed time & leader laps from scoring bytes"""
+    header_size, vehicle_size, num_vehicles_offset = BUFFER_LAYOUTS[SCORING]
+    num_vehicles = (len(data) - header_size) // vehicle_size
+    laps = max(
+        (unpack_laps(data, header_size + vehicle_size * index + SCOR_LAPS_OFFSET)[0]
+         for index in range(num_vehicles)),
+        default=0,
+    )
+    return unpack_et(data, SCOR_ET_OFFSET)[0], laps
+
+
+class FrameRecorder:
+    """Raw shared memory frame recorder
+
+    Frames are captured from SyncData update thread (copy only),
+    delta-compressed & written to disk from separate writer thread.
+    Frames are dropped (and counted) if writer queue is full.
+
+    Lossless by default, every captured frame is recorded at full precision.
+    Optional lossy settings reduce record size, field (non-focus) vehicle telemetry
+    is recorded at field_interval, telemetry frames in between only update header
+    & focus vehicle, and double fields are truncated to precision_bits.
+    """
+
+    __slots__ = (
+        "_filename",
+        "_file",
+        "_queue",
+        "_writer_thread",
+        "_start_time",
+        "_last_tele_time",
+        "_last_field_time",
+        "_last_tele_data",
+        "_last_ext_version",
+        "_index",
+        "tele_interval",
+        "field_interval",
+        "chunk_interval",
+        "precision_bits",
+        "captured",
+        "dropped",
+        "bytes_written",
+    )
+
+    def __init__(
+        self, filename: str, tele_interval: float = 0.0, field_interval: float = 0.0,
+        chunk_interval: float = 10.0, precision_bits: int = MANTISSA_BITS, max_queued: int = 512) -> None:
+        """Initialize recorder
+
+        Args:
+            filename: record file name.
+            tele_interval: minimum telemetry record interval (seconds), 0 to record all.
+            field_interval: minimum field vehicle telemetry record interval (seconds),
+                0 to record all vehicles on every telemetry frame.
+            chunk_interval: chunk (seek point) interval (seconds).
+            precision_bits: mantissa bits kept for double fields, 52 for lossless.
+                32 bits keeps relative error below 2.4e-10.
+            max_queued: max number of frames waiting to be written.
+        """
+        self._filename = filename
+        self._file = None
+        self._queue = queue.Queue(max_queued)
+        self._writer_thread = None
+        self._start_time = 0.0
+        self._last_tele_time = -1.0
+        self._last_field_time = -1.0
+        self._last_tele_data = b""
+        self._last_ext_version = -1
+        self._index = []
+        self.tele_interval = tele_interval
+        self.field_interval = field_interval
+        self.chunk_interval = chunk_interval
+        self.precision_bits = precision_bits
+        self.captured = 0
+        self.dropped = 0
+        self.bytes_written = 0
+
+    def __del__(self):
+        logger.info("recorder: GC: FrameRecorder")
+
+    def start(self) -> None:
+        """Open record file & start writer thread"""
+        if self._file is not None:
+            logger.warning("recorder: RECORDING: already started")
+            return
+        self._file = open(self._filename, "wb")
+        self._file.write(FILE_HEADER.pack(
+            RECORD_MAGIC, RECORD_VERSION, *map(ctypes.sizeof, BUFFER_TYPES)))
+        self._index.clear()
+        while True:  # drop frames captured after last stop
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._start_time = perf_counter()
+        self._last_tele_time = -1.0
+        self._last_field_time = -1.0
+        self._last_tele_data = b""
+        self._last_ext_version = -1
+        self.captured = self.dropped = 0
+        self._writer_thread = threading.Thread(target=self.__write, daemon=True)
+        self._writer_thread.start()
+        logger.info("recorder: RECORDING: %s", self._filename)
+
+    def stop(self) -> None:
+        """Flush queued frames, write index & close record file"""
+        if self._file is None:
+            logger.warning("recorder: RECORDING: already stopped")
+            return
+        self._queue.put(None)  # stop marker
+        self._writer_thread.join()
+        index_offset = self._file.tell()
+        self._file.write(INDEX_HEADER.pack(INDEX_TAG, len(self._index)))
+        for entry in self._index:
+            self._file.write(INDEX_ENTRY.pack(*entry))
+        self._file.write(FILE_FOOTER.pack(index_offset, FOOTER_TAG))
+        self.bytes_written = self._file.tell()
+        self._file.close()
+        self._file = None
+        logger.info(
+            "recorder: RECORDING: stopped, %s frames, %s dropped, %s bytes",
+            self.captured, self.dropped, self.bytes_written,
+        )
+
+    def capture(
+        self, snapshot, scor_updated: bool, tele_updated: bool,
+        focus_index: int = -1) -> None:
+        """Capture updated buffers from SyncData snapshot (non-blocking)
+
+        Args:
+            snapshot: SyncData snapshot.
+            scor_updated: whether scoring updated.
+            tele_updated: whether telemetry updated.
+            focus_index: telemetry index of vehicle recorded on every telemetry frame.
+        """
+        now = perf_counter() - self._start_time
+        if scor_updated:
+            self.__put(RecordFrame(now, SCORING, buffer_bytes(snapshot.scor, SCORING)))
+        if tele_updated and now - self._last_tele_time >= self.tele_interval:
+            self._last_tele_time = now
+            data = buffer_bytes(snapshot.tele, TELEMETRY)
+            buffer_id = TELEMETRY
+            if now - self._last_field_time >= self.field_interval or len(data) != len(self._last_tele_data):
+                self._last_field_time = now
+            else:
+                data = refresh_focus(data, self._last_tele_data, focus_index)
+                buffer_id |= PARTIAL_FRAME
+            self._last_tele_data = data
+            self.__put(RecordFrame(now, buffer_id, data))
+        ext_data = snapshot.ext
+        if self._last_ext_version != ext_data.mVersionUpdateEnd:
+            self._last_ext_version = ext_data.mVersionUpdateEnd
+            self.__put(RecordFrame(now, EXTENDED, buffer_bytes(ext_data, EXTENDED)))
+
+    def __put(self, frame: RecordFrame) -> None:
+        """Queue frame, drop if writer falls behind"""
+        try:
+            self._queue.put_nowait(frame)
+            self.captured += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def __write(self) -> None:
+        """Delta-compress frames into chunks & write to file"""
+        _queue_get = self._queue.get
+        state_data = [b"", b"", b""]  # last recorded data, written as state frames on new chunk
+        last_data = [b"", b"", b""]
+        prev_data = [b"", b"", b""]
+        chunk = bytearray()
+        chunk_frames = 0
+        chunk_time = 0.0
+        chunk_et = session_et = 0.0
+        chunk_lap = lap = 0
+        while True:
+            frame = _queue_get()
+            if frame is None or (chunk_frames and frame.time - chunk_time >= self.chunk_interval):
+                if chunk_frames:
+                    self.__write_chunk(chunk, chunk_frames, chunk_time, chunk_et, chunk_lap)
+                chunk = bytearray()
+                chunk_frames = 0
+            if frame is None:
+                break
+            buffer_id = frame.buffer_id & BUFFER_ID_MASK
+            data = truncate_mantissa(frame.data, buffer_id, self.precision_bits)
+            if buffer_id == SCORING:
+                session_et, lap = scoring_info(data)
+            if not chunk_frames:
+                chunk_time = frame.time
+                chunk_et, chunk_lap = session_et, lap
+                last_data = [b"", b"", b""]
+                prev_data = [b"", b"", b""]
+                for state_id, state in enumerate(state_data):
+                    if state and state_id != buffer_id:
+                        chunk += FRAME_HEADER.pack(frame.time, state_id | STATE_FRAME, len(state))
+                        chunk += state
+                        last_data[state_id] = state
+                        chunk_frames += 1
+            chunk += FRAME_HEADER.pack(frame.time, frame.buffer_id, len(data))
+            chunk += xor_bytes(data, predict_bytes(
+                buffer_id, last_data[buffer_id], prev_data[buffer_id], len(data),
+                frame.buffer_id & PARTIAL_FRAME))
+            prev_data[buffer_id] = last_data[buffer_id]
+            last_data[buffer_id] = state_data[buffer_id] = data
+            chunk_frames += 1
+
+    def __write_chunk(self, chunk: bytearray, frames: int, time: float, session_et: float, lap: int) -> None:
+        """Compress & write chunk, add index entry"""
+        compressed = lzma.compress(chunk, preset=COMPRESS_PRESET)
+        offset = self._file.tell()
+        self._file.write(CHUNK_HEADER.pack(
+            CHUNK_TAG, len(compressed), len(chunk), frames, time, session_et, lap))
+        self._file.write(compressed)
+        self._index.append(IndexEntry(offset, time, session_et, lap))
+        self.bytes_written = offset + CHUNK_HEADER.size + len(compressed)
+
+
+class RecordReader:
+    """Record file reader"""
+
+    __slots__ = (
+        "_file",
+        "index",
+    )
+
+    def __init__(self, filename: str) -> None:
+        """Open record file & load index
+
+        Args:
+            filename: record file name.
+
+        Raises:
+            ValueError: if not a record file or buffer sizes mismatch.
+        """
+        self._file = open(filename, "rb")
+        header = self._file.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            self._file.close()
+            raise ValueError(f"{filename} is not a record file")
+        magic, version, *sizes = FILE_HEADER.unpack(header)
+        if magic != RECORD_MAGIC or version != RECORD_VERSION:
+            self._file.close()
+            raise ValueError(f"{filename} is not a record file or version mismatch")
+        if tuple(sizes) != tuple(map(ctypes.sizeof, BUFFER_TYPES)):
+            self._file.close()
+            raise ValueError(f"{filename} buffer size mismatch: {sizes}")
+        self.index = load_index(self._file)
+
+    def close(self) -> None:
+        """Close record file"""
+        self._file.close()
+
+    def seek_lap(self, lap: int) -> int:
+        """Find chunk number to start reading from lap
+
+        Returns:
+            Last chunk number started before lap, 0 if not found.
+        """
+        for chunk_number in range(len(self.index) - 1, -1, -1):
+            if self.index[chunk_number].lap < lap:
+                return chunk_number
+        return 0
+
+    def seek_time(self, time: float) -> int:
+        """Find chunk number to start reading from record time"""
+        for chunk_number in range(len(self.index) - 1, -1, -1):
+            if self.index[chunk_number].time <= time:
+                return chunk_number
+        return 0
+
+    def frames(self, start_chunk: int = 0) -> Iterator[RecordFrame]:
+        """Decode frames starting from chunk number
+
+        State frames are only yielded from start chunk,
+        as they repeat last data of previous chunk.
+
+        Yields:
+            Recorded frame with full (non-delta) data.
+        """
+        for chunk_number, entry in enumerate(self.index[start_chunk:]):
+            yield from read_chunk(self._file, entry.offset, chunk_number == 0)
+
+
+def read_chunk(file: BinaryIO, offset: int, with_state: bool = True) -> Iterator[RecordFrame]:
+    """Decode all frames from chunk at offset
+
+    Args:
+        file: record file.
+        offset: chunk offset.
+        with_state: whether to yield state frames at chunk start.
+    """
+    file.seek(offset)
+    _, compressed_size, _, frames, _, _, _ = CHUNK_HEADER.unpack(file.read(CHUNK_HEADER.size))
+    chunk = lzma.decompress(file.read(compressed_size))
+    last_data = [b"", b"", b""]
+    prev_data = [b"", b"", b""]
+    pos = 0
+    for _ in range(frames):
+        time, flags, size = FRAME_HEADER.unpack_from(chunk, pos)
+        pos += FRAME_HEADER.size
+        buffer_id = flags & BUFFER_ID_MASK
+        data = xor_bytes(chunk[pos:pos + size], predict_bytes(
+            buffer_id, last_data[buffer_id], prev_data[buffer_id], size, flags & PARTIAL_FRAME))
+        pos += size
+        prev_data[buffer_id] = last_data[buffer_id]
+        last_data[buffer_id] = data
+        if with_state or not flags & STATE_FRAME:
+            yield RecordFrame(time, buffer_id, data)
+
+
+def load_index(file: BinaryIO) -> list[IndexEntry]:
+    """Load index from file footer, or rebuild by scanning chunk headers"""
+    file.seek(0, os.SEEK_END)
+    file_size = file.tell()
+    if file_size >= FILE_HEADER.size + FILE_FOOTER.size:
+        file.seek(file_size - FILE_FOOTER.size)
+        index_offset, tag = FILE_FOOTER.unpack(file.read(FILE_FOOTER.size))
+        if tag == FOOTER_TAG:
+            file.seek(index_offset)
+            tag, count = INDEX_HEADER.unpack(file.read(INDEX_HEADER.size))
+            if tag == INDEX_TAG:
+                return [
+                    IndexEntry(*INDEX_ENTRY.unpack(file.read(INDEX_ENTRY.size)))
+                    for _ in range(count)
+                ]
+    logger.warning("recorder: index not found, rebuilding")
+    index = []
+    offset = FILE_HEADER.size
+    while offset + CHUNK_HEADER.size <= file_size:
+        file.seek(offset)
+        tag, compressed_size, _, _, time, session_et, lap = CHUNK_HEADER.unpack(
+            file.read(CHUNK_HEADER.size))
+        next_offset = offset + CHUNK_HEADER.size + compressed_size
+        if tag != CHUNK_TAG or next_offset > file_size:
+            break  # incomplete chunk
+        index.append(IndexEntry(offset, time, session_et, lap))
+        offset = next_offset
+    return index
@@ -0,0 +1,229 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 recorded session replay
+
+Write recorded frames back into /dev/shm shared memory files,
+so unmodified shared memory readers can run against recorded data (Linux only).
+
+Run replay:
+    python -m adapter.rf2_replay record_file [speed] [lap]
+    speed: 1 = real time, N = N times faster, 0 = as fast as possible.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import sys
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+else:  # run time only
+    from pyRfactor2SharedMemory import rF2data
+
+from pyRfactor2SharedMemory.rF2MMap import linux_mmap
+
+from .rf2_recorder import (
+    BUFFER_TYPES,
+    SCORING,
+    RecordFrame,
+    RecordReader,
+    scoring_info,
+)
+
+logger = logging.getLogger(__name__)
+
+rFactor2Constants = rF2data.rFactor2Constants
+BUFFER_NAMES = (
+    rFactor2Constants.MM_SCORING_FILE_NAME,
+    rFactor2Constants.MM_TELEMETRY_FILE_NAME,
+    rFactor2Constants.MM_EXTENDED_FILE_NAME,
+)
+VERSION_BLOCK_SIZE = ctypes.sizeof(rF2data.rF2MappedBufferVersionBlock)
+
+
+class ReplayBuffer:
+    """Replay target shared memory buffer"""
+
+    __slots__ = (
+        "_mmap_buffer",
+        "data",
+    )
+
+    def __init__(self, name: str, data_struct: ctypes.Structure) -> None:
+        self._mmap_buffer = linux_mmap(name, ctypes.sizeof(data_struct))
+        self.data = data_struct.from_buffer(self._mmap_buffer)
+
+    def begin_update(self) -> None:
+        """Mark buffer as being written"""
+        data = self.data
+        data.mVersionUpdateBegin = (data.mVersionUpdateBegin + 1) & 0xFFFFFFFF
+
+    def end_update(self) -> None:
+        """Mark buffer write as done"""
+        data = self.data
+        data.mVersionUpdateEnd = data.mVersionUpdateBegin
+
+    def write(self, frame_data: bytes) -> None:
+        """Write frame data with version sequencing
+
+        Recorded version block is skipped,
+        mVersionUpdateBegin/End continue from current target version.
+        """
+        self.begin_update()
+        ctypes.memmove(
+            ctypes.addressof(self.data) + VERSION_BLOCK_SIZE,
+            frame_data[VERSION_BLOCK_SIZE:],
+            len(frame_data) - VERSION_BLOCK_SIZE,
+        )
+        self.end_update()
+
+    def close(self) -> None:
+        """Close buffer"""
+        self.data = None
+        try:
+            self._mmap_buffer.close()
+        except BufferError:
+            logger.error("replay: buffer error while closing mmap")
+
+
+class RecordPlayer:
+    """Recorded session player"""
+
+    __slots__ = (
+        "_reader",
+        "_buffers",
+        "_event",
+        "_play_thread",
+        "speed",
+        "frames_played",
+        "finished",
+    )
+
+    def __init__(self, filename: str, speed: float = 1.0) -> None:
+        """Initialize player
+
+        Args:
+            filename: record file name.
+            speed: playback speed, 1 = real time, N = N times faster, 0 = as fast as possible.
+        """
+        self._reader = RecordReader(filename)
+        self._buffers = tuple(
+            ReplayBuffer(name, data_struct)
+            for name, data_struct in zip(BUFFER_NAMES, BUFFER_TYPES)
+        )
+        self._event = threading.Event()
+        self._play_thread = None
+        self.speed = speed
+        self.frames_played = 0
+        self.finished = threading.Event()
+
+    def __del__(self):
+        logger.info("replay: GC: RecordPlayer")
+
+    def start(self, lap: int = 0) -> None:
+        """Start playing in separate thread
+
+        Args:
+            lap: seek to start of leader lap, 0 to play from beginning.
+        """
+        if self._play_thread is not None and self._play_thread.is_alive():
+            logger.warning("replay: PLAYING: already started")
+            return
+        self._event.clear()
+        self.finished.clear()
+        self._play_thread = threading.Thread(target=self.play, args=(lap,), daemon=True)
+        self._play_thread.start()
+
+    def stop(self) -> None:
+        """Stop playing, close reader & buffers"""
+        if self._play_thread is not None:
+            self._event.set()
+            self._play_thread.join()
+            self._play_thread = None
+        self._reader.close()
+        for buffer in self._buffers:
+            buffer.close()
+
+    def play(self, lap: int = 0) -> None:
+        """Play frames (blocking) until finished or stopped
+
+        Frames before seek lap are written without delay,
+        so all buffers hold consistent state when playback starts.
+
+        Args:
+            lap: seek to start of leader lap, 0 to play from beginning.
+        """
+        _event_wait = self._event.wait
+        _event_is_set = self._event.is_set
+        buffers = self._buffers
+        seeking = lap > 0
+        start_time = 0.0
+        first_frame_time = 0.0
+        logger.info("replay: PLAYING: from lap %s, speed %s", lap, self.speed)
+
+        frame: RecordFrame
+        for frame in self._reader.frames(self._reader.seek_lap(lap)):
+            if _event_is_set():
+                break
+            if seeking and frame.buffer_id == SCORING and scoring_info(frame.data)[1] >= lap:
+                seeking = False
+            if not seeking:
+                if not start_time:
+                    start_time = perf_counter()
+                    first_frame_time = frame.time
+                elif self.speed > 0:
+                    delay = (frame.time - first_frame_time) / self.speed - (perf_counter() - start_time)
+                    if delay > 0 and _event_wait(delay):
+                        break
+            buffers[frame.buffer_id].write(frame.data)
+            self.frames_played += 1
+
+        self.finished.set()
+        logger.info("replay: PLAYING: stopped, %s frames played", self.frames_played)
+
+
+def run_replay():
+    """Run replay from command line arguments"""
+    test_handler = logging.StreamHandler()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(test_handler)
+
+    if len(sys.argv) < 2:
+        print("usage: python -m adapter.rf2_replay record_file [speed] [lap]")
+        return
+    filename = sys.argv[1]
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    lap = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    player = RecordPlayer(filename, speed)
+    player.start(lap)
+    try:
+        player.finished.wait()
+    except KeyboardInterrupt:
+        pass
+    player.stop()
+
+
+if __name__ == "__main__":
+    run_replay()
@@ -29,10 +29,11 @@ from ..process.pitstop import EstimatePitTime
 from ..process.vehicle import (
     expected_usage,
     export_wheels,
+    player_ve_usage,
     steerlock_to_number,
-    stint_ve_usage,
 )
 from ..process.weather import FORECAST_DEFAULT, WeatherNode, forecast_rf2
+from .restapi_extract import SubtreeCache
 
 
 class RestAPIData:
@@ -116,6 +117,14 @@ class ResRawOutput(NamedTuple):
         setattr(output, self.name, data)
         return True
 
+    def top_keys(self) -> tuple[str, ...]:
+        """Top-level keys required by output"""
+        return self.keys[:1]
+
+    def select(self, data: Any) -> Any:
+        """Select data subtree read by output, None if not exist"""
+        return select_subtree(data, self.keys)
+
 
 class ResParOutput(NamedTuple):
     """URI resource parsed output"""
@@ -124,11 +133,26 @@ class ResParOutput(NamedTuple):
     default: Any
     parser: Callable
     keys: tuple[str, ...]
+    watch: tuple[str, ...] = ()  # top-level keys read by parser if keys is empty
 
     def reset(self, output: RestAPIData):
         """Reset data"""
         setattr(output, self.name, self.default)
 
+    def top_keys(self) -> tuple[str, ...]:
+        """Top-level keys required by output, empty if whole data is required"""
+        if self.keys:
+            return self.keys[:1]
+        return self.watch
+
+    def select(self, data: Any) -> Any:
+        """Select data subtree read by output, None if not exist"""
+        if self.keys or not self.watch:
+            return select_subtree(data, self.keys)
+        if not isinstance(data, dict):
+            return None
+        return tuple(map(data.get, self.watch))
+
     def update(self, output: RestAPIData, data: Any) -> bool:
         """Update data"""
         for key in self.keys:  # get data from dict
@@ -145,6 +169,15 @@ class ResParOutput(NamedTuple):
         return True
 
 
+def select_subtree(data: Any, keys: tuple[str, ...]) -> Any:
+    """Select data subtree from key path, None if not exist"""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
 EMPTY_KEYS: tuple[str, ...] = tuple()
 
 # Common
@@ -171,7 +204,8 @@ LMU_CURRENTSTINT = (
     ResParOutput("brakeWear", WHEELS_NA, export_wheels, ("wearables", "brakes")),
     ResParOutput("suspensionDamage", WHEELS_NA, export_wheels, ("wearables", "suspension")),
     ResRawOutput("trackClockTime", -1.0, ("sessionTime", "timeOfDay")),
-    ResParOutput("pitStopEstimate", PITEST_DEFAULT, EstimatePitTime(), EMPTY_KEYS),
+    ResParOutput("pitStopEstimate", PITEST_DEFAULT, EstimatePitTime(), EMPTY_KEYS,
+        ("pitMenu", "pitStopTimes", "fuelInfo")),
 )
 LMU_GARAGESETUP = (
     ResParOutput("steeringWheelRange", 0.0, steerlock_to_number, ("VM_STEER_LOCK", "stringValue")),
@@ -186,24 +220,26 @@ LMU_PITSTOPTIME = (
     ResRawOutput("penaltyTime", 0.0, ("penalties",)),
 )
 LMU_STINTUSAGE = (
-    ResParOutput("stintUsage", EMPTY_DICT, stint_ve_usage, EMPTY_KEYS),
+    # Whole response is driver lap history keyed by name, only changed drivers are parsed
+    ResParOutput("stintUsage", EMPTY_DICT, SubtreeCache(player_ve_usage, EMPTY_DICT), EMPTY_KEYS),
 )
 
 # Define task set
-# 0 - uri path, 1 - output set, 2 - enabling condition, 3 is repeating task, 4 minimum update interval
+# 0 - uri path, 1 - output set, 2 - enabling condition, 3 is repeating task, 4 minimum update interval,
+# 5 - scheduling priority (repeating task only, lower value runs first)
 TASKSET_RF2 = (
-    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1),
-    ("/rest/sessions/setting/SESSSET_race_timescale", RF2_TIMESCALE, "enable_session_info", False, 0.1),
-    ("/rest/sessions/setting/SESSSET_private_qual", RF2_PRIVATEQUALIFY, "enable_session_info", False, 0.1),
-    ("/rest/garage/fuel", RF2_GARAGESETUP, "enable_garage_setup_info", False, 0.1),
+    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1, 0),
+    ("/rest/sessions/setting/SESSSET_race_timescale", RF2_TIMESCALE, "enable_session_info", False, 0.1, 0),
+    ("/rest/sessions/setting/SESSSET_private_qual", RF2_PRIVATEQUALIFY, "enable_session_info", False, 0.1, 0),
+    ("/rest/garage/fuel", RF2_GARAGESETUP, "enable_garage_setup_info", False, 0.1, 0),
 )
 TASKSET_LMU = (
-    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1),
-    ("/rest/sessions", LMU_SESSIONSINFO, "enable_session_info", False, 0.1),
-    ("/rest/garage/getPlayerGarageData", LMU_GARAGESETUP, "enable_garage_setup_info", False, 0.1),
-    ("/rest/garage/UIScreen/RepairAndRefuel", LMU_CURRENTSTINT, "enable_vehicle_info", True, 0.2),
-    ("/rest/strategy/pitstop-estimate", LMU_PITSTOPTIME, "enable_vehicle_info", True, 1.0),
-    ("/rest/strategy/usage", LMU_STINTUSAGE, "enable_energy_remaining", True, 1.0),
+    ("/rest/sessions/weather", COMMON_WEATHERFORECAST, "enable_weather_info", False, 0.1, 0),
+    ("/rest/sessions", LMU_SESSIONSINFO, "enable_session_info", False, 0.1, 0),
+    ("/rest/garage/getPlayerGarageData", LMU_GARAGESETUP, "enable_garage_setup_info", False, 0.1, 0),
+    ("/rest/garage/UIScreen/RepairAndRefuel", LMU_CURRENTSTINT, "enable_vehicle_info", True, 0.2, 0),
+    ("/rest/strategy/pitstop-estimate", LMU_PITSTOPTIME, "enable_vehicle_info", True, 1.0, 1),
+    ("/rest/strategy/usage", LMU_STINTUSAGE, "enable_energy_remaining", True, 1.0, 2),
 )
 
 
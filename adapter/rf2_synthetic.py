@@ -0,0 +1,416 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 synthetic session generator
+
+Write plausible multi-car, multi-class scoring, telemetry & extended frames
+into /dev/shm shared memory files for load testing (Linux only).
+
+Scripting:
+    generator = SessionGenerator(SessionConfig(num_cars=128))
+    generator.start()  # real time producer thread
+    ...
+    generator.stop()
+
+    Or drive manually (deterministic, no thread):
+    generator.step(0.01)
+    generator.write_telemetry()
+    generator.write_scoring()
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from math import cos, sin, tau
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+else:  # run time only
+    from pyRfactor2SharedMemory import rF2data
+
+from pyRfactor2SharedMemory.rF2MMap import MAX_VEHICLES
+
+from .rf2_replay import BUFFER_NAMES, ReplayBuffer
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_VERSION = b"3.7.15.1"
+GAME_PHASE_GREEN = 5
+SESSION_RACE = 10
+PIT_STATE_NONE = 0
+PIT_STATE_STOPPED = 3
+SPEED_VARIATION = 0.3  # speed variation along lap (fraction)
+# Mean of 1 / speed is higher with speed variation, scale speed to keep lap time
+SPEED_SCALE = 1 / (1 - SPEED_VARIATION ** 2) ** 0.5
+
+
+def set_heading(ori: rF2data.rF2Vec3, angle: float) -> None:
+    """Set orientation matrix rows for driving counterclockwise at track angle
+
+    Local forward (-z) is rotated to world direction (-sin, 0, cos).
+    """
+    ori[0].x = -cos(angle)
+    ori[0].z = sin(angle)
+    ori[1].y = 1.0
+    ori[2].x = -sin(angle)
+    ori[2].z = -cos(angle)
+
+
+class VehicleClass(NamedTuple):
+    """Vehicle class"""
+
+    name: str
+    lap_time: float  # base lap time (seconds)
+    max_rpm: float = 9000.0
+
+
+class SessionConfig(NamedTuple):
+    """Synthetic session config"""
+
+    num_cars: int = 20
+    classes: tuple[VehicleClass, ...] = (
+        VehicleClass("Hypercar", 210.0, 8500.0),
+        VehicleClass("LMP2", 218.0, 9000.0),
+        VehicleClass("GT3", 232.0, 8000.0),
+    )
+    track_name: str = "Synthetic Circuit"
+    track_length: float = 13626.0  # meters
+    lap_time_spread: float = 0.02  # max per-car lap time offset (fraction)
+    pit_laps: int = 12  # laps between pit stops, 0 to disable
+    pit_time: float = 30.0  # stationary pit stop time (seconds)
+    scor_rate: float = 5.0  # scoring updates per second
+    tele_rate: float = 50.0  # telemetry updates per second
+    player_index: int = 0  # local player vehicle index, -1 for no player
+    seed: int = 0
+
+
+class SyntheticCar:
+    """Synthetic car state"""
+
+    __slots__ = (
+        "index",
+        "vehicle_class",
+        "lap_time",
+        "phase",
+        "laps",
+        "lap_dist",
+        "lap_start_et",
+        "last_lap_time",
+        "best_lap_time",
+        "speed",
+        "pit_timer",
+        "pit_stops",
+        "fuel",
+    )
+
+    def __init__(self, index: int, vehicle_class: VehicleClass, lap_time: float, phase: float) -> None:
+        self.index = index
+        self.vehicle_class = vehicle_class
+        self.lap_time = lap_time
+        self.phase = phase
+        self.laps = 0
+        self.lap_dist = 0.0
+        self.lap_start_et = 0.0
+        self.last_lap_time = -1.0
+        self.best_lap_time = -1.0
+        self.speed = 0.0
+        self.pit_timer = 0.0
+        self.pit_stops = 0
+        self.fuel = 1.0
+
+
+class SessionGenerator:
+    """Synthetic session generator"""
+
+    __slots__ = (
+        "_config",
+        "_scor",
+        "_tele",
+        "_ext",
+        "_event",
+        "_update_thread",
+        "_tele_order",
+        "cars",
+        "session_et",
+        "scor_updates",
+        "tele_updates",
+    )
+
+    def __init__(self, config: SessionConfig = SessionConfig()) -> None:
+        """Initialize generator & shared memory buffers
+
+        Args:
+            config: session config.
+        """
+        if not 0 < config.num_cars <= MAX_VEHICLES:
+            raise ValueError(f"num_cars must be within 1 to {MAX_VEHICLES}")
+        self._config = config
+        self._scor = ReplayBuffer(BUFFER_NAMES[0], rF2data.rF2Scoring)
+        self._tele = ReplayBuffer(BUFFER_NAMES[1], rF2data.rF2Telemetry)
+        self._ext = ReplayBuffer(BUFFER_NAMES[2], rF2data.rF2Extended)
+        self._event = threading.Event()
+        self._update_thread = None
+        rng = random.Random(config.seed)
+        self.cars = [
+            SyntheticCar(
+                index,
+                config.classes[index % len(config.classes)],
+                config.classes[index % len(config.classes)].lap_time
+                * (1 + rng.uniform(0, config.lap_time_spread)),
+                rng.uniform(0, tau),
+            )
+            for index in range(config.num_cars)
+        ]
+        # Grid order, telemetry order differs from scoring order (same as game)
+        for index, car in enumerate(self.cars):
+            car.lap_dist = -10.0 * index % config.track_length
+            car.laps = -1 if index else 0
+        self._tele_order = rng.sample(range(config.num_cars), config.num_cars)
+        self.session_et = 0.0
+        self.scor_updates = 0
+        self.tele_updates = 0
+        self.__init_data()
+
+    def __del__(self):
+        logger.info("synthetic: GC: SessionGenerator")
+
+    def __init_data(self) -> None:
+        """Write static session data"""
+        config = self._config
+        ext = self._ext
+        ext.begin_update()
+        ext.data.mVersion = PLUGIN_VERSION
+        ext.data.is64bit = 1
+        ext.data.mSessionStarted = 1
+        ext.data.mInRealtimeFC = 1
+        ext.end_update()
+
+        scor = self._scor
+        scor.begin_update()
+        info = scor.data.mScoringInfo
+        info.mTrackName = config.track_name.encode()
+        info.mSession = SESSION_RACE
+        info.mLapDist = config.track_length
+        info.mNumVehicles = config.num_cars
+        info.mGamePhase = GAME_PHASE_GREEN
+        info.mInRealtime = 1
+        info.mPlrFileName = b"Settings"
+        info.mPlayerName = b"Driver 1"
+        info.mEndET = 86400.0
+        for car in self.cars:
+            veh = scor.data.mVehicles[car.index]
+            veh.mID = car.index
+            veh.mDriverName = f"Driver {car.index + 1}".encode()
+            veh.mVehicleName = f"#{car.index + 1} {car.vehicle_class.name}".encode()
+            veh.mVehicleClass = car.vehicle_class.name.encode()
+            veh.mIsPlayer = car.index == config.player_index
+            veh.mControl = 0 if car.index == config.player_index else 1
+            veh.mEstimatedLapTime = car.lap_time
+        scor.end_update()
+
+        tele = self._tele
+        tele.begin_update()
+        tele.data.mNumVehicles = config.num_cars
+        for tele_index, scor_index in enumerate(self._tele_order):
+            veh = tele.data.mVehicles[tele_index]
+            veh.mID = scor_index
+            veh.mEngineMaxRPM = self.cars[scor_index].vehicle_class.max_rpm
+            veh.mMaxGears = 6
+            veh.mFuelCapacity = 100.0
+        tele.end_update()
+
+    def close(self) -> None:
+        """Stop & close shared memory buffers"""
+        self.stop()
+        self._scor.close()
+        self._tele.close()
+        self._ext.close()
+
+    def start(self) -> None:
+        """Start real time producer thread"""
+        if self._update_thread is not None:
+            logger.warning("synthetic: UPDATING: already started")
+            return
+        self._event.clear()
+        self._update_thread = threading.Thread(target=self.__update, daemon=True)
+        self._update_thread.start()
+        logger.info(
+            "synthetic: UPDATING: %s cars, scoring %sHz, telemetry %sHz",
+            self._config.num_cars, self._config.scor_rate, self._config.tele_rate,
+        )
+
+    def stop(self) -> None:
+        """Stop real time producer thread"""
+        if self._update_thread is not None:
+            self._event.set()
+            self._update_thread.join()
+            self._update_thread = None
+
+    def __update(self) -> None:
+        """Step session & write frames at configured rates"""
+        _event_wait = self._event.wait
+        tele_interval = 1 / self._config.tele_rate
+        scor_interval = 1 / self._config.scor_rate
+        last_time = next_tele = next_scor = perf_counter()
+        while True:
+            now = perf_counter()
+            if now >= next_tele:
+                self.step(now - last_time)
+                last_time = now
+                self.write_telemetry()
+                next_tele = max(next_tele + tele_interval, now)
+            if now >= next_scor:
+                self.write_scoring()
+                next_scor = max(next_scor + scor_interval, now)
+            if _event_wait(max(min(next_tele, next_scor) - perf_counter(), 0)):
+                break
+
+    def step(self, delta_time: float) -> None:
+        """Advance session time & move all cars
+
+        Args:
+            delta_time: elapsed time (seconds).
+        """
+        config = self._config
+        track_length = config.track_length
+        self.session_et += delta_time
+        session_et = self.session_et
+        for car in self.cars:
+            if car.pit_timer > 0:  # stationary in pit box
+                car.pit_timer -= delta_time
+                car.speed = 0.0
+                if car.pit_timer <= 0:
+                    car.fuel = 1.0
+                continue
+            # Speed varies along lap (straights & corners), same average speed per lap
+            average_speed = track_length / car.lap_time * SPEED_SCALE
+            car.speed = average_speed * (
+                1 + SPEED_VARIATION * sin(tau * 4 * car.lap_dist / track_length + car.phase))
+            car.lap_dist += car.speed * delta_time
+            car.fuel = max(car.fuel - delta_time / (car.lap_time * 14), 0.0)
+            if car.lap_dist < track_length:
+                continue
+            # Crossed finish line
+            car.lap_dist -= track_length
+            car.laps += 1
+            if car.laps > 0:
+                car.last_lap_time = session_et - car.lap_start_et
+                if car.best_lap_time < 0 or car.last_lap_time < car.best_lap_time:
+                    car.best_lap_time = car.last_lap_time
+            car.lap_start_et = session_et
+            if config.pit_laps > 0 and car.laps > 0 and (car.laps + car.index) % config.pit_laps == 0:
+                car.pit_timer = config.pit_time
+                car.pit_stops += 1
+
+    def write_scoring(self) -> None:
+        """Write scoring frame"""
+        config = self._config
+        track_length = config.track_length
+        radius = track_length / tau
+        scor = self._scor
+        scor.begin_update()
+        data = scor.data
+        data.mScoringInfo.mCurrentET = self.session_et
+        vehicles = data.mVehicles
+        order = sorted(self.cars, key=lambda car: car.laps + car.lap_dist / track_length, reverse=True)
+        leader_progress = order[0].laps + order[0].lap_dist / track_length
+        last_progress = leader_progress
+        for place, car in enumerate(order, 1):
+            progress = car.laps + car.lap_dist / track_length
+            angle = tau * car.lap_dist / track_length
+            veh = vehicles[car.index]
+            veh.mPlace = place
+            veh.mTotalLaps = max(car.laps, 0)
+            veh.mLapDist = car.lap_dist
+            veh.mSector = min(int(3 * car.lap_dist / track_length) + 1, 3) % 3
+            veh.mLapStartET = car.lap_start_et
+            veh.mLastLapTime = car.last_lap_time
+            veh.mBestLapTime = car.best_lap_time
+            veh.mTimeIntoLap = self.session_et - car.lap_start_et
+            veh.mNumPitstops = car.pit_stops
+            veh.mInPits = car.pit_timer > 0
+            veh.mPitState = PIT_STATE_STOPPED if car.pit_timer > 0 else PIT_STATE_NONE
+            veh.mTimeBehindLeader = (leader_progress - progress) * car.lap_time
+            veh.mLapsBehindLeader = int(leader_progress - progress)
+            veh.mTimeBehindNext = (last_progress - progress) * car.lap_time
+            veh.mLapsBehindNext = int(last_progress - progress)
+            veh.mPos.x = radius * cos(angle)
+            veh.mPos.z = radius * sin(angle)
+            set_heading(veh.mOri, angle)
+            veh.mLocalVel.z = -car.speed
+            last_progress = progress
+        scor.end_update()
+        self.scor_updates += 1
+
+    def write_telemetry(self) -> None:
+        """Write telemetry frame"""
+        config = self._config
+        track_length = config.track_length
+        radius = track_length / tau
+        session_et = self.session_et
+        tele = self._tele
+        tele.begin_update()
+        vehicles = tele.data.mVehicles
+        cars = self.cars
+        for tele_index, scor_index in enumerate(self._tele_order):
+            car = cars[scor_index]
+            angle = tau * car.lap_dist / track_length
+            speed_fraction = car.speed * car.lap_time / track_length / 1.3  # 0 - 1
+            veh = vehicles[tele_index]
+            veh.mDeltaTime = 1 / config.tele_rate
+            veh.mElapsedTime = session_et
+            veh.mLapNumber = max(car.laps, 0)
+            veh.mLapStartET = car.lap_start_et
+            veh.mPos.x = radius * cos(angle)
+            veh.mPos.z = radius * sin(angle)
+            set_heading(veh.mOri, angle)
+            veh.mLocalVel.z = -car.speed
+            veh.mGear = min(int(speed_fraction * 6) + 1, 6) if car.speed > 0 else 0
+            veh.mEngineRPM = car.vehicle_class.max_rpm * (0.6 + 0.4 * (speed_fraction * 6 % 1))
+            veh.mUnfilteredThrottle = veh.mFilteredThrottle = 1.0 if car.speed > 0 else 0.0
+            veh.mUnfilteredBrake = veh.mFilteredBrake = 0.0 if speed_fraction > 0.6 else 0.5
+            veh.mFuel = car.fuel * 100.0
+            veh.mCurrentSector = min(int(3 * car.lap_dist / track_length), 2)
+        tele.end_update()
+        self.tele_updates += 1
+
+    def run(self, duration: float, realtime: bool = False) -> None:
+        """Run session for duration (blocking)
+
+        Args:
+            duration: session time to run (seconds).
+            realtime: True to pace frames in real time, False to run as fast as possible.
+        """
+        config = self._config
+        tele_interval = 1 / config.tele_rate
+        scor_every = max(round(config.tele_rate / config.scor_rate), 1)
+        start_time = perf_counter()
+        for frame in range(round(duration * config.tele_rate)):
+            if realtime:
+                delay = frame * tele_interval - (perf_counter() - start_time)
+                if delay > 0 and self._event.wait(delay):
+                    break
+            self.step(tele_interval)
+            self.write_telemetry()
+            if frame % scor_every == 0:
+                self.write_scoring()
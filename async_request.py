@@ -22,14 +22,25 @@ Asynchronous request
 
 from __future__ import annotations
 
-from asyncio import StreamReader, open_connection, wait_for
+from asyncio import (
+    Condition,
+    Future,
+    IncompleteReadError,
+    StreamReader,
+    StreamWriter,
+    get_running_loop,
+    open_connection,
+    wait_for,
+)
 from contextlib import asynccontextmanager
-from time import perf_counter
-from typing import Awaitable
+from time import monotonic, perf_counter
+from typing import Awaitable, NamedTuple
 
 # Default limit from asyncio.open_connection is 2 ** 16
 # Lower limit to avoid getting incomplete data
 BUFFER_LIMIT = 32768  # 2 ** 15
+# Max response body size
+MAX_BODY_SIZE = 16777216  # 2 ** 24
 
 
 def set_header_get(uri: str = "/", host: str = "localhost", *headers: str) -> bytes:
@@ -39,39 +50,107 @@ def set_header_get(uri: str = "/", host: str = "localhost", *headers: str) -> by
     return f"GET {uri} HTTP/1.1\r\nHost: {host}{extra_headers}\r\n\r\n".encode()
 
 
-async def parse_response(reader: StreamReader) -> bytes:
+async def parse_response(reader: StreamReader, max_size: int = MAX_BODY_SIZE) -> bytes:
     """Parse response"""
+    return (await read_response(reader, max_size))[0]
+
+
+async def read_response(reader: StreamReader, max_size: int = MAX_BODY_SIZE) -> tuple[bytes, bool]:
+    """Read response
+
+    Args:
+        reader: stream reader positioned at start of response.
+        max_size: max body size (bytes), raise ValueError if exceeded.
+
+    Returns:
+        Body bytes, and whether connection can be reused for next request
+        (response fully read & server did not ask to close connection).
+    """
     # Get headers
     header_bytes = await reader.readuntil(b"\r\n\r\n")
     if b"200" not in header_bytes:  # check http status code
-        return b""
-    # Get non-chunked data
-    if b"chunked" not in header_bytes:
-        # Get body length
-        body_length = 0
-        pos_beg = header_bytes.find(b"Content-Length")
-        if pos_beg >= 0:
-            try:
-                pos_beg += 15  # offset
-                pos_end = header_bytes.find(b"\r\n", pos_beg)
-                body_length = int(header_bytes[pos_beg:pos_end])
-            except (AttributeError, TypeError, IndexError, ValueError):
-                body_length = 0
-        if body_length <= 0:
-            return b""
-        if body_length <= BUFFER_LIMIT:
-            return await reader.read(body_length)
-        # Exceeded buffer limit
-        temp_bytes = bytearray()
-        while body_length > 0:
-            temp_bytes.extend(await reader.read(BUFFER_LIMIT))
-            body_length -= BUFFER_LIMIT
-        return bytes(temp_bytes)
+        return b"", False  # body not read, connection not reusable
+    header_lower = header_bytes.lower()
+    keep_alive = (
+        header_bytes.startswith(b"HTTP/1.1")
+        and b"connection: close" not in header_lower
+    )
     # Get chunked data
-    temp_bytes = bytearray()
-    while (await reader.readuntil()) != b"0\r\n":  # end chunk
-        temp_bytes[-2:] = await reader.readuntil()  # cut off CRLF
-    return bytes(temp_bytes)
+    if b"chunked" in header_lower:
+        return await read_chunked(reader, max_size), keep_alive
+    # Get non-chunked data
+    body_length = -1
+    pos_beg = header_lower.find(b"\r\ncontent-length:")
+    if pos_beg >= 0:
+        pos_beg += 17  # offset
+        pos_end = header_lower.find(b"\r\n", pos_beg)
+        try:
+            body_length = int(header_lower[pos_beg:pos_end])
+        except ValueError:
+            body_length = -1
+    if body_length < 0:
+        # Body without length is delimited by connection close
+        return b"", False
+    if body_length > max_size:
+        raise ValueError(f"response body size {body_length} exceeds limit {max_size}")
+    if body_length <= BUFFER_LIMIT:
+        return await reader.readexactly(body_length), keep_alive
+    # Exceeded buffer limit, read in parts into preallocated buffer
+    buffer = bytearray(body_length)
+    with memoryview(buffer) as view:
+        await read_into(reader, view)
+    return bytes(buffer), keep_alive
+
+
+async def read_chunked(reader: StreamReader, max_size: int = MAX_BODY_SIZE) -> bytes:
+    """Read chunked body
+
+    Chunk data is read by chunk size (not by line), chunk larger than buffer limit
+    is read in parts into preallocated buffer, chunks are joined once at the end.
+    """
+    chunks = []
+    body_length = 0
+    while True:
+        size_line = await reader.readuntil(b"\r\n")
+        try:  # strip chunk extensions
+            chunk_size = int(size_line[:-2].split(b";", 1)[0], 16)
+        except ValueError:
+            raise ValueError(f"invalid chunk size line {size_line[:32]!r}") from None
+        if chunk_size < 0:
+            raise ValueError(f"invalid chunk size {chunk_size}")
+        if chunk_size == 0:  # last chunk
+            break
+        body_length += chunk_size
+        if body_length > max_size:
+            raise ValueError(f"response body size {body_length} exceeds limit {max_size}")
+        if chunk_size <= BUFFER_LIMIT:
+            chunks.append(await reader.readexactly(chunk_size))
+        else:
+            buffer = bytearray(chunk_size)
+            with memoryview(buffer) as view:
+                await read_into(reader, view)
+            chunks.append(buffer)
+        if await reader.readexactly(2) != b"\r\n":
+            raise ValueError("missing CRLF after chunk data")
+    while (await reader.readuntil(b"\r\n")) != b"\r\n":  # skip trailers until final CRLF
+        pass
+    return b"".join(chunks)
+
+
+async def read_into(reader: StreamReader, view: memoryview) -> None:
+    """Read exactly len(view) bytes into memoryview
+
+    Raises:
+        IncompleteReadError: if connection closed before all bytes received.
+    """
+    total = len(view)
+    pos = 0
+    while pos < total:
+        data = await reader.read(min(total - pos, BUFFER_LIMIT))
+        if not data:  # connection closed before full body received
+            raise IncompleteReadError(bytes(view[:pos]), total)
+        view[pos:pos + len(data)] = data
+        pos += len(data)
 
 
 @asynccontextmanager
@@ -104,6 +183,267 @@ async def https_get(request: bytes, host: str, port: int, time_out: float):
             await writer.wait_closed()
 
 
+class PoolStats(NamedTuple):
+    """Connection pool statistics"""
+
+    requests: int  # total requests sent
+    reused: int  # requests sent on existing connection
+    pipelined: int  # requests sent while previous response still pending
+    opened: int  # connections opened
+    closed: int  # connections closed (error, server close, eviction, pool close)
+    evicted: int  # connections closed by idle eviction or health check
+    errors: int  # failed requests
+    retried: int  # requests retried on new connection after stale connection error
+    connections: int  # currently open connections
+
+
+class PooledConnection:
+    """Pooled keep-alive connection
+
+    Requests are written in order, responses are read in same order,
+    each response read waits for previous response on same connection.
+    """
+
+    __slots__ = (
+        "reader",
+        "writer",
+        "pending",
+        "reusable",
+        "last_used",
+        "_last_read",
+    )
+
+    def __init__(self, reader: StreamReader, writer: StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.pending = 0  # requests in flight, reserved by pool
+        self.reusable = True
+        self.last_used = monotonic()
+        self._last_read: Future | None = None
+
+    def is_healthy(self) -> bool:
+        """Check whether connection is still open & reusable"""
+        return self.reusable and not self.writer.is_closing() and not self.reader.at_eof()
+
+    async def request(self, request: bytes) -> bytes:
+        """Send request & read response in pipeline order"""
+        prev_read = self._last_read
+        done = self._last_read = get_running_loop().create_future()
+        try:
+            self.writer.write(request)
+            await self.writer.drain()
+            if prev_read is not None:
+                await prev_read
+            if not self.reusable:  # previous response failed, stream position unknown
+                raise ConnectionResetError("pipelined connection broken")
+            body, keep_alive = await read_response(self.reader)
+            if not keep_alive:
+                self.reusable = False
+            return body
+        except BaseException:
+            self.reusable = False
+            raise
+        finally:
+            self.pending -= 1
+            self.last_used = monotonic()
+            done.set_result(None)
+            if self._last_read is done:
+                self._last_read = None
+
+    async def close(self) -> None:
+        """Close connection"""
+        self.reusable = False
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class ConnectionPool:
+    """Asynchronous HTTP/1.1 keep-alive connection pool
+
+    Connections are keyed by (host, port, ssl), and bound to running event loop,
+    create, use & close pool within same event loop.
+
+    Connection is reused if server keeps connection alive & response is fully read,
+    otherwise closed after response. Idle connections are evicted after idle timeout,
+    or if closed by server. Request on reused connection is retried once
+    on new connection if server closed connection before responding.
+
+    Args:
+        max_connections: max open connections per key.
+        max_pipeline: max requests in flight per connection (GET only), 1 to disable pipelining.
+        idle_timeout: close connection if not used for longer than idle timeout (seconds).
+    """
+
+    __slots__ = (
+        "_connections",
+        "_opening",
+        "_condition",
+        "_max_connections",
+        "_max_pipeline",
+        "_idle_timeout",
+        "_requests",
+        "_reused",
+        "_pipelined",
+        "_opened",
+        "_closed",
+        "_evicted",
+        "_errors",
+        "_retried",
+    )
+
+    def __init__(self, max_connections: int = 3, max_pipeline: int = 1, idle_timeout: float = 4.0) -> None:
+        self._connections: dict[tuple[str, int, bool], list[PooledConnection]] = {}
+        self._opening: dict[tuple[str, int, bool], int] = {}
+        self._condition = Condition()
+        self._max_connections = max(max_connections, 1)
+        self._max_pipeline = max(max_pipeline, 1)
+        self._idle_timeout = idle_timeout
+        self._requests = 0
+        self._reused = 0
+        self._pipelined = 0
+        self._opened = 0
+        self._closed = 0
+        self._evicted = 0
+        self._errors = 0
+        self._retried = 0
+
+    def stats(self) -> PoolStats:
+        """Connection pool statistics"""
+        return PoolStats(
+            requests=self._requests,
+            reused=self._reused,
+            pipelined=self._pipelined,
+            opened=self._opened,
+            closed=self._closed,
+            evicted=self._evicted,
+            errors=self._errors,
+            retried=self._retried,
+            connections=sum(map(len, self._connections.values())),
+        )
+
+    async def close(self) -> None:
+        """Close all connections"""
+        connections = [conn for pool in self._connections.values() for conn in pool]
+        self._connections.clear()
+        for conn in connections:
+            self._closed += 1
+            await conn.close()
+
+    @asynccontextmanager
+    async def http_get(self, request: bytes, host: str, port: int, time_out: float, ssl: bool = False):
+        """Async request - HTTP get response from pooled connection"""
+        yield await wait_for(self.request(request, host, port, time_out, ssl), time_out)
+
+    async def request(self, request: bytes, host: str, port: int, time_out: float, ssl: bool = False) -> bytes:
+        """Send request & get response body"""
+        key = (host, port, ssl)
+        reused = False
+        self._requests += 1
+        try:
+            conn, reused = await self.__acquire(key, request, time_out)
+            return await self.__send(key, conn, request)
+        except (ConnectionError, IncompleteReadError):
+            if not reused:
+                self._errors += 1
+                raise
+        except BaseException:
+            self._errors += 1
+            raise
+        # Server closed idle connection before request arrived, retry on new connection
+        self._retried += 1
+        conn, _ = await self.__acquire(key, request, time_out, reuse=False)
+        try:
+            return await self.__send(key, conn, request)
+        except BaseException:
+            self._errors += 1
+            raise
+
+    async def __acquire(
+        self, key: tuple[str, int, bool], request: bytes, time_out: float,
+        reuse: bool = True) -> tuple[PooledConnection, bool]:
+        """Acquire connection, reserve request slot
+
+        New connection is only opened while below max connections.
+
+        Args:
+            reuse: whether to reuse idle or pipelined connection, False to wait for new connection slot.
+
+        Returns:
+            Connection, and whether connection was reused.
+        """
+        pool = self._connections.setdefault(key, [])
+        can_pipeline = reuse and self._max_pipeline > 1 and request.startswith(b"GET ")
+        async with self._condition:
+            while True:
+                await self.__evict(pool)
+                for conn in pool if reuse else ():  # idle connection
+                    if conn.pending == 0:
+                        conn.pending += 1
+                        self._reused += 1
+                        return conn, True
+                if len(pool) + self._opening.get(key, 0) < self._max_connections:
+                    break
+                if can_pipeline:  # least busy connection
+                    conn = min(pool, key=pending_requests, default=None)
+                    if conn is not None and conn.pending < self._max_pipeline and conn.is_healthy():
+                        conn.pending += 1
+                        self._reused += 1
+                        self._pipelined += 1
+                        return conn, True
+                await self._condition.wait()
+            self._opening[key] = self._opening.get(key, 0) + 1
+        try:
+            return await self.__open(key, time_out), False
+        finally:
+            self._opening[key] -= 1
+
+    async def __open(self, key: tuple[str, int, bool], time_out: float) -> PooledConnection:
+        """Open new connection, reserve request slot"""
+        host, port, ssl = key
+        reader, writer = await wait_for(open_connection(host, port, ssl=ssl or None), time_out)
+        conn = PooledConnection(reader, writer)
+        conn.pending += 1
+        self._opened += 1
+        self._connections.setdefault(key, []).append(conn)
+        return conn
+
+    async def __send(self, key: tuple[str, int, bool], conn: PooledConnection, request: bytes) -> bytes:
+        """Send request on reserved connection, release connection after response"""
+        try:
+            return await conn.request(request)
+        finally:
+            if not conn.reusable and conn.pending == 0:
+                await self.__discard(key, conn)
+            async with self._condition:
+                self._condition.notify_all()
+
+    async def __discard(self, key: tuple[str, int, bool], conn: PooledConnection) -> None:
+        """Remove & close connection"""
+        pool = self._connections.get(key)
+        if pool is not None and conn in pool:
+            pool.remove(conn)
+            self._closed += 1
+            await conn.close()
+
+    async def __evict(self, pool: list[PooledConnection]) -> None:
+        """Close idle expired or unhealthy connections"""
+        expired_time = monotonic() - self._idle_timeout
+        for conn in tuple(pool):
+            if conn.pending == 0 and (conn.last_used < expired_time or not conn.is_healthy()):
+                pool.remove(conn)
+                self._closed += 1
+                self._evicted += 1
+                await conn.close()
+
+
+def pending_requests(conn: PooledConnection) -> int:
+    """Number of requests in flight on connection"""
+    return conn.pending
+
+
 async def get_response(request: bytes, host: str, port: int, time_out: float, ssl: bool = False) -> bytes:
     """Get response data (bytes)"""
     try:
@@ -140,7 +480,83 @@ async def _test_async_get(timeout: float):
     await asyncio.gather(*task_rf2, *task_lmu)
 
 
+def encode_response(body: bytes, chunk_sizes: list[int] | None = None, trailers: bytes = b"") -> bytes:
+    """Encode response, chunked if chunk sizes set, for test & benchmark"""
+    if chunk_sizes is None:
+        return b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+    parts = [b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"]
+    pos = 0
+    for size in chunk_sizes:
+        parts.append(b"%x;ext=1\r\n%s\r\n" % (size, body[pos:pos + size]))
+        pos += size
+    parts.append(b"0\r\n%s\r\n" % trailers)
+    return b"".join(parts)
+
+
+async def read_response_legacy(reader: StreamReader) -> bytes:
+    """Previous line based response parser, reference for line free bodies & benchmark"""
+    header_bytes = await reader.readuntil(b"\r\n\r\n")
+    if b"chunked" not in header_bytes:
+        pos_beg = header_bytes.find(b"Content-Length") + 15
+        body_length = int(header_bytes[pos_beg:header_bytes.find(b"\r\n", pos_beg)])
+        if body_length <= BUFFER_LIMIT:
+            return await reader.readexactly(body_length)
+        temp_bytes = bytearray()
+        while body_length > 0:
+            data = await reader.read(min(body_length, BUFFER_LIMIT))
+            temp_bytes.extend(data)
+            body_length -= len(data)
+        return bytes(temp_bytes)
+    temp_bytes = bytearray()
+    while (await reader.readuntil()) != b"0\r\n":
+        temp_bytes[-2:] = await reader.readuntil()
+    await reader.readuntil()
+    return bytes(temp_bytes)
+
+
+async def _benchmark_parser(sizes: tuple[int, ...], repeats: int):
+    """Benchmark response parser throughput against previous parser"""
+    from random import Random
+
+    rng = Random(0)
+    print("body size, encoding, legacy MB/s, current MB/s")
+    for size in sizes:
+        # Line free body, chunks within buffer limit for legacy parser
+        body = bytes(rng.choice(b"{}[]:,\"0a") for _ in range(1024)) * (size // 1024)
+        for chunk_size in (None, 8192):
+            chunk_sizes = None if chunk_size is None else [chunk_size] * (size // chunk_size)
+            data = encode_response(body, chunk_sizes)
+            results = []
+            for func_read in (read_response_legacy, parse_response):
+                start = perf_counter()
+                for _ in range(repeats):
+                    reader = StreamReader(limit=BUFFER_LIMIT)
+                    reader.feed_data(data)
+                    reader.feed_eof()
+                    await func_read(reader)
+                results.append(size * repeats / (perf_counter() - start) / 1048576)
+            encoding = "length" if chunk_size is None else f"chunked {chunk_size}"
+            print(f"{size:>9}, {encoding:>12}, {results[0]:10.1f}, {results[1]:10.1f}")
+
+
+def run_benchmark(sizes: tuple[int, ...] = (8192, 65536, 1048576, 8388608), repeats: int = 20):
+    """Benchmark response parser throughput against previous line based parser
+
+    Args:
+        sizes: response body sizes (bytes), multiple of 8192.
+        repeats: number of responses parsed per size & encoding.
+    """
+    import asyncio
+
+    asyncio.run(_benchmark_parser(sizes, repeats))
+
+
 if __name__ == "__main__":
     import asyncio
+    import sys
 
-    asyncio.run(_test_async_get(1))
+    # Usage: async_request.py [get|bench]
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        run_benchmark()
+    else:
+        asyncio.run(_test_async_get(1))
@@ -31,6 +31,8 @@ try:
 except ImportError:
     pass
 
+from process.trace import SectorTrace, extrapolate_lap_dist
+
 # --- CONSTANTES ---
 KELVIN_TO_CELSIUS = -273.15
 EMPTY_DICT = {}
@@ -180,6 +182,7 @@ class LMUBridgeLogic:
         self.http_session.mount('https://', HTTPAdapter(max_retries=retries))
         
         self.upload_queue = queue.Queue(maxsize=1)
+        self.trace_queue = queue.Queue()  # non bornée : traces ne doivent pas être écrasées (~3 par tour)
         self._reset_metrics()
 
     def _reset_metrics(self):
@@ -188,6 +191,7 @@ class LMUBridgeLogic:
         self.last_lap_energy_start_pct = -1.0; self.energy_history = []; self.avg_energy_consumption = 0.0
         self.last_lap_energy_consumption = 0.0; self.ema_lap_time = 0.0
         self.last_tire_wear_cumulative = [0.0] * 4; self.average_wear_per_lap = [0.0] * 4; self.lap_counter_wear = 0
+        self.sector_trace = SectorTrace()
 
     def start(self, team_id):
         if not self.sim: return
@@ -197,6 +201,9 @@ class LMUBridgeLogic:
         
         self.sender_thread = threading.Thread(target=self._sender_worker, daemon=True)
         self.sender_thread.start()
+
+        self.trace_thread = threading.Thread(target=self._trace_worker, daemon=True)
+        self.trace_thread.start()
         
         self.logic_thread = threading.Thread(target=self._loop, daemon=True)
         self.logic_thread.start()
@@ -260,6 +267,18 @@ class LMUBridgeLogic:
             max_rpm = round(float(veh_tele.mEngineMaxRPM), 0)
             water_temp = round(float(veh_tele.mEngineWaterTemp), 1)
             oil_temp = round(float(veh_tele.mEngineOilTemp), 1)
+
+            # Traces par secteur (mSector: 0 = secteur 3)
+            # mLapDist (scoring 5 Hz) avancée par la vitesse jusqu'au tick télémétrie
+            if not in_garage:
+                trace_lap_dist = extrapolate_lap_dist(
+                    float(veh_scor.mLapDist), speed_kmh / 3.6,
+                    float(veh_tele.mElapsedTime) - float(self.sim.Rf2Scor.mScoringInfo.mCurrentET),
+                    float(self.sim.Rf2Scor.mScoringInfo.mLapDist))
+                trace_data = self.sector_trace.update(
+                    current_lap, int(veh_scor.mSector) or 3, trace_lap_dist,
+                    throttle_pct, brake_pct, speed_kmh, int(veh_tele.mGear))
+                if trace_data: self._send_trace(trace_data)
             
             scor_info = self.sim.Rf2Scor.mScoringInfo
             physics = self.sim.Rf2Ext.mPhysics
@@ -377,18 +396,36 @@ class LMUBridgeLogic:
             except queue.Empty: pass
         self.upload_queue.put((col, doc, data))
 
+    def _send_trace(self, trace_data):
+        trace_data["teamId"] = self.manual_team_id
+        trace_data["sessionId"] = str(self.current_session_id)
+        session_key = re.sub(r"[^A-Za-z0-9_-]+", "-", str(self.current_session_id)).strip("-")
+        doc_id = f"{self.manual_team_id}_{session_key}_{trace_data['lap']}_{trace_data['sector']}"
+        self.trace_queue.put(("traces", doc_id, trace_data))
+
+    def _patch_document(self, collection, doc_id, data):
+        url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents/{collection}/{doc_id}"
+        fields = {k: to_firestore_value(v) for k, v in data.items()}
+        payload = {"fields": fields}
+        try: self.http_session.patch(url, params={"key": FIREBASE_API_KEY}, json=payload)
+        except Exception: pass
+
     def _sender_worker(self):
         while self.running:
             try:
                 collection, doc_id, data = self.upload_queue.get(timeout=1.0)
-                url = f"https://firestore.googleapis.com/v1/projects/{FIREBASE_PROJECT_ID}/databases/(default)/documents/{collection}/{doc_id}"
-                fields = {k: to_firestore_value(v) for k, v in data.items()}
-                payload = {"fields": fields}
-                try: self.http_session.patch(url, params={"key": FIREBASE_API_KEY}, json=payload)
-                except Exception: pass
+                self._patch_document(collection, doc_id, data)
                 self.upload_queue.task_done()
             except queue.Empty: continue
 
+    def _trace_worker(self):
+        while self.running:
+            try:
+                collection, doc_id, data = self.trace_queue.get(timeout=1.0)
+                self._patch_document(collection, doc_id, data)
+                self.trace_queue.task_done()
+            except queue.Empty: continue
+
     def _update_lap_metrics(self, current_lap, current_fuel, current_energy_pct, current_lap_time_last, current_tire_wear_cumulative):
         if self.last_lap == 0 and current_lap > 0:
             self.last_tire_wear_cumulative = current_tire_wear_cumulative
@@ -0,0 +1,218 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Input trace function
+
+Traces are sampled by lap distance at a fixed spatial resolution,
+then quantised, delta-encoded (zigzag varint), zlib-compressed
+and base64-encoded for upload.
+"""
+
+from __future__ import annotations
+
+import zlib
+from base64 import b64decode, b64encode
+from typing import Sequence
+
+TRACE_RESOLUTION = 5.0  # meters between samples
+TRACE_MAX_GAP = 100  # max missing samples to fill before restarting trace
+TRACE_CHANNELS = (  # channel name, quantisation step
+    ("throttle", 1.0),  # percent
+    ("brake", 1.0),  # percent
+    ("speed", 1.0),  # km/h
+    ("gear", 1.0),
+)
+
+
+def encode_trace(values: Sequence[float], step: float = 1.0) -> str:
+    """Encode trace values to base64 string
+
+    Args:
+        values: trace values.
+        step: quantisation step.
+
+    Returns:
+        Base64 string of zlib-compressed, delta-encoded varint bytes.
+    """
+    output = bytearray()
+    last = 0
+    for value in values:
+        quantised = round(value / step)
+        delta = quantised - last
+        last = quantised
+        zigzag = (delta << 1) if delta >= 0 else ((-delta << 1) - 1)
+        while zigzag > 0x7F:
+            output.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        output.append(zigzag)
+    return b64encode(zlib.compress(output, 9)).decode("ascii")
+
+
+def decode_trace(blob: str, step: float = 1.0) -> list[float]:
+    """Decode base64 string to trace values
+
+    Args:
+        blob: base64 string created by encode_trace.
+        step: quantisation step.
+
+    Returns:
+        Trace values (quantised).
+    """
+    raw_bytes = zlib.decompress(b64decode(blob))
+    output = []
+    last = 0
+    zigzag = 0
+    shift = 0
+    for byte in raw_bytes:
+        zigzag |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        last += (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1)
+        output.append(last * step)
+        zigzag = 0
+        shift = 0
+    return output
+
+
+def extrapolate_lap_dist(
+    lap_dist: float, speed: float, elapsed: float, track_length: float, max_time: float = 0.5) -> float:
+    """Extrapolate lap distance from last scoring update to current telemetry tick
+
+    Scoring lap distance only updates at 5Hz, advance it by speed & time elapsed
+    since scoring update, so samples can be taken at telemetry rate.
+
+    Args:
+        lap_dist: lap distance from last scoring update (meters).
+        speed: vehicle speed (m/s).
+        elapsed: time since scoring update (seconds), limited to max_time.
+        track_length: track length (meters), 0 if unknown.
+        max_time: max extrapolation time (seconds).
+
+    Returns:
+        Extrapolated lap distance (meters), not exceeding track length.
+    """
+    lap_dist += max(speed, 0.0) * min(max(elapsed, 0.0), max_time)
+    if track_length > 0:
+        return min(lap_dist, track_length)
+    return lap_dist
+
+
+def decode_sector_trace(dataset: dict) -> dict[str, list[float]]:
+    """Decode all channels from sector trace data set"""
+    return {
+        name: decode_trace(dataset[name], step)
+        for name, step in TRACE_CHANNELS
+        if name in dataset
+    }
+
+
+class SectorTrace:
+    """Sector input trace buffer
+
+    Buffer input traces indexed by lap distance,
+    output encoded trace data set when sector changed.
+
+    Attributes:
+        resolution: distance (meters) between samples.
+        lap: lap number of buffered trace.
+        sector: sector number (1-3) of buffered trace.
+        start_index: sample index of first buffered sample.
+    """
+
+    __slots__ = (
+        "resolution",
+        "lap",
+        "sector",
+        "start_index",
+        "_last_index",
+        "_samples",
+    )
+
+    def __init__(self, resolution: float = TRACE_RESOLUTION):
+        self.resolution = resolution
+        self.lap = -1
+        self.sector = -1
+        self.start_index = 0
+        self._last_index = -1
+        self._samples: tuple[list[float], ...] = tuple([] for _ in TRACE_CHANNELS)
+
+    def reset(self):
+        """Reset trace buffer"""
+        self.lap = -1
+        self.sector = -1
+        self._clear(0)
+
+    def _clear(self, start_index: int):
+        """Clear buffered samples"""
+        self.start_index = start_index
+        self._last_index = start_index - 1
+        for samples in self._samples:
+            samples.clear()
+
+    def update(self, lap: int, sector: int, lap_dist: float, *values: float) -> dict | None:
+        """Update trace buffer
+
+        Args:
+            lap: current lap number.
+            sector: current sector number (1-3).
+            lap_dist: current lap distance (meters).
+            values: channel values in TRACE_CHANNELS order.
+
+        Returns:
+            Encoded trace data set of previous sector if sector changed, otherwise None.
+        """
+        index = int(max(lap_dist, 0.0) / self.resolution)
+        output = None
+        if self.sector != sector or self.lap != lap:
+            if self.sector > 0:
+                output = self.export()
+            self.lap = lap
+            self.sector = sector
+            self._clear(index)
+
+        gap = index - self._last_index
+        if gap <= 0:  # same or earlier sample, skip
+            return output
+        if gap > TRACE_MAX_GAP:  # teleported, restart trace
+            self._clear(index)
+            gap = 1
+        for samples, value in zip(self._samples, values):
+            if gap > 1 and samples:  # fill missing samples with last value
+                samples.extend(samples[-1:] * (gap - 1))
+            samples.append(value)
+        self._last_index = index
+        return output
+
+    def export(self) -> dict | None:
+        """Export encoded trace data set, None if no sample"""
+        total_samples = len(self._samples[0])
+        if total_samples <= 0:
+            return None
+        output = {
+            "lap": self.lap,
+            "sector": self.sector,
+            "resolution": self.resolution,
+            "startDistance": round(self.start_index * self.resolution, 1),
+            "samples": total_samples,
+            "encoding": "zigzag-delta-varint+zlib+base64",
+        }
+        for (name, step), samples in zip(TRACE_CHANNELS, self._samples):
+            output[name] = encode_trace(samples, step)
+        return output
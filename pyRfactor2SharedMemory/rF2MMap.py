@@ -13,17 +13,22 @@ import ctypes
 import logging
 import mmap
 import platform
+import struct
+from time import monotonic
 
 try:
-    from . import rF2data
+    from . import rF2data, rF2dtype
     from .rF2data import rFactor2Constants
 except ImportError:  # standalone, not package
     import rF2data
+    import rF2dtype
     from rF2data import rFactor2Constants
 
 PLATFORM = platform.system()
 MAX_VEHICLES = rFactor2Constants.MAX_MAPPED_VEHICLES
 INVALID_INDEX = -1
+MAX_COPY_RETRY = 5  # max copy retries per update while buffer is being written
+unpack_int = struct.Struct("i").unpack_from
 
 
 def get_root_logger_name():
@@ -57,17 +62,63 @@ def linux_mmap(name: str, size: int) -> mmap.mmap:
     return mmap.mmap(file.fileno(), size)
 
 
+def vehicles_layout(data_struct: ctypes.Structure) -> tuple[int, int, int]:
+    """Get vehicles array layout from data structure
+
+    Args:
+        data_struct: ctypes data structure, ex. rF2data.rF2Scoring.
+
+    Returns:
+        Header size (vehicles array offset), single vehicle size, number of vehicles offset.
+        Header size is -1 if data structure has no vehicles array.
+    """
+    vehicles = getattr(data_struct, "mVehicles", None)
+    if vehicles is None:
+        return INVALID_INDEX, 0, INVALID_INDEX
+    if hasattr(data_struct, "mNumVehicles"):  # telemetry
+        num_offset = data_struct.mNumVehicles.offset
+    elif hasattr(data_struct, "mScoringInfo"):  # scoring
+        num_offset = data_struct.mScoringInfo.offset + rF2data.rF2ScoringInfo.mNumVehicles.offset
+    else:
+        return INVALID_INDEX, 0, INVALID_INDEX
+    return vehicles.offset, vehicles.size // MAX_VEHICLES, num_offset
+
+
 class MMapControl:
-    """Memory map control"""
+    """Memory map control
+
+    Attributes:
+        update: update method, copy or share buffer depends on access mode.
+        data: ctypes data structure.
+        torn_reads: number of copies discarded due to buffer changed while copying.
+        retries: number of copy attempts retried while buffer was being written.
+        focus_index: vehicle index refreshed on every update in tiered copy mode, -1 to disable.
+        field_interval: full refresh interval (seconds) in tiered copy mode, 0 to disable.
+        field_version: number of full copies (copy access mode only), None in direct access mode.
+    """
 
     __slots__ = (
         "_mmap_name",
         "_mmap_buffer",
+        "_mmap_view",
         "_struct",
         "_buffer",
+        "_buffer_view",
         "_version",
+        "_copied_version",
+        "_header_size",
+        "_vehicle_size",
+        "_num_vehicles_offset",
+        "_last_num_vehicles",
+        "_vehicles_array",
         "update",
         "data",
+        "torn_reads",
+        "retries",
+        "_field_time",
+        "focus_index",
+        "field_interval",
+        "field_version",
     )
 
     def __init__(self, mmap_name: str, data_struct: ctypes.Structure) -> None:
@@ -79,11 +130,23 @@ class MMapControl:
         """
         self._mmap_name = mmap_name
         self._mmap_buffer = None
+        self._mmap_view = None
         self._struct = data_struct
         self._buffer = bytearray()
+        self._buffer_view = None
         self._version = None
+        self._copied_version = None
+        self._header_size, self._vehicle_size, self._num_vehicles_offset = vehicles_layout(data_struct)
+        self._last_num_vehicles = MAX_VEHICLES
+        self._vehicles_array = None
         self.update = None
         self.data = None
+        self.torn_reads = 0
+        self.retries = 0
+        self._field_time = 0.0
+        self.focus_index = -1
+        self.field_interval = 0.0
+        self.field_version = None
 
     def __del__(self):
         logger.info("sharedmemory: GC: MMap %s", self._mmap_name)
@@ -100,14 +163,24 @@ class MMapControl:
             size=ctypes.sizeof(self._struct),
             pid=rf2_pid
         )
+        self._vehicles_array = None
+        self._version = rF2data.rF2MappedBufferVersionBlock.from_buffer(self._mmap_buffer)
 
         if access_mode:
             self.data = self._struct.from_buffer(self._mmap_buffer)
+            self.field_version = None
             self.update = self.__buffer_share
         else:
             self._buffer[:] = self._mmap_buffer
             self.data = self._struct.from_buffer(self._buffer)
-            self._version = rF2data.rF2MappedBufferVersionBlock.from_buffer(self._mmap_buffer)
+            self._copied_version = None
+            self._last_num_vehicles = MAX_VEHICLES
+            self._mmap_view = memoryview(self._mmap_buffer)
+            self._buffer_view = memoryview(self._buffer)
+            self.torn_reads = 0
+            self.retries = 0
+            self._field_time = 0.0
+            self.field_version = 0
             self.update = self.__buffer_copy
 
         mode = "Direct" if access_mode else "Copy"
@@ -120,6 +193,13 @@ class MMapControl:
         """
         self.data = self._struct.from_buffer_copy(self._mmap_buffer)
         self._version = None
+        self._vehicles_array = None
+        if self._mmap_view is not None:
+            self._mmap_view.release()
+            self._mmap_view = None
+        if self._buffer_view is not None:
+            self._buffer_view.release()
+            self._buffer_view = None
         try:
             self._mmap_buffer.close()
             logger.info("sharedmemory: CLOSED: %s", self._mmap_name)
@@ -127,14 +207,123 @@ class MMapControl:
             logger.error("sharedmemory: buffer error while closing %s", self._mmap_name)
         self.update = None  # unassign update method (for proper garbage collection)
 
-    def __buffer_share(self) -> None:
-        """Share buffer access, may result data desync"""
+    @property
+    def version(self) -> int | None:
+        """Source data update version (mVersionUpdateEnd), read without copying, None if closed"""
+        if self._version is None:
+            return None
+        return self._version.mVersionUpdateEnd
 
-    def __buffer_copy(self) -> None:
-        """Copy buffer access, helps avoid data desync"""
-        # Copy if data version changed
-        if self.data.mVersionUpdateEnd != self._version.mVersionUpdateEnd == self._version.mVersionUpdateBegin:
-            self._buffer[:] = self._mmap_buffer
+    @property
+    def copied_version(self) -> int | None:
+        """Data version of accessible data (last successful copy), None if not copied yet
+
+        Same as source data version in direct access mode.
+        """
+        if self.update == self.__buffer_share:
+            return self.version
+        return self._copied_version
+
+    def vehicles_array(self):
+        """Zero-copy NumPy structured array view of mVehicles (requires NumPy)
+
+        Array shares memory with accessible data (local copy in copy access mode,
+        shared memory in direct access mode), and always contains MAX_VEHICLES elements,
+        slice by number of vehicles for valid data, ex. array[:num]["mLapDist"].
+
+        Views must be released before closing mmap in direct access mode.
+
+        Returns:
+            NumPy structured array, or None if data has no vehicles array.
+        """
+        if self._vehicles_array is None and self._header_size >= 0:
+            source = self._mmap_buffer if self.update == self.__buffer_share else self._buffer
+            self._vehicles_array = rF2dtype.array_view(
+                source,
+                dict(self._struct._fields_)["mVehicles"]._type_,
+                offset=self._header_size,
+                count=MAX_VEHICLES,
+            )
+        return self._vehicles_array
+
+    def __buffer_share(self) -> bool:
+        """Share buffer access, may result data desync"""
+        return True
+
+    def __copy_size(self) -> int:
+        """Buffer copy size, header plus valid vehicles only"""
+        if self._header_size < 0:
+            return len(self._buffer)
+        num_vehicles = unpack_int(self._mmap_buffer, self._num_vehicles_offset)[0]
+        if num_vehicles < 0:
+            num_vehicles = 0
+        elif num_vehicles > MAX_VEHICLES:
+            num_vehicles = MAX_VEHICLES
+        # Also copy vehicles removed since last copy, keep them in sync with source
+        copy_vehicles = max(num_vehicles, self._last_num_vehicles)
+        self._last_num_vehicles = num_vehicles
+        return self._header_size + self._vehicle_size * copy_vehicles
+
+    def __buffer_copy(self) -> bool:
+        """Copy buffer access, helps avoid data desync
+
+        Seqlock read: copy only if data version changed and buffer is not being written,
+        then verify version again after copy, retry if buffer changed while copying.
+
+        Returns:
+            False if all copy attempts failed (buffer kept being written),
+            accessible data is unchanged.
+        """
+        version = self._version
+        if self._copied_version == version.mVersionUpdateEnd:
+            return True  # no new data
+        if (self.field_interval > 0 and self.focus_index >= 0
+                and monotonic() - self._field_time < self.field_interval
+                and self.__focus_copy()):
+            return True
+        for _ in range(MAX_COPY_RETRY):
+            version_begin = version.mVersionUpdateBegin
+            if version_begin != version.mVersionUpdateEnd:  # writing in progress
+                self.retries += 1
+                continue
+            copy_size = self.__copy_size()
+            self._buffer_view[:copy_size] = self._mmap_view[:copy_size]
+            if version_begin == version.mVersionUpdateBegin == version.mVersionUpdateEnd:
+                self._copied_version = version_begin
+                self._field_time = monotonic()
+                self.field_version += 1
+                return True
+            self.torn_reads += 1
+            self._last_num_vehicles = MAX_VEHICLES  # full resync on next attempt
+        return False
+
+    def __focus_copy(self) -> bool:
+        """Copy header plus focus vehicle only (tiered copy mode), same seqlock read
+
+        Returns:
+            False if full copy is required (number of vehicles changed, focus out of range,
+            or focus copy failed).
+        """
+        num_vehicles = unpack_int(self._mmap_buffer, self._num_vehicles_offset)[0]
+        focus_index = self.focus_index
+        if num_vehicles != self._last_num_vehicles or focus_index >= num_vehicles:
+            return False
+        version = self._version
+        header_size = self._header_size
+        start = header_size + self._vehicle_size * focus_index
+        end = start + self._vehicle_size
+        for _ in range(MAX_COPY_RETRY):
+            version_begin = version.mVersionUpdateBegin
+            if version_begin != version.mVersionUpdateEnd:  # writing in progress
+                self.retries += 1
+                continue
+            self._buffer_view[:header_size] = self._mmap_view[:header_size]
+            self._buffer_view[start:end] = self._mmap_view[start:end]
+            if version_begin == version.mVersionUpdateBegin == version.mVersionUpdateEnd:
+                self._copied_version = version_begin
+                return True
+            self.torn_reads += 1
+        return False
 
 
 def test_api():
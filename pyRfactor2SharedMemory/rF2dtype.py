@@ -0,0 +1,124 @@
+"""
+rF2 NumPy data type
+
+Generate NumPy structured dtype from rF2data ctypes structure,
+with same field offsets, packing and total size,
+for zero-copy vectorized access to shared memory buffer.
+
+NumPy is optional, dtype functions are unavailable if NumPy not installed.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # numpy not installed
+    np = None
+
+# ctypes type code to NumPy type kind
+CTYPES_KIND = {
+    "?": "b",  # c_bool
+    "b": "i",  # c_byte
+    "h": "i",  # c_short
+    "i": "i",  # c_int
+    "l": "i",  # c_long
+    "q": "i",  # c_longlong
+    "B": "u",  # c_ubyte
+    "H": "u",  # c_ushort
+    "I": "u",  # c_uint
+    "L": "u",  # c_ulong
+    "Q": "u",  # c_ulonglong
+    "f": "f",  # c_float
+    "d": "f",  # c_double
+}
+
+
+def is_numpy_available() -> bool:
+    """Check whether NumPy is installed"""
+    return np is not None
+
+
+def ctype_spec(ctype: type):
+    """Convert ctypes type to NumPy dtype specification
+
+    Args:
+        ctype: ctypes simple type, array or structure type.
+
+    Returns:
+        NumPy dtype-like specification (string, tuple or dict).
+    """
+    if issubclass(ctype, ctypes.Structure):
+        return struct_spec(ctype)
+    if issubclass(ctype, ctypes.Array):
+        element = ctype._type_
+        if element is ctypes.c_char:  # fixed size C string
+            return f"S{ctype._length_}"
+        return (ctype_spec(element), (ctype._length_,))
+    if ctype is ctypes.c_char:
+        return "S1"
+    return f"<{CTYPES_KIND[ctype._type_]}{ctypes.sizeof(ctype)}"
+
+
+@lru_cache(maxsize=None)
+def struct_spec(struct: type) -> dict:
+    """Convert ctypes structure to NumPy structured dtype specification
+
+    Args:
+        struct: ctypes structure type, ex. rF2data.rF2VehicleScoring.
+
+    Returns:
+        Dictionary with names, formats, offsets and itemsize keys.
+    """
+    names = []
+    formats = []
+    offsets = []
+    for field in struct._fields_:
+        name, ctype = field[0], field[1]
+        names.append(name)
+        formats.append(ctype_spec(ctype))
+        offsets.append(getattr(struct, name).offset)
+    return {
+        "names": names,
+        "formats": formats,
+        "offsets": offsets,
+        "itemsize": ctypes.sizeof(struct),
+    }
+
+
+@lru_cache(maxsize=None)
+def struct_dtype(struct: type):
+    """Create NumPy structured dtype from ctypes structure
+
+    Args:
+        struct: ctypes structure type, ex. rF2data.rF2VehicleScoring.
+
+    Returns:
+        NumPy structured dtype with same layout as ctypes structure.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for structured dtype")
+    dtype = np.dtype(struct_spec(struct))
+    if dtype.itemsize != ctypes.sizeof(struct):
+        raise ValueError(
+            f"dtype size {dtype.itemsize} mismatch {struct.__name__} size {ctypes.sizeof(struct)}")
+    return dtype
+
+
+def array_view(buffer, struct: type, offset: int = 0, count: int = 1):
+    """Create zero-copy NumPy array view over buffer
+
+    Args:
+        buffer: writable or read-only buffer object (bytearray, mmap).
+        struct: ctypes structure type of each element.
+        offset: byte offset of first element in buffer.
+        count: number of elements.
+
+    Returns:
+        NumPy structured array sharing memory with buffer.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for array view")
+    return np.frombuffer(buffer, dtype=struct_dtype(struct), count=count, offset=offset)
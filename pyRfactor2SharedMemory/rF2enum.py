@@ -0,0 +1,280 @@
+"""
+Python mapping of The Iron Wolf's rF2 Shared Memory Tools (enums)
+Auto-generated from rF2data.cs
+
+Imported lazily from rF2data on first access, building Enum classes
+takes longer than building all ctypes structures.
+"""
+# pylint: disable=C,R,W
+
+from enum import Enum, Flag
+
+
+class SubscribedBuffer(Flag):
+    """Subscribed buffer flag"""
+
+    Telemetry = 1
+    Scoring = 2
+    Rules = 4
+    MultiRules = 8
+    ForceFeedback = 16
+    Graphics = 32
+    PitInfo = 64
+    Weather = 128
+    All = 255
+
+
+class rF2GamePhase(Enum):
+    """
+    Game phase states
+
+    0=Before session has begun,
+    1=Reconnaissance laps (race only),
+    2=Grid walk-through (race only),
+    3=Formation lap (race only),
+    4=Starting-light countdown has begun (race only),
+    5=Green flag,
+    6=Full course yellow / safety car,
+    7=Session stopped,
+    8=Session over,
+    9=Paused (tag.2015.09.14 - this is new, and indicates that this is a heartbeat call to the plugin)
+    """
+
+    Garage = 0
+    WarmUp = 1
+    GridWalk = 2
+    Formation = 3
+    Countdown = 4
+    GreenFlag = 5
+    FullCourseYellow = 6
+    SessionStopped = 7
+    SessionOver = 8
+    PausedOrHeartbeat = 9
+
+
+class rF2YellowFlagState(Enum):
+    """
+    Yellow flag states (applies to full-course only)
+
+    -1=Invalid,
+    0=None,
+    1=Pending,
+    2=Pits closed,
+    3=Pit lead lap,
+    4=Pits open,
+    5=Last lap,
+    6=Resume,
+    7=Race halt (not currently used),
+    """
+
+    Invalid = -1
+    NoFlag = 0
+    Pending = 1
+    PitClosed = 2
+    PitLeadLap = 3
+    PitOpen = 4
+    LastLap = 5
+    Resume = 6
+    RaceHalt = 7
+
+
+class rF2SurfaceType(Enum):
+    """
+    Surface type
+
+    0=dry,
+    1=wet,
+    2=grass,
+    3=dirt,
+    4=gravel,
+    5=rumblestrip,
+    6=special
+    """
+
+    Dry = 0
+    Wet = 1
+    Grass = 2
+    Dirt = 3
+    Gravel = 4
+    Kerb = 5
+    Special = 6
+
+
+class rF2Sector(Enum):
+    """
+    Sector index
+
+    0=sector3,
+    1=sector1,
+    2=sector2 (don't ask why)
+    """
+
+    Sector3 = 0
+    Sector1 = 1
+    Sector2 = 2
+
+
+class rF2FinishStatus(Enum):
+    """Finish status
+
+    0=none,
+    1=finished,
+    2=dnf,
+    3=dq
+    """
+
+    _None = 0
+    Finished = 1
+    Dnf = 2
+    Dq = 3
+
+
+class rF2Control(Enum):
+    """
+    Who's in control
+
+    -1=nobody (shouldn't get this),
+    0=local player,
+    1=local AI,
+    2=remote,
+    3=replay (shouldn't get this)
+    """
+
+    Nobody = -1
+    Player = 0
+    AI = 1
+    Remote = 2
+    Replay = 3
+
+
+class rF2WheelIndex(Enum):
+    """Wheel index
+
+    front left=0,
+    front right=1,
+    rear left=2,
+    rear right=3
+    """
+
+    FrontLeft = 0
+    FrontRight = 1
+    RearLeft = 2
+    RearRight = 3
+
+
+class rF2PitState(Enum):
+    """Pit state
+
+    0=none,
+    1=request,
+    2=entering,
+    3=stopped,
+    4=exiting
+    """
+
+    _None = 0
+    Request = 1
+    Entering = 2
+    Stopped = 3
+    Exiting = 4
+
+
+class rF2PrimaryFlag(Enum):
+    """
+    Primary flag being shown to vehicle
+
+    0=green,
+    6=blue
+    """
+
+    Green = 0
+    Blue = 6
+
+
+class rF2CountLapFlag(Enum):
+    """Count lap flag
+
+    0=do not count lap or time,
+    1=count lap but not time,
+    2=count lap and time
+    """
+
+    DoNotCountLap = 0
+    CountLapButNotTime = 1
+    CountLapAndTime = 2
+
+
+class rF2RearFlapLegalStatus(Enum):
+    """
+    Rear flap (DRS) status
+
+    0=disallowed,
+    1=criteria detected but not allowed quite yet,
+    2=allowed
+    """
+
+    Disallowed = 0
+    DetectedButNotAllowedYet = 1
+    Alllowed = 2
+
+
+class rF2IgnitionStarterStatus(Enum):
+    """
+    Ignition starter status
+
+    0=off,
+    1=ignition,
+    2=ignition+starter
+    """
+
+    Off = 0
+    Ignition = 1
+    IgnitionAndStarter = 2
+
+
+class rF2SafetyCarInstruction(Enum):
+    """Safety car instruction
+
+    0=no change,
+    1=go active,
+    2=head for pits
+    """
+
+    NoChange = 0
+    GoActive = 1
+    HeadForPits = 2
+
+
+class rF2TrackRulesCommand(Enum):
+    AddFromTrack = 0
+    AddFromPit = 1        # exited pit during full-course yellow
+    AddFromUndq = 2       # during a full-course yellow, the admin reversed a disqualification
+    RemoveToPit = 3       # entered pit during full-course yellow
+    RemoveToDnf = 4       # vehicle DNF'd during full-course yellow
+    RemoveToDq = 5        # vehicle DQ'd during full-course yellow
+    RemoveToUnloaded = 6  # vehicle unloaded (possibly kicked out or banned) during full-course yellow
+    MoveToBack = 7        # misbehavior during full-course yellow, resulting in the penalty of being moved to the back of their current line
+    LongestTime = 8       # misbehavior during full-course yellow, resulting in the penalty of being moved to the back of the longest line
+    Maximum = 9           # should be last
+
+
+class rF2TrackRulesColumn(Enum):
+    LeftLane = 0
+    MidLefLane = 1      # mid-left
+    MiddleLane = 2      # middle
+    MidrRghtLane = 3    # mid-right
+    RightLane = 4       # right (outside)
+    MaxLanes = 5        # should be after the valid static lane choices
+    Invalid = MaxLanes
+    FreeChoice = 6      # free choice (dynamically chosen by driver)
+    Pending = 7         # depends on another participant's free choice (dynamically set after another driver chooses)
+    Maximum = 8         # should be last
+
+
+class rF2TrackRulesStage(Enum):
+    FormationInit = 0
+    FormationUpdate = 1  # update of the formation lap
+    Normal = 2           # normal (non-yellow) update
+    CautionInit = 3      # initialization of a full-course yellow
+    CautionUpdate = 4    # update of a full-course yellow
+    Maximum = 5          # should be last
@@ -4,6 +4,9 @@ and add access functions to it.
 """
 # pylint: disable=invalid-name
 
+import logging
+import threading
+
 import psutil
 
 try:
@@ -11,6 +14,8 @@ try:
 except ImportError:  # standalone, not package
     import rF2data
 
+logger = logging.getLogger(__name__)
+
 
 class SimInfoAPI(rF2data.SimInfo):
     """
@@ -27,9 +32,10 @@ class SimInfoAPI(rF2data.SimInfo):
     rf2_running = False
 
     def __init__(self):
+        self._watcher = Rf2ProcessWatcher()
         rF2data.SimInfo.__init__(self)
         self.versionCheckMsg = self.versionCheck()
-        self.__find_rf2_pid()
+        self._checkedExtVersion = self.Rf2Ext.mVersionUpdateEnd
 
     def versionCheck(self):
         """
@@ -90,17 +96,6 @@ class SimInfoAPI(rF2data.SimInfo):
         return msg
 
     ###########################################################
-    def __find_rf2_pid(self):
-        """ Find the process ID for rfactor2.exe.  Takes a while """
-        for pid in psutil.pids():
-            try:
-                p = psutil.Process(pid)
-            except psutil.NoSuchProcess:
-                continue
-            if p.name().lower().startswith('rfactor2.exe'):
-                self.rf2_pid = pid
-                break
-
     def __playersDriverNum(self):
         """ Find the player's driver number """
         for _player in range(50):  # self.Rf2Tele.mVehicles[0].mNumVehicles:
@@ -111,36 +106,29 @@ class SimInfoAPI(rF2data.SimInfo):
     ###########################################################
     # Access functions
 
-    def isRF2running(self, find_counter=200, found_counter=5):
+    def isRF2running(self, find_counter=200, found_counter=5):  # pylint: disable=unused-argument
         """
-        Both "rFactor 2 Launcher" and "rf2" processes are found
-        whether it's the launcher or the game that's running BUT
-        rfactor2.exe is only present if the game is running.
-        Beacuse this takes some time, control how often it's checked using:
-        find_counter: how often to check if rF2 is not running
-        found_counter: how often to check once rF2 is running
+        Cheap liveness check, a couple of attribute reads per call.
+        Verified shared memory means running (rF2 or LMU, paused or not).
+        Version string is validated again only when the plugin rewrites
+        the extended buffer (plugin loaded or game restarted).
+        Without verified shared memory, fall back to the background
+        process watcher ("rfactor2.exe" or "Le Mans Ultimate.exe"
+        is only present if the game is running).
+        find_counter, found_counter: no longer used, process discovery
+        runs in background thread (see Rf2ProcessWatcher)
         """
-        if self.rf2_pid_counter == 0:  # first time
-            self.rf2_pid_counter = find_counter
-        if self.isSharedMemoryAvailable():
-            # No need to check if Shared Memory is OK!
+        ext_version = self.Rf2Ext.mVersionUpdateEnd
+        if ext_version != self._checkedExtVersion:
+            self._checkedExtVersion = ext_version
+            self.versionCheckMsg = self.versionCheck()
+        if self.sharedMemoryVerified:
+            self._watcher.stop(wait=False)  # no process scan needed, don't wait scan
             self.rf2_running = True
-        elif self.rf2_pid:
-            if self.rf2_pid_counter >= found_counter:
-                self.rf2_pid_counter = 0
-                try:
-                    p = psutil.Process(self.rf2_pid)
-                except psutil.NoSuchProcess:
-                    self.rf2_pid = None
-                    return False
-                if p.name().lower().startswith('rfactor2.exe'):
-                    self.rf2_running = True
         else:
-            if self.rf2_pid_counter >= find_counter:
-                self.rf2_pid_counter = 0
-                self.__find_rf2_pid()
-                self.rf2_running = False
-        self.rf2_pid_counter += 1
+            self._watcher.start()
+            self.rf2_running = self._watcher.is_running()
+            self.rf2_pid = self._watcher.pid
         return self.rf2_running
 
     def isSharedMemoryAvailable(self):
@@ -199,6 +187,7 @@ class SimInfoAPI(rF2data.SimInfo):
             self.Rf2Scor.mVehicles[self.__playersDriverNum()].mVehicleName)
 
     def close(self):
+        self._watcher.stop()
         # This didn't help with the errors
         try:
             self._rf2_tele.close()
@@ -211,6 +200,71 @@ class SimInfoAPI(rF2data.SimInfo):
         self.close()
 
 
+class Rf2ProcessWatcher:
+    """
+    Find game process ID in a low rate background thread,
+    psutil process scanning takes a while.
+    Scanning stops once the game process is found.
+    """
+    processNames = ('rfactor2.exe', 'le mans ultimate.exe')
+
+    def __init__(self, find_interval=5.0):
+        self.find_interval = find_interval      # Seconds between scans
+        self.pid = None
+        self._event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """ Start watcher thread if not scanning & game not found """
+        if self.pid is None and (self._thread is None or not self._thread.is_alive()):
+            self._event.clear()
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+
+    def stop(self, wait=True):
+        """ Stop watcher thread, wait=False to signal only (in-progress scan finishes on its own) """
+        if self._thread is not None:
+            self._event.set()
+            if wait:
+                self._thread.join()
+                self._thread = None
+
+    def is_running(self):
+        """ Whether found game process still exists, scan again if closed """
+        if self.pid is None:
+            return False
+        if psutil.pid_exists(self.pid):
+            return True
+        logger.info("sharedmemory: game process %s closed", self.pid)
+        self.pid = None
+        self.start()
+        return False
+
+    def _watch(self):
+        interval = 0  # first scan immediately
+        while not self._event.wait(interval):
+            pid = self._find_rf2_pid()
+            if pid is not None:
+                logger.info("sharedmemory: game process found, pid %s", pid)
+                self.pid = pid
+                break
+            interval = self.find_interval
+
+    @classmethod
+    def _is_rf2(cls, pid):
+        try:
+            return psutil.Process(pid).name().lower().startswith(cls.processNames)
+        except psutil.Error:
+            return False
+
+    def _find_rf2_pid(self):
+        """ Find the process ID for rfactor2.exe or LMU.  Takes a while """
+        for pid in psutil.pids():
+            if self._is_rf2(pid):
+                return pid
+        return None
+
+
 def Cbytestring2Python(bytestring):
     """
     C string to Python string
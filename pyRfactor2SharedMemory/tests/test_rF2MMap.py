@@ -0,0 +1,117 @@
+import ctypes
+import os
+import unittest
+
+import rF2data
+import rF2dtype
+from rF2MMap import MAX_VEHICLES, MMapControl, linux_mmap
+
+TEST_SCORING_NAME = 'test_rF2MMap_Scoring'
+
+
+class Test_MMapControl(unittest.TestCase):
+    def setUp(self):
+        self.source = linux_mmap(TEST_SCORING_NAME, ctypes.sizeof(rF2data.rF2Scoring))
+        self.writer = rF2data.rF2Scoring.from_buffer(self.source)
+        self.scoring = MMapControl(TEST_SCORING_NAME, rF2data.rF2Scoring)
+        self.scoring.create(0)
+
+    def tearDown(self):
+        self.scoring.close()
+        del self.writer
+        self.source.close()
+        os.remove('/dev/shm/' + TEST_SCORING_NAME)
+
+    def write_frame(self, num_vehicles, lap_dist):
+        self.writer.mVersionUpdateBegin += 1
+        self.writer.mScoringInfo.mNumVehicles = num_vehicles
+        for index in range(MAX_VEHICLES):
+            self.writer.mVehicles[index].mLapDist = lap_dist
+        self.writer.mVersionUpdateEnd += 1
+
+    def test_copy_valid_vehicles_only(self):
+        self.write_frame(2, 100.0)
+        self.scoring.update()
+        self.write_frame(2, 200.0)
+        self.scoring.update()
+        assert self.scoring.data.mScoringInfo.mNumVehicles == 2
+        assert self.scoring.data.mVehicles[1].mLapDist == 200.0
+        assert self.scoring.data.mVehicles[2].mLapDist == 100.0
+
+    def test_copy_removed_vehicles_once(self):
+        self.write_frame(4, 100.0)
+        self.scoring.update()
+        self.write_frame(2, 200.0)
+        self.scoring.update()
+        assert self.scoring.data.mVehicles[3].mLapDist == 200.0
+        self.write_frame(2, 300.0)
+        self.scoring.update()
+        assert self.scoring.data.mVehicles[1].mLapDist == 300.0
+        assert self.scoring.data.mVehicles[3].mLapDist == 200.0
+
+    def test_skip_while_writing(self):
+        self.write_frame(2, 100.0)
+        self.scoring.update()
+        self.write_frame(2, 100.0)
+        self.writer.mVersionUpdateBegin += 1
+        self.writer.mVehicles[0].mLapDist = 200.0
+        copied_version = self.scoring.copied_version
+        assert self.scoring.update() is False
+        assert self.scoring.data.mVehicles[0].mLapDist == 100.0
+        assert self.scoring.copied_version == copied_version
+        assert self.scoring.retries > 0
+        self.writer.mVersionUpdateEnd += 1
+        assert self.scoring.update() is True
+        assert self.scoring.copied_version == self.writer.mVersionUpdateEnd
+        assert self.scoring.data.mVehicles[0].mLapDist == 200.0
+        assert self.scoring.data.mVersionUpdateEnd == self.writer.mVersionUpdateEnd
+        assert self.scoring.torn_reads == 0
+
+    def test_tiered_copy_focus_vehicle_only(self):
+        self.write_frame(3, 100.0)
+        self.scoring.update()
+        self.scoring.focus_index = 1
+        self.scoring.field_interval = 60.0
+        self.write_frame(3, 200.0)
+        self.scoring.update()
+        assert self.scoring.data.mVehicles[1].mLapDist == 200.0
+        assert self.scoring.data.mVehicles[0].mLapDist == 100.0
+        assert self.scoring.data.mVersionUpdateEnd == self.writer.mVersionUpdateEnd
+        assert self.scoring.field_version == 1
+        self.write_frame(4, 300.0)  # vehicle joined, full copy
+        self.scoring.update()
+        assert self.scoring.data.mVehicles[0].mLapDist == 300.0
+        assert self.scoring.field_version == 2
+
+    @unittest.skipUnless(rF2dtype.is_numpy_available(), 'NumPy not installed')
+    def test_vehicles_array(self):
+        for struct in (rF2data.rF2Scoring, rF2data.rF2Telemetry, rF2data.rF2Extended):
+            assert rF2dtype.struct_dtype(struct).itemsize == ctypes.sizeof(struct)
+        vehicles = self.scoring.vehicles_array()
+        self.writer.mVehicles[1].mPlace = 2
+        self.write_frame(3, 100.0)
+        self.scoring.update()
+        assert vehicles[:3]['mLapDist'].tolist() == [100.0, 100.0, 100.0]
+        assert vehicles[1]['mPlace'] == 2
+        del vehicles
+
+    def test_version_after_close(self):
+        self.write_frame(2, 100.0)
+        assert self.scoring.version == self.writer.mVersionUpdateEnd
+        control = MMapControl(TEST_SCORING_NAME, rF2data.rF2Scoring)
+        control.create(0)
+        control.close()
+        assert control.version is None
+
+    def test_array_view_without_numpy(self):
+        numpy_module = rF2dtype.np
+        rF2dtype.np = None
+        try:
+            with self.assertRaises(ImportError):
+                rF2dtype.array_view(bytearray(ctypes.sizeof(rF2data.rF2Scoring)), rF2data.rF2Scoring)
+        finally:
+            rF2dtype.np = numpy_module
+
+
+if __name__ == '__main__':
+    unittest.main(exit=False)
@@ -1,6 +1,8 @@
+import os
+import time
 import unittest
 
-from sharedMemoryAPI import test_main, SimInfoAPI, Cbytestring2Python
+from sharedMemoryAPI import test_main, SimInfoAPI, Cbytestring2Python, Rf2ProcessWatcher
 
 VERSION_STRING = '3.6.0.0     '
 TRACK_NAME = 'Test Track'
@@ -50,6 +52,44 @@ class Test_sharedMemoryAPI(unittest.TestCase):
         info.Rf2Ext.mInRealtimeFC = 1
         assert info.isOnTrack()
 
+    def test_is_rf2_running_watches_updates(self):
+        info = SimInfoAPI()
+        x = bytearray(VERSION_STRING, 'utf-8')
+        for i, ch in enumerate(x):
+            info.Rf2Ext.mVersion[i] = ch
+        info.Rf2Ext.is64bit = 1
+        info.Rf2Ext.mVersionUpdateEnd += 1  # plugin rewrote extended buffer
+        info.Rf2Scor.mVersionUpdateEnd += 1
+        assert info.isRF2running()
+        assert info.sharedMemoryVerified
+        assert info.isRF2running()  # no update (paused), still running
+        info.close()
+
+    def test_process_watcher(self):
+        watcher = Rf2ProcessWatcher()
+        assert not watcher.is_running()
+        watcher.pid = os.getpid()
+        assert watcher.is_running()
+        watcher.start()  # game already found, no scan
+        assert watcher._thread is None
+        watcher.stop()
+
+    def test_process_watcher_stop_without_wait(self):
+        class SlowWatcher(Rf2ProcessWatcher):
+            def _find_rf2_pid(self):
+                time.sleep(0.3)  # slow process scan
+                return None
+
+        watcher = SlowWatcher()
+        watcher.start()
+        start = time.perf_counter()
+        watcher.stop(wait=False)
+        assert time.perf_counter() - start < 0.1
+        watcher.start()  # scan still in progress, no new thread
+        watcher.stop()  # join
+        assert time.perf_counter() - start >= 0.2
+        assert watcher._thread is None
+
 
 if __name__ == '__main__':
     unittest.main(exit=False)
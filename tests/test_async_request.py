@@ -0,0 +1,249 @@
+import asyncio
+import json
+import random
+import unittest
+from asyncio import IncompleteReadError, StreamReader
+
+from adapter.restapi_mock import MockConfig, MockServer
+from async_request import (
+    BUFFER_LIMIT,
+    ConnectionPool,
+    encode_response,
+    parse_response,
+    read_response,
+    read_response_legacy,
+    set_header_get,
+)
+
+RESPONSE_OK = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+PITSTOP_ESTIMATE = "/rest/strategy/pitstop-estimate"
+
+
+async def feed_reader(data, rng, max_fragment):
+    """Stream reader fed with randomly fragmented data"""
+    reader = StreamReader(limit=BUFFER_LIMIT)
+
+    async def feeder():
+        pos = 0
+        while pos < len(data):
+            size = rng.randint(1, max_fragment)
+            reader.feed_data(data[pos:pos + size])
+            pos += size
+            await asyncio.sleep(0)
+        reader.feed_eof()
+
+    asyncio.get_running_loop().create_task(feeder())
+    return reader
+
+
+class Test_ResponseParser(unittest.TestCase):
+    def test_random_responses(self):
+        """Random bodies, chunking, fragmentation, truncation & keep-alive follow-up"""
+        rng = random.Random(0)
+        failed = []
+
+        async def run():
+            for index in range(500):
+                size = rng.choice((0, 1, 2, rng.randint(0, 100), rng.randint(0, BUFFER_LIMIT * 3)))
+                body = bytes(rng.choice(b"{}[]:,\"0a\r\n") for _ in range(size))
+                chunk_sizes = None
+                if rng.random() < 0.5:
+                    chunk_sizes = []
+                    remaining = size
+                    while remaining > 0:
+                        chunk_sizes.append(min(rng.randint(1, BUFFER_LIMIT * 2), remaining))
+                        remaining -= chunk_sizes[-1]
+                trailers = b"X-Trailer: 1\r\n" if rng.random() < 0.2 else b""
+                data = encode_response(body, chunk_sizes, trailers)
+                next_body = b"next%d" % index
+                if size < 1000:
+                    max_fragment = rng.choice((1, 7, 1000, len(data) + 1))
+                else:
+                    max_fragment = rng.choice((1000, 40000))
+                truncate = rng.random() < 0.2 and len(data) > 1
+                if truncate:  # connection closed early
+                    data = data[:rng.randint(0, len(data) - 1)]
+                else:  # followed by next response on keep-alive connection
+                    data += encode_response(next_body, [len(next_body)] if chunk_sizes else None)
+                reader = await feed_reader(data, rng, max_fragment)
+                try:
+                    result, keep_alive = await read_response(reader)
+                    ok = (
+                        not truncate
+                        and result == body
+                        and keep_alive
+                        and await parse_response(reader) == next_body
+                    )
+                except IncompleteReadError:
+                    ok = truncate
+                if not ok:
+                    failed.append((index, size, chunk_sizes, truncate))
+
+        asyncio.run(run())
+        assert not failed, failed
+
+    def test_newline_in_chunk(self):
+        async def run():
+            reader = await feed_reader(encode_response(b"a\r\nb\n", [3, 2]), random.Random(0), 4)
+            return await parse_response(reader)
+
+        assert asyncio.run(run()) == b"a\r\nb\n"
+
+    def test_size_limit(self):
+        async def run():
+            data = encode_response(b"0" * 1000, [600, 400])
+            reader = await feed_reader(data, random.Random(0), 1000)
+            await read_response(reader, 999)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+    def test_same_as_legacy_parser(self):
+        rng = random.Random(0)
+
+        async def run(data, func_read):
+            reader = StreamReader(limit=BUFFER_LIMIT)
+            reader.feed_data(data)
+            reader.feed_eof()
+            return await func_read(reader)
+
+        for size in (0, 100, BUFFER_LIMIT, BUFFER_LIMIT + 1, BUFFER_LIMIT * 5):
+            body = bytes(rng.choice(b"{}[]:,\"0a") for _ in range(size))
+            data = encode_response(body)
+            assert asyncio.run(run(data, parse_response)) == asyncio.run(run(data, read_response_legacy))
+
+
+class Test_ConnectionPool(unittest.TestCase):
+    def test_retry_within_max_connections(self):
+        """Retry after stale connection must not exceed max connections"""
+        active = 0
+        max_active = 0
+        connections = 0
+
+        async def handle(reader, writer):
+            nonlocal active, max_active, connections
+            connections += 1
+            first_connection = connections == 1
+            active += 1
+            max_active = max(max_active, active)
+            requests = 0
+            try:
+                while True:
+                    await reader.readuntil(b"\r\n\r\n")
+                    requests += 1
+                    if first_connection and requests > 1:
+                        break  # server closed idle connection
+                    writer.write(RESPONSE_OK)
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            active -= 1
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            pool = ConnectionPool(max_connections=1)
+            request = set_header_get("/", "127.0.0.1")
+            try:
+                assert await pool.request(request, "127.0.0.1", port, 2.0) == b"ok"
+                results = await asyncio.gather(
+                    pool.request(request, "127.0.0.1", port, 2.0),
+                    pool.request(request, "127.0.0.1", port, 2.0),
+                )
+            finally:
+                await pool.close()
+                server.close()
+                await server.wait_closed()
+            return results, pool.stats()
+
+        results, stats = asyncio.run(run())
+        assert results == [b"ok", b"ok"]
+        assert stats.retried == 1
+        assert max_active == 1
+
+
+    def request_mock(self, server, count, concurrent=False, **pool_config):
+        """Send requests to mock server from new pool, return results & pool stats"""
+        request = set_header_get(PITSTOP_ESTIMATE, "127.0.0.1")
+
+        async def send(pool):
+            try:
+                return await pool.request(request, "127.0.0.1", server.port, 2.0)
+            except (ConnectionError, IncompleteReadError) as error:
+                return type(error)
+
+        async def run():
+            pool = ConnectionPool(**pool_config)
+            try:
+                if concurrent:
+                    results = await asyncio.gather(*(send(pool) for _ in range(count)))
+                else:
+                    results = [await send(pool) for _ in range(count)]
+            finally:
+                await pool.close()
+            return results, pool.stats()
+
+        server.start()
+        try:
+            return asyncio.run(run())
+        finally:
+            server.stop()
+
+    def test_mock_keep_alive(self):
+        server = MockServer()
+        body = json.dumps(server.fixtures[PITSTOP_ESTIMATE], separators=(",", ":")).encode()
+        results, stats = self.request_mock(server, 5)
+        assert results == [body] * 5
+        assert stats.opened == 1
+        assert stats.reused == 4
+
+    def test_mock_no_keep_alive(self):
+        results, stats = self.request_mock(MockServer(config=MockConfig(keep_alive=False)), 3)
+        assert len(set(results)) == 1
+        assert stats.opened == 3
+        assert stats.errors == 0
+
+    def test_mock_error_not_reused(self):
+        results, stats = self.request_mock(MockServer(config=MockConfig(error_rate=1.0)), 3)
+        assert results == [b""] * 3  # body not read after status 500
+        assert stats.opened == 3
+        assert stats.reused == 0
+
+    def test_mock_dropped(self):
+        results, stats = self.request_mock(MockServer(config=MockConfig(drop_rate=1.0)), 2)
+        assert results == [IncompleteReadError] * 2
+        assert stats.errors == 2
+        assert stats.retried == 0  # not retried on new connection
+
+    def test_mock_pipeline_chunked(self):
+        server = MockServer(config=MockConfig(chunked=True, chunk_size=8, latency=0.02))
+        results, stats = self.request_mock(
+            server, 6, concurrent=True, max_connections=2, max_pipeline=3)
+        assert len(results) == 6
+        assert len(set(results)) == 1
+        assert stats.opened <= 2
+        assert stats.pipelined > 0
+        assert stats.errors == 0
+
+    def test_mock_slow_timeout(self):
+        server = MockServer(config=MockConfig(slow_rate=1.0, slow_delay=0.5))
+        request = set_header_get(PITSTOP_ESTIMATE, "127.0.0.1")
+
+        async def run():
+            pool = ConnectionPool()
+            try:
+                async with pool.http_get(request, "127.0.0.1", server.port, 0.1):
+                    pass
+            finally:
+                await pool.close()
+
+        server.start()
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(run())
+        finally:
+            server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import json
+import random
+import unittest
+
+from adapter.restapi_extract import (
+    MIN_EXTRACT_SIZE,
+    JsonExtractor,
+    decode_json,
+    extract_keys,
+    nesting_depth,
+)
+
+TRICKY_STRINGS = (
+    "",
+    "plain",
+    '"quoted"',
+    "back\\slash",
+    "ends with backslash\\",
+    '\\"',
+    "{[brackets]}",
+    "]}",
+    '"speed": 1',
+    '{"speed": [1, 2]}',
+    "tab\tnew\nline",
+    "unicode \u00e9",
+)
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(7 if depth < 3 else 4)
+    if kind == 0:
+        return rng.choice(TRICKY_STRINGS)
+    if kind == 1:
+        return rng.uniform(-1e6, 1e6)
+    if kind == 2:
+        return rng.choice((True, False, None))
+    if kind == 3:
+        return rng.randrange(-1000, 1000)
+    if kind == 4:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    keys = ("speed", "name", "value", "nested", rng.choice(TRICKY_STRINGS))
+    return {key: random_value(rng, depth + 1) for key in rng.sample(keys, rng.randrange(len(keys)))}
+
+
+class Test_JsonExtractor(unittest.TestCase):
+    def extract(self, data, keys, **kwargs):
+        return JsonExtractor(keys).extract(json.dumps(data, **kwargs).encode())
+
+    def test_nesting_depth(self):
+        assert nesting_depth(b'{"a": [1, {') == 3
+        assert nesting_depth(b'"{[", "]}"') == 0
+        assert nesting_depth(b'"escaped \\" {", }') == -1
+        assert nesting_depth(b'"backslash \\\\", [') == 1
+        assert nesting_depth(b'"open string {') is None
+
+    def test_extract_top_level_only(self):
+        data = {
+            "nested": {"speed": 1, "name": "inner"},
+            "list": [{"speed": 2}],
+            "speed": 3,
+            "name": "outer",
+        }
+        assert self.extract(data, ("speed", "name")) == {"speed": 3, "name": "outer"}
+
+    def test_key_inside_string(self):
+        data = {"text": '"speed": 1, {"speed": 2}', "speed": 3}
+        assert self.extract(data, ("speed",)) == {"speed": 3}
+
+    def test_escaped_strings(self):
+        data = {"a": 'quote \\" {', "b": "backslash \\", "c": '\\"]}', "speed": [1, "}"]}
+        assert self.extract(data, ("speed", "b")) == {"speed": [1, "}"], "b": "backslash \\"}
+
+    def test_whitespace_and_missing_key(self):
+        raw = b' \n{ "other" : [ 1 ] ,\n "speed"\t:\n {"x": 1} }'
+        assert JsonExtractor(("speed", "missing")).extract(raw) == {"speed": {"x": 1}}
+
+    def test_duplicate_key_first_match(self):
+        raw = b'{"speed": 1, "speed": 2}'
+        assert JsonExtractor(("speed",)).extract(raw) == {"speed": 1}
+
+    def test_not_extractable(self):
+        extractor = JsonExtractor(("speed",))
+        assert extractor.extract(b'[{"speed": 1}]') is None
+        assert extractor.extract('{"name": "\u00e9", "speed": 1}'.encode()) is None
+        with self.assertRaises(ValueError):
+            extractor.extract(b'{"speed": nope}')
+
+    def test_random_documents(self):
+        rng = random.Random(0)
+        keys = ("speed", "name", "value", "nested")
+        extractor = JsonExtractor(keys)
+        for _ in range(500):
+            data = {key: random_value(rng) for key in rng.sample(keys + TRICKY_STRINGS, 6)}
+            raw = json.dumps(data, indent=rng.choice((None, 1))).encode()
+            expected = {key: data[key] for key in keys if key in data}
+            assert extractor.extract(raw) == expected, raw
+
+    def test_extract_keys(self):
+        assert extract_keys([("a",), ()]) is None  # output requires whole object
+        assert extract_keys([]) is None
+        assert extract_keys([("a", "b"), ("b",)]).keys == ("a", "b")
+
+    def test_decode_json(self):
+        extractor = JsonExtractor(("speed",))
+        small = b'{"speed": 1, "name": "x"}'
+        assert decode_json(small, extractor) == {"speed": 1, "name": "x"}  # full decode
+        large = json.dumps({"pad": "x" * MIN_EXTRACT_SIZE, "speed": 1}).encode()
+        assert decode_json(large, extractor) == {"speed": 1}
+        assert decode_json(large) == {"pad": "x" * MIN_EXTRACT_SIZE, "speed": 1}
+        top_list = json.dumps(["x" * MIN_EXTRACT_SIZE]).encode()
+        assert decode_json(top_list, extractor) == ["x" * MIN_EXTRACT_SIZE]  # fall back
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+
+from adapter.restapi_extract import OutputFilter, SubtreeCache
+
+
+class FakeOutput(NamedTuple):
+    """Output reading data subtree at key path, same as ResRawOutput"""
+
+    name: str
+    keys: tuple[str, ...]
+
+    def select(self, data: Any) -> Any:
+        for key in self.keys:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
+    def update(self, output, data: Any) -> None:
+        setattr(output, self.name, self.select(data))
+        output.updates.append(self.name)
+
+
+class Test_OutputFilter(unittest.TestCase):
+    def setUp(self):
+        self.dataset = SimpleNamespace(updates=[])
+        self.filter = OutputFilter((
+            FakeOutput("fuel", ("car", "fuel")),
+            FakeOutput("track", ("track",)),
+        ))
+
+    def update(self, data):
+        self.dataset.updates.clear()
+        self.filter.update(self.dataset, data)
+        return self.dataset.updates
+
+    def test_first_update_parses_all(self):
+        assert self.update({"car": {"fuel": 10}, "track": "Le Mans"}) == ["fuel", "track"]
+        assert self.dataset.fuel == 10
+        assert tuple(self.filter.stats()) == (2, 0)
+
+    def test_missing_subtree_parsed_once(self):
+        assert self.update({}) == ["fuel", "track"]  # MISSING never equals None
+        assert self.dataset.fuel is None
+        assert self.update({}) == []
+
+    def test_only_changed_subtree(self):
+        self.update({"car": {"fuel": 10}, "track": "Le Mans"})
+        assert self.update({"car": {"fuel": 9}, "track": "Le Mans"}) == ["fuel"]
+        assert self.update({"car": {"fuel": 9, "tyre": 1}, "track": "Spa"}) == ["track"]
+        assert self.update({"car": {"fuel": 9}, "track": "Spa"}) == []
+        stats = self.filter.stats()
+        assert stats.parsed == 4
+        assert stats.skipped == 4
+
+    def test_nested_change(self):
+        self.filter = OutputFilter((FakeOutput("car", ("car",)),))
+        self.update({"car": {"wheels": [1, 2, 3, 4]}})
+        assert self.update({"car": {"wheels": [1, 2, 3, 4]}}) == []
+        assert self.update({"car": {"wheels": [1, 2, 3, 5]}}) == ["car"]
+        assert self.update({"car": None}) == ["car"]
+
+
+class Test_SubtreeCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.cache = SubtreeCache(self.parse, {})
+
+    def parse(self, subtree):
+        self.calls.append(subtree)
+        return len(subtree)
+
+    def test_parse_changed_key_only(self):
+        assert self.cache({"a": [1], "b": [1, 2]}) == {"a": 1, "b": 2}
+        assert self.cache.parsed == 2
+        assert self.cache({"a": [1], "b": [1, 2, 3]}) == {"a": 1, "b": 3}
+        assert self.calls[-1] == [1, 2, 3]
+        assert self.cache.parsed == 3
+        assert self.cache.skipped == 1
+
+    def test_removed_key_dropped(self):
+        self.cache({"a": [1], "b": [1, 2]})
+        assert self.cache({"b": [1, 2]}) == {"b": 2}
+        assert self.cache({"a": [1], "b": [1, 2]}) == {"a": 1, "b": 2}
+        assert self.calls == [[1], [1, 2], [1]]  # "a" parsed again after removal
+
+    def test_invalid_data(self):
+        self.cache({"a": [1]})
+        assert self.cache(None) == {}
+        assert self.cache({}) == {}
+        assert self.cache("bad") == {}
+        self.cache({"a": [1]})
+        assert self.cache.parsed == 2  # cache reset by invalid data
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from adapter.restapi_metrics import EndpointMetrics, percentile
+
+
+class Test_EndpointMetrics(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        values = [float(value) for value in range(1, 11)]
+        assert percentile([], 0.5) == 0.0
+        assert percentile([3.0], 0.99) == 3.0
+        assert percentile(values, 0.0) == 1.0
+        assert percentile(values, 0.5) == 5.0
+        assert percentile(values, 0.51) == 6.0
+        assert percentile(values, 0.9) == 9.0
+        assert percentile(values, 0.99) == 10.0
+        assert percentile(values, 1.0) == 10.0
+
+    def test_empty_snapshot(self):
+        stats = EndpointMetrics().snapshot()
+        assert stats.requests == 0
+        assert stats.unchanged_ratio == 0.0
+        assert stats.latency_p50 == stats.latency_max == 0.0
+        assert stats.bytes_mean == stats.decode_mean == stats.decode_max == 0.0
+
+    def test_snapshot(self):
+        metrics = EndpointMetrics()
+        for index in range(4):
+            metrics.add_request()
+            metrics.add_response(0.01 * (4 - index), 100 * (index + 1))
+        metrics.add_unchanged()
+        metrics.add_decode(0.002)
+        metrics.add_decode(0.004)
+        metrics.add_request()
+        metrics.add_error(0.5)
+        metrics.add_request()
+        metrics.add_timeout(1.0)
+        stats = metrics.snapshot(interval=0.2)
+        assert stats.requests == 6
+        assert stats.errors == 1
+        assert stats.timeouts == 1
+        assert stats.unchanged_ratio == 0.25  # of received responses only
+        assert stats.latency_p50 == 0.02  # sorted latency
+        assert stats.latency_p99 == stats.latency_max == 0.04
+        assert stats.bytes_mean == 250.0
+        assert stats.bytes_total == 1000
+        assert abs(stats.decode_mean - 0.003) < 1e-12
+        assert stats.decode_max == 0.004
+        assert abs(stats.total_time - (0.1 + 0.006 + 1.5)) < 1e-12
+        assert stats.interval == 0.2
+
+    def test_rolling_window(self):
+        metrics = EndpointMetrics(window=3)
+        for size in (1000, 1, 2, 3):
+            metrics.add_response(size / 1000, size)
+        stats = metrics.snapshot()
+        assert stats.latency_max == 0.003  # oldest sample dropped
+        assert stats.bytes_mean == 2.0
+        assert stats.bytes_total == 1006  # totals not windowed
+
+
+if __name__ == '__main__':
+    unittest.main()
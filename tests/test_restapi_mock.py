@@ -0,0 +1,140 @@
+import asyncio
+import json
+import unittest
+from time import monotonic
+
+from adapter.restapi_mock import (
+    REPAIR_REFUEL,
+    STINT_USAGE,
+    MockConfig,
+    MockServer,
+    ScenarioStep,
+    set_pit_menu,
+    swap_driver,
+)
+from async_request import read_chunked, read_response, set_header_get
+
+GARAGE_DATA = "/rest/garage/getPlayerGarageData"
+PITSTOP_ESTIMATE = "/rest/strategy/pitstop-estimate"
+
+
+def encode_json(data):
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+async def read_content(reader, header):
+    """Read body by content length"""
+    length = int(header.lower().split(b"content-length: ", 1)[1].split(b"\r\n", 1)[0])
+    return await reader.readexactly(length)
+
+
+async def read_chunked_body(reader, header):
+    """Read chunked body"""
+    return await read_chunked(reader)
+
+
+class Test_MockServer(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def start(self, **config):
+        self.server.config = MockConfig(**config)
+        self.server.start()
+
+    def get(self, uri_path, read=read_content):
+        """Send request on new connection, return response header & read result"""
+        async def run():
+            reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+            try:
+                writer.write(set_header_get(uri_path, "127.0.0.1"))
+                await writer.drain()
+                header = await reader.readuntil(b"\r\n\r\n")
+                return header, await read(reader, header)
+            finally:
+                writer.close()
+
+        return asyncio.run(run())
+
+    def test_fixture_response(self):
+        self.start()
+        header, body = self.get(PITSTOP_ESTIMATE)
+        assert header.startswith(b"HTTP/1.1 200 OK")
+        assert body == encode_json(self.server.fixtures[PITSTOP_ESTIMATE])
+        header, body = self.get("/rest/missing")
+        assert header.startswith(b"HTTP/1.1 404")
+        assert body == b""
+        assert self.server.requests[PITSTOP_ESTIMATE] == 1
+
+    def test_chunked_response(self):
+        self.start(chunked=True, chunk_size=1000)
+        header, body = self.get(GARAGE_DATA, read_chunked_body)
+        assert b"Transfer-Encoding: chunked" in header
+        assert len(body) > 1000
+        assert body == encode_json(self.server.fixtures[GARAGE_DATA])
+
+    def test_error_response(self):
+        self.start(error_rate=1.0)
+        header, body = self.get(PITSTOP_ESTIMATE)
+        assert header.startswith(b"HTTP/1.1 500")
+        assert body == b""
+
+    def test_drop_response(self):
+        self.start(drop_rate=1.0)
+        with self.assertRaises(asyncio.IncompleteReadError):
+            self.get(PITSTOP_ESTIMATE)
+        assert self.server.requests[PITSTOP_ESTIMATE] == 1
+
+    def test_slow_response(self):
+        self.start(slow_rate=1.0, slow_delay=0.2)
+        start = monotonic()
+        _, body = self.get(PITSTOP_ESTIMATE)
+        assert monotonic() - start >= 0.15
+        assert body == encode_json(self.server.fixtures[PITSTOP_ESTIMATE])
+
+    def test_latency(self):
+        self.start(latency=0.1)
+        start = monotonic()
+        self.get(PITSTOP_ESTIMATE)
+        assert monotonic() - start >= 0.09
+
+    def test_scenario_playback(self):
+        self.start()
+        self.server.play((
+            ScenarioStep(0.0, lambda server: set_pit_menu(server, "FUEL RATIO:", 2), "fuel ratio"),
+            ScenarioStep(0.0, lambda server: swap_driver(server, "Driver 2"), "driver swap"),
+            ScenarioStep(60.0, lambda server: set_pit_menu(server, "FUEL RATIO:", 0), "not due"),
+        ))
+        _, body = self.get(REPAIR_REFUEL)
+        pit_menu = {option["name"]: option["currentSetting"] for option in json.loads(body)["pitMenu"]["pitMenu"]}
+        assert pit_menu["FUEL RATIO:"] == 2
+        _, body = self.get(STINT_USAGE)
+        assert list(json.loads(body)) == ["Driver 1", "Driver 2"]  # current driver last
+        assert len(self.server._scenario) == 1
+
+    def test_stop_closes_connections(self):
+        self.start()
+
+        async def run():
+            reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+            writer.write(set_header_get(PITSTOP_ESTIMATE, "127.0.0.1"))
+            await writer.drain()
+            _, keep_alive = await read_response(reader)
+            await asyncio.get_running_loop().run_in_executor(None, self.server.stop)
+            eof = await reader.read() == b""
+            writer.close()
+            return keep_alive, eof
+
+        assert asyncio.run(run()) == (True, True)
+
+    def test_bind_error(self):
+        self.start()
+        server = MockServer(port=self.server.port)
+        with self.assertRaises(OSError):
+            server.start()
+
+
+if __name__ == '__main__':
+    unittest.main()
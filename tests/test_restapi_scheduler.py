@@ -0,0 +1,173 @@
+import asyncio
+import unittest
+from time import monotonic
+
+from adapter.restapi_scheduler import (
+    BOOST_PRIORITY,
+    BackoffPolicy,
+    RestScheduler,
+    ScheduledJob,
+)
+
+NO_JITTER = BackoffPolicy(jitter=0.0)
+
+
+async def job_changed():
+    return True
+
+
+async def job_unchanged():
+    return False
+
+
+async def job_failed():
+    raise ConnectionError("server busy")
+
+
+class Test_ScheduledJob(unittest.TestCase):
+    def test_priority_aging(self):
+        job = ScheduledJob("a", job_changed, 1.0, 3)
+        job.next_time = 10.0
+        assert job.order(9.0) == (3, 10.0)  # not due
+        assert job.order(10.5) == (3, 10.0)
+        assert job.order(12.5) == (1, 10.0)  # 2 intervals overdue
+        assert job.order(100.0) == (0, 10.0)  # capped at top regular priority
+
+    def test_boost_order(self):
+        job = ScheduledJob("a", job_changed, 1.0, 3)
+        job.next_time = 6.0
+        job.boost_until = 5.0
+        assert job.order(4.0) == (BOOST_PRIORITY, 6.0)
+        assert job.order(6.0) == (3, 6.0)
+
+
+class Test_RestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = RestScheduler(max_rate=10.0, backoff=NO_JITTER)
+
+    def next_job(self, now):
+        job = self.scheduler._RestScheduler__next_job(now)
+        return job.name if job is not None else None
+
+    def reschedule(self, name, result):
+        job = self.scheduler._jobs[name]
+        self.scheduler._RestScheduler__reschedule(job, result)
+        return job
+
+    def test_next_job_order(self):
+        self.scheduler.add("low", job_changed, 1.0, priority=3)
+        self.scheduler.add("high", job_changed, 1.0, priority=0)
+        jobs = self.scheduler._jobs
+        assert self.next_job(0.0) == "high"  # both due, priority first
+        jobs["high"].running = True
+        assert self.next_job(0.0) == "low"  # running job skipped
+        jobs["high"].running = False
+        jobs["high"].next_time = 5.0
+        jobs["low"].next_time = 3.0
+        assert self.next_job(1.0) == "low"  # none due, earliest first
+        # Low priority job overdue long enough is raised above high priority job
+        jobs["high"].next_time = 9.5
+        jobs["low"].next_time = 7.5
+        assert self.next_job(9.5) == "high"  # 2 intervals overdue, priority 1
+        jobs["low"].next_time = 6.5
+        assert self.next_job(9.5) == "low"  # 3 intervals overdue, priority 0 & due earlier
+
+    def test_interval_backoff(self):
+        self.scheduler.add("a", job_unchanged, 1.0)
+        assert self.reschedule("a", False).interval == 1.5
+        assert self.reschedule("a", False).interval == 2.25
+        for _ in range(10):
+            job = self.reschedule("a", False)
+        assert job.interval == NO_JITTER.max_interval
+        job = self.reschedule("a", True)
+        assert job.interval == 1.0
+        assert job.changed == 1
+        assert job.requests == 13
+
+    def test_shared_error_penalty(self):
+        self.scheduler.add("a", job_failed, 1.0)
+        self.scheduler.add("b", job_changed, 0.5)
+        self.reschedule("a", None)
+        assert self.scheduler.penalty == 2.0
+        self.reschedule("a", None)
+        assert self.scheduler.penalty == 4.0
+        stats = self.scheduler.stats()
+        assert stats["b"].delay == 2.0  # penalty applied to all jobs
+        assert stats["a"].errors == 2
+        for _ in range(5):
+            self.reschedule("a", None)
+        assert self.scheduler.penalty == NO_JITTER.max_penalty
+        self.reschedule("b", True)
+        assert self.scheduler.penalty == 1.0
+
+    def test_boost(self):
+        self.scheduler.add("a", job_unchanged, 1.0, priority=5)
+        job = self.reschedule("a", False)
+        assert job.interval == 1.5
+        assert not self.scheduler.boost("missing")
+        assert self.scheduler.boost("a", duration=10.0)
+        assert job.next_time == 0.0
+        assert job.interval == 1.0
+        assert self.scheduler.stats()["a"].boosted
+        assert self.reschedule("a", False).interval == 1.0  # no growth while boosted
+
+    def test_token_bucket_rate(self):
+        scheduler = RestScheduler(max_rate=20.0, max_concurrency=4, backoff=NO_JITTER)
+        runs = []
+
+        async def job():
+            runs.append(monotonic())
+            return True
+
+        for index in range(4):
+            scheduler.add(str(index), job, 0.0)
+
+        async def run():
+            task = asyncio.create_task(scheduler.run())
+            await asyncio.sleep(0.5)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        start = monotonic()
+        asyncio.run(run())
+        elapsed = monotonic() - start
+        max_burst = max(20.0 * 0.2, 1.0)
+        assert len(runs) > 5
+        assert len(runs) <= max_burst + 20.0 * elapsed + 1
+
+    def test_acquire_rate(self):
+        scheduler = RestScheduler(max_rate=50.0)
+
+        async def run():
+            for _ in range(20):
+                await scheduler.acquire()
+
+        start = monotonic()
+        asyncio.run(run())
+        # 10 burst tokens, remaining 10 requests at 50 per second
+        assert monotonic() - start >= 10 / 50.0 - 0.02
+
+    def test_run_counts_errors(self):
+        scheduler = RestScheduler(max_rate=100.0, backoff=NO_JITTER._replace(error_growth=1.0))
+        scheduler.add("fail", job_failed, 0.01)
+
+        async def run():
+            task = asyncio.create_task(scheduler.run())
+            await asyncio.sleep(0.1)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        asyncio.run(run())
+        stats = scheduler.stats()["fail"]
+        assert stats.requests > 0
+        assert stats.errors == stats.requests
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from adapter.rf2_broker import BrokerData, SharedMemoryBroker
+from adapter.rf2_connector import BufferRing, Snapshot, create_tele_indexes
+from pyRfactor2SharedMemory import rF2data
+from pyRfactor2SharedMemory.rF2MMap import MAX_VEHICLES
+
+
+class Test_SharedMemoryBroker(unittest.TestCase):
+    def setUp(self):
+        self.broker = SharedMemoryBroker(name='test_rf2_broker')
+        self.broker._data = BrokerData()
+        self.scor_ring = BufferRing(rF2data.rF2Scoring, 3)
+        self.tele_ring = BufferRing(rF2data.rF2Telemetry, 3)
+        self.ext_ring = BufferRing(rF2data.rF2Extended, 3)
+
+    def create_snapshot(self, seq, lap_dist):
+        scor_source = rF2data.rF2Scoring()
+        scor_source.mScoringInfo.mNumVehicles = 1
+        scor_source.mVehicles[0].mLapDist = lap_dist
+        ext_source = rF2data.rF2Extended()
+        ext_source.mSessionStarted = 1
+        scor, scor_index, scor_gen = self.scor_ring.publish(scor_source)
+        tele, tele_index, tele_gen = self.tele_ring.publish(rF2data.rF2Telemetry())
+        ext, ext_index, ext_gen = self.ext_ring.publish(ext_source)
+        return Snapshot(
+            seq=seq,
+            scor_version=0,
+            tele_version=0,
+            scor=scor,
+            tele=tele,
+            ext=ext,
+            tele_indexes=create_tele_indexes(tuple(range(MAX_VEHICLES))),
+            scor_slot=(self.scor_ring, scor_index, scor_gen),
+            tele_slot=(self.tele_ring, tele_index, tele_gen),
+            ext_slot=(self.ext_ring, ext_index, ext_gen),
+        )
+
+    def publish(self, snapshot):
+        return self.broker._SharedMemoryBroker__publish(snapshot)
+
+    def test_publish_valid_snapshot(self):
+        snapshot = self.create_snapshot(1, 100.0)
+        assert self.publish(snapshot)
+        header = self.broker._data.mHeader
+        slot = self.broker._data.mSlots[header.mActiveSlot]
+        assert header.mPublishCount == 1
+        assert slot.mSnapshotSeq == 1
+        assert slot.mVersionUpdateBegin == slot.mVersionUpdateEnd
+        assert slot.mScoring.mVehicles[0].mLapDist == 100.0
+        assert slot.mExtended.mSessionStarted == 1
+
+    def test_drop_recycled_snapshot(self):
+        assert self.publish(self.create_snapshot(1, 100.0))
+        stale = self.create_snapshot(2, 200.0)
+        for seq in range(3):  # recycle all ring slots
+            self.create_snapshot(3 + seq, 300.0)
+        assert not stale.is_valid()
+        assert not self.publish(stale)
+        header = self.broker._data.mHeader
+        slot = self.broker._data.mSlots[header.mActiveSlot]
+        assert header.mPublishCount == 1
+        assert slot.mSnapshotSeq == 1
+        assert slot.mScoring.mVehicles[0].mLapDist == 100.0
+
+
+if __name__ == '__main__':
+    unittest.main()
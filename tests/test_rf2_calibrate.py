@@ -0,0 +1,93 @@
+import ctypes
+import os
+import sys
+import threading
+import unittest
+
+from adapter.rf2_calibrate import (
+    COPY_ACCESS,
+    DIRECT_ACCESS,
+    MIN_SAMPLES,
+    ModeStats,
+    measure_mode,
+    select_mode,
+)
+from pyRfactor2SharedMemory import rF2data
+from pyRfactor2SharedMemory.rF2MMap import linux_mmap
+
+TEST_TELEMETRY_NAME = 'test_rf2_calibrate_Telemetry'
+BUDGET = 0.0005
+MAX_TORN = 0.01
+
+
+def mode_stats(mode, samples=100, copy_time=0.0, torn_rate=0.0):
+    return ModeStats(mode, samples, 20, copy_time, 0.0001, 0.001, torn_rate, 0.0, 0)
+
+
+class Test_SelectMode(unittest.TestCase):
+    def test_select_mode(self):
+        cases = (
+            # copy samples, copy time, direct samples, direct torn rate, expected mode
+            (100, 0.0001, 100, 0.0, COPY_ACCESS),  # copy preferred within budget
+            (100, BUDGET, 100, 0.0, COPY_ACCESS),  # at budget
+            (100, BUDGET * 1.01, 100, 0.0, DIRECT_ACCESS),  # over budget
+            (100, 0.002, 100, MAX_TORN, DIRECT_ACCESS),  # at torn limit
+            (100, 0.002, 100, MAX_TORN * 1.5, COPY_ACCESS),  # over torn limit
+            (MIN_SAMPLES - 1, 0.002, 100, 0.0, COPY_ACCESS),  # not enough samples
+            (100, 0.002, MIN_SAMPLES - 1, 0.0, COPY_ACCESS),
+        )
+        for copy_samples, copy_time, direct_samples, torn_rate, expected in cases:
+            copy = mode_stats(COPY_ACCESS, copy_samples, copy_time=copy_time)
+            direct = mode_stats(DIRECT_ACCESS, direct_samples, torn_rate=torn_rate)
+            mode, reason = select_mode(copy, direct, BUDGET, MAX_TORN)
+            assert mode == expected, (copy_samples, copy_time, direct_samples, torn_rate, reason)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "requires /dev/shm")
+class Test_MeasureMode(unittest.TestCase):
+    def setUp(self):
+        self.source = linux_mmap(TEST_TELEMETRY_NAME, ctypes.sizeof(rF2data.rF2Telemetry))
+        self.writer = rF2data.rF2Telemetry.from_buffer(self.source)
+        self.writer.mNumVehicles = 2
+        self.stop = threading.Event()
+
+    def tearDown(self):
+        self.stop.set()
+        del self.writer
+        self.source.close()
+        os.remove('/dev/shm/' + TEST_TELEMETRY_NAME)
+
+    def write(self, stalled):
+        while not self.stop.wait(0.003):
+            self.writer.mVersionUpdateBegin += 2 if stalled else 1
+            self.writer.mVehicles[0].mElapsedTime += 0.01
+            self.writer.mVersionUpdateEnd += 1
+
+    def measure(self, mode, stalled=False):
+        thread = threading.Thread(target=self.write, args=(stalled,), daemon=True)
+        thread.start()
+        try:
+            return measure_mode(mode, 0.2, mmap_name=TEST_TELEMETRY_NAME)
+        finally:
+            self.stop.set()
+            thread.join()
+
+    def test_copy_access(self):
+        stats = self.measure(COPY_ACCESS)
+        assert stats.samples > 0
+        assert stats.failed == 0
+        assert stats.num_vehicles == 2
+
+    def test_failed_copy_not_counted(self):
+        stats = self.measure(COPY_ACCESS, stalled=True)  # buffer always mid-write
+        assert stats.samples == 0
+        assert stats.failed > 0
+
+    def test_direct_access(self):
+        stats = self.measure(DIRECT_ACCESS)
+        assert stats.samples > 0
+        assert stats.copy_time == 0.0
+
+
+if __name__ == '__main__':
+    unittest.main()
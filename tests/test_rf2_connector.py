@@ -0,0 +1,312 @@
+import asyncio
+import ctypes
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+
+from adapter.rf2_connector import (
+    OPTIONAL_BUFFERS,
+    BufferRing,
+    FrameSignal,
+    MMapDataSet,
+    RF2Info,
+    SyncData,
+    UpdateCadence,
+    create_tele_indexes,
+    subscribed_buffer_flag,
+    vehicle_states,
+)
+from adapter.rf2_replay import BUFFER_NAMES
+from adapter.rf2_synthetic import SessionConfig, SessionGenerator, VehicleClass
+from pyRfactor2SharedMemory import rF2data
+from pyRfactor2SharedMemory.rF2enum import SubscribedBuffer
+from pyRfactor2SharedMemory.rF2MMap import MAX_COPY_RETRY, MMapControl, linux_mmap
+
+TEST_SCORING_NAME = 'test_rf2_connector_Scoring'
+DATASET_NAMES = (
+    rF2data.rFactor2Constants.MM_SCORING_FILE_NAME,
+    rF2data.rFactor2Constants.MM_TELEMETRY_FILE_NAME,
+    rF2data.rFactor2Constants.MM_EXTENDED_FILE_NAME,
+    OPTIONAL_BUFFERS["rules"].mmap_name,
+)
+
+
+class Test_UpdateCadence(unittest.TestCase):
+    def setUp(self):
+        self.source = linux_mmap(TEST_SCORING_NAME, ctypes.sizeof(rF2data.rF2Scoring))
+        self.writer = rF2data.rF2Scoring.from_buffer(self.source)
+        self.scoring = MMapControl(TEST_SCORING_NAME, rF2data.rF2Scoring)
+        self.scoring.create(0)
+        self.cadence = UpdateCadence(self.scoring, min_interval=0.002, max_interval=0.1)
+
+    def tearDown(self):
+        self.scoring.close()
+        del self.writer
+        self.source.close()
+        os.remove('/dev/shm/' + TEST_SCORING_NAME)
+
+    def write_frame(self, lap_dist):
+        self.writer.mVersionUpdateBegin += 1
+        self.writer.mScoringInfo.mNumVehicles = 1
+        self.writer.mVehicles[0].mLapDist = lap_dist
+        self.writer.mVersionUpdateEnd += 1
+
+    def test_update_on_new_version(self):
+        self.write_frame(100.0)
+        assert self.cadence.poll(0.0, force=True)
+        assert self.scoring.data.mVehicles[0].mLapDist == 100.0
+        assert not self.cadence.poll(1.0, force=True)  # same version
+        assert self.cadence.idle_polls == 1
+
+    def test_no_update_while_writing(self):
+        self.write_frame(100.0)
+        self.cadence.poll(0.0, force=True)
+        self.writer.mVersionUpdateBegin += 1  # writer stalled mid-write
+        self.writer.mVehicles[0].mLapDist = 200.0
+        self.writer.mVersionUpdateEnd += 1
+        self.writer.mVersionUpdateBegin += 1
+        assert not self.cadence.poll(0.01, force=True)
+        assert self.cadence.updates == 1
+        assert self.scoring.data.mVehicles[0].mLapDist == 100.0
+        self.writer.mVersionUpdateEnd += 1  # write finished
+        assert self.cadence.poll(0.02, force=True)
+        assert self.cadence.updates == 2
+        assert self.scoring.data.mVehicles[0].mLapDist == 200.0
+
+
+class WrittenScoring(rF2data.rF2Scoring):
+    """Scoring data written by game right after each version check"""
+
+    version = 0
+
+    @property
+    def mVersionUpdateBegin(self):
+        return self.version
+
+    @property
+    def mVersionUpdateEnd(self):
+        version = self.version
+        self.version += 1  # next write started
+        return version
+
+
+class Test_BufferRing(unittest.TestCase):
+    def setUp(self):
+        self.ring = BufferRing(rF2data.rF2Scoring, 3)
+        self.source = rF2data.rF2Scoring()
+        self.source.mScoringInfo.mNumVehicles = 1
+        self.source.mVehicles[0].mLapDist = 100.0
+
+    def test_publish_copy(self):
+        data, index, generation = self.ring.publish(self.source)
+        assert data.mVehicles[0].mLapDist == 100.0
+        assert self.ring.is_valid(index, generation)
+
+    def test_no_publish_while_writing(self):
+        self.source.mVersionUpdateBegin += 1  # writer stalled mid-write
+        assert self.ring.publish(self.source) is None
+        assert self.ring.torn_reads == 0
+        self.source.mVersionUpdateEnd += 1  # write finished
+        assert self.ring.publish(self.source) is not None
+
+    def test_torn_copy_discarded(self):
+        source = WrittenScoring()
+        assert self.ring.publish(source) is None
+        assert self.ring.torn_reads == MAX_COPY_RETRY
+
+
+class Test_FrameSignal(unittest.TestCase):
+    def test_wait_timeout(self):
+        signal = FrameSignal()
+        assert signal.wait(0, timeout=0.01) == 0
+        signal.notify()
+        assert signal.wait(0, timeout=0.01) == 1
+
+    def test_wait_async_notified(self):
+        signal = FrameSignal()
+
+        async def wait():
+            threading.Timer(0.01, signal.notify).start()
+            return await signal.wait_async(0, timeout=1.0)
+
+        assert asyncio.run(wait()) == 1
+        assert not signal._async_waiters
+
+    def test_wait_async_timeout_removes_waiter(self):
+        signal = FrameSignal()
+
+        async def wait():
+            for _ in range(100):
+                assert await signal.wait_async(0, timeout=0.0001) == 0
+
+        asyncio.run(wait())
+        assert not signal._async_waiters
+
+    def test_wait_async_cancel_removes_waiter(self):
+        signal = FrameSignal()
+
+        async def wait():
+            task = asyncio.create_task(signal.wait_async(0))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(wait())
+        assert not signal._async_waiters
+
+
+class Test_MMapDataSet(unittest.TestCase):
+    def setUp(self):
+        self.shm_files = [
+            '/dev/shm/' + name for name in DATASET_NAMES
+            if not os.path.exists('/dev/shm/' + name)
+        ]
+        self.dataset = MMapDataSet()
+        self.dataset.create_mmap(0, "")
+
+    def tearDown(self):
+        self.dataset.close_mmap()
+        for filename in self.shm_files:  # only remove files created by test
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_subscribe_maps_once(self):
+        control = self.dataset.subscribe("rules")
+        assert control.data is not None
+        assert self.dataset.subscribe("rules") is control
+        self.dataset.unsubscribe("rules")
+        assert self.dataset.optional("rules") is not control
+
+    def test_unsubscribe_while_updating(self):
+        errors = []
+
+        def toggle():
+            try:
+                for _ in range(300):
+                    self.dataset.subscribe("rules")
+                    self.dataset.unsubscribe("rules")
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        thread = threading.Thread(target=toggle)
+        thread.start()
+        while thread.is_alive():
+            self.dataset.update_optional()
+        thread.join()
+        assert not errors
+
+    def test_subscribed_buffer_flag(self):
+        assert subscribed_buffer_flag("ffb") == SubscribedBuffer.ForceFeedback.value
+        assert subscribed_buffer_flag("weather") == SubscribedBuffer.Weather.value
+        for name in OPTIONAL_BUFFERS:
+            assert subscribed_buffer_flag(name) & SubscribedBuffer.All.value
+
+
+class Test_RF2Info(unittest.TestCase):
+    def test_ffb_before_mapped(self):
+        info = RF2Info()
+        assert info.rf2Buffer("ffb") is None  # not published by plugin
+        assert info.rf2Ffb.mForceValue == 0.0
+
+
+class Test_VehicleVersions(unittest.TestCase):
+    def setUp(self):
+        self.sync = SyncData()
+        self.scor = rF2data.rF2Scoring()
+        self.tele = rF2data.rF2Telemetry()
+        self.scor.mScoringInfo.mNumVehicles = 3
+        self.tele.mNumVehicles = 3
+        for index, mid in enumerate((10, 20, 30)):
+            self.scor.mVehicles[index].mID = mid
+            self.tele.mVehicles[2 - index].mID = mid  # telemetry order differs
+        self.seq = 0
+
+    def update(self):
+        self.seq += 1
+        tele_ids = tuple(self.tele.mVehicles[index].mID for index in range(self.tele.mNumVehicles))
+        snapshot = SimpleNamespace(
+            seq=self.seq, scor=self.scor, tele=self.tele,
+            tele_indexes=create_tele_indexes(tele_ids))
+        self.sync._SyncData__update_vehicle_versions(snapshot)
+        return self.sync.changed_vehicles
+
+    def test_vehicle_states(self):
+        self.scor.mVehicles[1].mLapDist = 150.0
+        self.scor.mVehicles[1].mTotalLaps = 2
+        self.scor.mVehicles[1].mInPits = 1
+        self.tele.mVehicles[1].mPos.x = 12.5  # mID 20
+        self.tele.mVehicles[1].mLocalVel.z = -30.0
+        self.tele.mVehicles[1].mElapsedTime = 99.0  # not tracked
+        tele_ids = (30, 20, 10)
+        states = vehicle_states(self.scor, self.tele, create_tele_indexes(tele_ids))
+        assert states[0] == (10, 0, 0.0, 0) + (0.0,) * 6
+        assert states[1] == (20, 2, 150.0, 1, 12.5, 0.0, 0.0, 0.0, 0.0, -30.0)
+        self.tele.mNumVehicles = 1  # mID 20 telemetry not valid
+        states = vehicle_states(self.scor, self.tele, create_tele_indexes(tele_ids[:1]))
+        assert states[1] == (20, 2, 150.0, 1) + (0.0,) * 6
+
+    def test_changed_vehicles(self):
+        assert self.update() == (True, True, True)  # first update
+        assert self.sync.vehicle_versions[:3] == [1, 1, 1]
+        self.scor.mVehicles[0].mLapDist = 10.0  # moving
+        self.tele.mVehicles[0].mPos.z = 1.0  # mID 30 telemetry
+        assert self.update() == (True, False, True)
+        assert self.sync.vehicle_versions[:3] == [2, 1, 2]
+        for index in range(3):
+            self.tele.mVehicles[index].mElapsedTime += 0.02  # session time advances
+        assert self.update() == (False, False, False)  # parked
+        assert self.sync.changed_since(1) == (True, False, True)
+        assert self.sync.changed_since(2) == (False, False, False)
+
+    def test_slot_reassigned(self):
+        self.update()
+        self.scor.mVehicles[1].mID = 40  # same data, different vehicle
+        assert self.update() == (False, True, False)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "generator requires /dev/shm")
+    def test_parked_vehicle_in_running_session(self):
+        shm_files = [
+            "/dev/shm/" + name for name in BUFFER_NAMES
+            if not os.path.exists("/dev/shm/" + name)
+        ]
+        config = SessionConfig(
+            num_cars=4,
+            classes=(VehicleClass("Fast", 20.0), VehicleClass("Slow", 25.0)),
+            track_length=1000.0,
+            pit_laps=2,  # odd index cars pit on first lap
+            pit_time=100.0,
+        )
+        generator = SessionGenerator(config)
+        try:
+            generator.run(30.0)
+            scor = generator._scor.data
+            tele = generator._tele.data
+            parked = [index for index in range(config.num_cars) if scor.mVehicles[index].mInPits]
+            assert parked
+            self.scor, self.tele = scor, tele
+            self.update()
+            for _ in range(5):
+                generator.step(0.02)
+                generator.write_telemetry()
+                changed = self.update()
+                assert not any(changed[index] for index in parked)
+                assert any(changed)  # other vehicles still moving
+        finally:
+            generator.close()
+            for filename in shm_files:  # only remove files created by test
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    def test_vehicle_added(self):
+        self.update()
+        self.scor.mScoringInfo.mNumVehicles = 4
+        self.scor.mVehicles[3].mID = 50
+        assert self.update() == (False, False, False, True)
+        assert self.sync.vehicle_versions[3] == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from types import SimpleNamespace
+
+from adapter.rf2_interpolate import VehicleInterpolator
+from pyRfactor2SharedMemory import rF2data
+
+
+def create_scoring(session_et, vehicles):
+    """Create scoring data from list of (mID, lap distance, local velocity z)"""
+    scor = rF2data.rF2Scoring()
+    scor.mScoringInfo.mCurrentET = session_et
+    scor.mScoringInfo.mLapDist = 1000.0
+    scor.mScoringInfo.mNumVehicles = len(vehicles)
+    for index, (mid, lap_dist, local_vel) in enumerate(vehicles):
+        veh = scor.mVehicles[index]
+        veh.mID = mid
+        veh.mLapDist = lap_dist
+        veh.mLocalVel.z = local_vel
+        veh.mOri[0].x = veh.mOri[1].y = veh.mOri[2].z = 1.0
+    return scor
+
+
+class Test_VehicleInterpolator(unittest.TestCase):
+    def setUp(self):
+        self.info = SimpleNamespace(snapshot=None)
+        self.interpolator = VehicleInterpolator(self.info)
+
+    def sample(self, version, session_et, vehicles):
+        self.info.snapshot = SimpleNamespace(
+            scor_version=version, scor=create_scoring(session_et, vehicles))
+
+    def test_track_speed_from_history(self):
+        self.sample(1, 0.0, [(10, 100.0, 0.0), (20, 200.0, 0.0)])
+        self.interpolator.update(0.0)
+        self.sample(2, 0.2, [(10, 104.0, 0.0), (20, 210.0, 0.0)])
+        assert self.interpolator.update(0.3) == 2
+        assert abs(self.interpolator.lap_dist[0] - 106.0) < 1e-9
+        assert abs(self.interpolator.lap_dist[1] - 215.0) < 1e-9
+
+    def test_reordered_vehicles_keep_history(self):
+        self.sample(1, 0.0, [(10, 100.0, 0.0), (20, 200.0, 0.0)])
+        self.interpolator.update(0.0)
+        # Overtake, scoring order swapped
+        self.sample(2, 0.2, [(20, 210.0, 0.0), (10, 104.0, 0.0)])
+        self.interpolator.update(0.3)
+        assert abs(self.interpolator.lap_dist[0] - 215.0) < 1e-9
+        assert abs(self.interpolator.lap_dist[1] - 106.0) < 1e-9
+
+    def test_new_vehicle_uses_local_velocity(self):
+        self.sample(1, 0.0, [(10, 100.0, 0.0)])
+        self.interpolator.update(0.0)
+        self.sample(2, 0.2, [(30, 500.0, -30.0), (10, 104.0, 0.0)])
+        self.interpolator.update(0.3)
+        assert abs(self.interpolator.lap_dist[0] - 503.0) < 1e-9
+        assert abs(self.interpolator.lap_dist[1] - 106.0) < 1e-9
+
+    def test_wrap_across_finish_line(self):
+        self.sample(1, 0.0, [(10, 990.0, 0.0)])
+        self.interpolator.update(0.0)
+        self.sample(2, 0.2, [(10, 2.0, 0.0)])
+        self.interpolator.update(0.4)
+        assert abs(self.interpolator.lap_dist[0] - 14.0) < 1e-9
+
+
+if __name__ == '__main__':
+    unittest.main()
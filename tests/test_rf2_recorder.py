@@ -0,0 +1,174 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from adapter.rf2_recorder import (
+    EXTENDED,
+    SCORING,
+    TELEMETRY,
+    FrameRecorder,
+    RecordReader,
+    buffer_bytes,
+)
+from pyRfactor2SharedMemory import rF2data
+
+NUM_VEHICLES = 3
+
+
+def create_snapshot():
+    scor = rF2data.rF2Scoring()
+    tele = rF2data.rF2Telemetry()
+    ext = rF2data.rF2Extended()
+    scor.mScoringInfo.mNumVehicles = NUM_VEHICLES
+    tele.mNumVehicles = NUM_VEHICLES
+    for index in range(NUM_VEHICLES):
+        scor.mVehicles[index].mID = index + 10
+        tele.mVehicles[index].mID = index + 10
+    return SimpleNamespace(scor=scor, tele=tele, ext=ext)
+
+
+def advance(snapshot, step):
+    scor = snapshot.scor
+    tele = snapshot.tele
+    scor.mScoringInfo.mCurrentET = step * 0.2
+    for index in range(NUM_VEHICLES):
+        scor.mVehicles[index].mTotalLaps = step // 5
+        scor.mVehicles[index].mLapDist = (step % 5) * 1000.0 + index * 1.1
+        tele.mVehicles[index].mElapsedTime = step * 0.2
+        tele.mVehicles[index].mEngineRPM = 7000.0 + step * 13.7 + index
+        tele.mVehicles[index].mPos.x = step * 12.345 - index
+
+
+class Test_FrameRecorder(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, "test.rec")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def record(self, steps, **kwargs):
+        """Record steps, return expected (buffer id, data) of each captured frame"""
+        recorder = FrameRecorder(self.filename, tele_interval=0, **kwargs)
+        snapshot = create_snapshot()
+        expected = []
+        recorder.start()
+        for step in range(steps):
+            advance(snapshot, step)
+            if step == 0:
+                snapshot.ext.mVersionUpdateEnd = 1
+                snapshot.ext.mSessionStarted = 1
+            recorder.capture(snapshot, True, True, 0)
+            expected.append((SCORING, buffer_bytes(snapshot.scor, SCORING)))
+            expected.append((TELEMETRY, buffer_bytes(snapshot.tele, TELEMETRY)))
+            if step == 0:
+                expected.append((EXTENDED, buffer_bytes(snapshot.ext, EXTENDED)))
+        recorder.stop()
+        assert recorder.dropped == 0
+        return expected
+
+    def test_round_trip_lossless(self):
+        expected = self.record(20, field_interval=0, precision_bits=52)
+        reader = RecordReader(self.filename)
+        frames = [(frame.buffer_id, frame.data) for frame in reader.frames()]
+        reader.close()
+        assert frames == expected
+
+    def test_default_lossless(self):
+        expected = self.record(5)
+        reader = RecordReader(self.filename)
+        frames = [(frame.buffer_id, frame.data) for frame in reader.frames()]
+        reader.close()
+        assert frames == expected
+
+    def test_restart_drops_stale_frames(self):
+        recorder = FrameRecorder(self.filename)
+        snapshot = create_snapshot()
+        recorder.start()
+        recorder.stop()
+        advance(snapshot, 1)
+        recorder.capture(snapshot, True, True, 0)  # captured while stopped
+        advance(snapshot, 2)
+        recorder.start()
+        recorder.capture(snapshot, True, False, 0)
+        recorder.stop()
+        reader = RecordReader(self.filename)
+        frames = [(frame.buffer_id, frame.data) for frame in reader.frames()]
+        reader.close()
+        assert frames == [
+            (SCORING, buffer_bytes(snapshot.scor, SCORING)),
+            (EXTENDED, buffer_bytes(snapshot.ext, EXTENDED)),
+        ]
+
+    def test_round_trip_precision(self):
+        self.record(20, field_interval=0, precision_bits=32)
+        reader = RecordReader(self.filename)
+        frames = [frame for frame in reader.frames() if frame.buffer_id == TELEMETRY]
+        reader.close()
+        assert len(frames) == 20
+        tele = rF2data.rF2Telemetry.from_buffer_copy(frames[-1].data.ljust(
+            len(bytes(rF2data.rF2Telemetry())), b"\0"))
+        assert tele.mNumVehicles == NUM_VEHICLES
+        assert tele.mVehicles[2].mID == 12
+        assert abs(tele.mVehicles[2].mEngineRPM - (7000.0 + 19 * 13.7 + 2)) < 1e-6
+        assert abs(tele.mVehicles[2].mPos.x - (19 * 12.345 - 2)) < 1e-6
+
+    def test_field_vehicles_repeated(self):
+        self.record(3, field_interval=3600, precision_bits=52)
+        reader = RecordReader(self.filename)
+        frames = [frame for frame in reader.frames() if frame.buffer_id == TELEMETRY]
+        reader.close()
+        size = len(bytes(rF2data.rF2Telemetry()))
+        tele = rF2data.rF2Telemetry.from_buffer_copy(frames[-1].data.ljust(size, b"\0"))
+        assert tele.mVehicles[0].mElapsedTime == 2 * 0.2  # focus vehicle updated
+        assert tele.mVehicles[1].mElapsedTime == 0.0  # field vehicle from first frame
+
+    def test_seek_chunk_has_all_buffers(self):
+        expected = self.record(10, field_interval=0, precision_bits=52, chunk_interval=0)
+        reader = RecordReader(self.filename)
+        assert len(reader.index) > 10
+        start_chunk = len(reader.index) - 1
+        frames = list(reader.frames(start_chunk))
+        reader.close()
+        buffer_ids = {frame.buffer_id for frame in frames}
+        assert buffer_ids == {SCORING, TELEMETRY, EXTENDED}
+        ext = [frame.data for frame in frames if frame.buffer_id == EXTENDED]
+        assert ext[-1] == expected[2][1]  # extended only captured on first step
+        assert frames[-1].data == expected[-1][1]
+
+    def test_seek_lap(self):
+        self.record(20, field_interval=0, chunk_interval=0)
+        reader = RecordReader(self.filename)
+        chunk_number = reader.seek_lap(2)
+        assert reader.index[chunk_number].lap < 2
+        assert reader.index[chunk_number + 1].lap >= 2
+        assert reader.seek_time(-1.0) == 0
+        reader.close()
+
+    def test_index_recovery(self):
+        expected = self.record(10, field_interval=0, precision_bits=52, chunk_interval=0)
+        reader = RecordReader(self.filename)
+        num_chunks = len(reader.index)
+        last_offset = reader.index[-1].offset
+        reader.close()
+        with open(self.filename, "r+b") as file:
+            file.truncate(last_offset + 10)  # drop index & cut last chunk
+        with self.assertLogs("adapter.rf2_recorder", "WARNING"):
+            reader = RecordReader(self.filename)
+        assert len(reader.index) == num_chunks - 1
+        frames = [(frame.buffer_id, frame.data) for frame in reader.frames()]
+        reader.close()
+        assert frames == expected[:len(frames)]
+        assert len(frames) == len(expected) - 1
+
+    def test_not_record_file(self):
+        with open(self.filename, "wb") as file:
+            file.write(b"not a record file")
+        with self.assertRaises(ValueError):
+            RecordReader(self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from adapter.rf2_recorder import FrameRecorder, RecordReader
+from adapter.rf2_replay import BUFFER_NAMES, RecordPlayer
+from tests.test_rf2_recorder import advance, create_snapshot
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "replay requires /dev/shm")
+class Test_RecordPlayer(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, "test.rec")
+        self.shm_files = [
+            "/dev/shm/" + name for name in BUFFER_NAMES
+            if not os.path.exists("/dev/shm/" + name)
+        ]
+        recorder = FrameRecorder(self.filename, tele_interval=0, field_interval=0, chunk_interval=0)
+        snapshot = create_snapshot()
+        recorder.start()
+        for step in range(20):
+            advance(snapshot, step)
+            if step == 0:
+                snapshot.ext.mVersionUpdateEnd = 1
+                snapshot.ext.mSessionStarted = 1
+            recorder.capture(snapshot, True, True, 0)
+        recorder.stop()
+        self.total_frames = recorder.captured
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+        for filename in self.shm_files:  # only remove files created by test
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def play(self, lap):
+        player = RecordPlayer(self.filename, speed=0)
+        player.play(lap)
+        scor, tele, ext = (buffer.data for buffer in player._buffers)
+        result = (
+            player.frames_played,
+            scor.mVersionUpdateBegin == scor.mVersionUpdateEnd,
+            scor.mVehicles[1].mLapDist,
+            tele.mVehicles[1].mElapsedTime,
+            ext.mSessionStarted,
+        )
+        del scor, tele, ext
+        player.stop()
+        return result
+
+    def test_play_all(self):
+        frames, version_synced, lap_dist, elapsed_time, session_started = self.play(0)
+        assert frames == self.total_frames
+        assert version_synced
+        assert abs(lap_dist - (4 * 1000.0 + 1.1)) < 1e-6  # last step 19
+        assert abs(elapsed_time - 19 * 0.2) < 1e-6
+        assert session_started == 1
+
+    def test_seek_lap(self):
+        reader = RecordReader(self.filename)
+        start_chunk = reader.seek_lap(3)
+        reader.close()
+        assert start_chunk > 0
+        frames, version_synced, lap_dist, _, session_started = self.play(3)
+        assert frames < self.total_frames
+        assert version_synced
+        assert abs(lap_dist - (4 * 1000.0 + 1.1)) < 1e-6
+        assert session_started == 1  # extended restored from state frame
+
+
+if __name__ == '__main__':
+    unittest.main()
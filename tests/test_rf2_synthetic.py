@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+from adapter.rf2_replay import BUFFER_NAMES
+from adapter.rf2_synthetic import SessionConfig, SessionGenerator, VehicleClass
+
+CONFIG = SessionConfig(
+    num_cars=4,
+    classes=(VehicleClass("Fast", 20.0), VehicleClass("Slow", 25.0)),
+    track_length=1000.0,
+    pit_laps=0,
+    tele_rate=20.0,
+)
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "generator requires /dev/shm")
+class Test_SessionGenerator(unittest.TestCase):
+    def setUp(self):
+        self.shm_files = [
+            "/dev/shm/" + name for name in BUFFER_NAMES
+            if not os.path.exists("/dev/shm/" + name)
+        ]
+        self.generator = None
+
+    def tearDown(self):
+        if self.generator is not None:
+            self.generator.close()
+        for filename in self.shm_files:  # only remove files created by test
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def create(self, config=CONFIG):
+        if self.generator is not None:
+            self.generator.close()
+        self.generator = SessionGenerator(config)
+        return self.generator
+
+    def test_invalid_num_cars(self):
+        with self.assertRaises(ValueError):
+            SessionGenerator(CONFIG._replace(num_cars=0))
+
+    def test_deterministic_seed(self):
+        lap_times = [car.lap_time for car in self.create().cars]
+        assert lap_times == [car.lap_time for car in self.create().cars]
+        other_seed = self.create(CONFIG._replace(seed=1))
+        assert lap_times != [car.lap_time for car in other_seed.cars]
+
+    def test_lap_time(self):
+        generator = self.create()
+        generator.run(60.0)
+        for car in generator.cars:
+            assert car.laps >= 2
+            assert abs(car.last_lap_time - car.lap_time) < car.lap_time * 0.02
+            assert car.best_lap_time > 0
+
+    def test_scoring_telemetry_consistent(self):
+        generator = self.create()
+        generator.run(30.0)
+        scor = generator._scor.data
+        tele = generator._tele.data
+        assert scor.mVersionUpdateBegin == scor.mVersionUpdateEnd
+        assert tele.mVersionUpdateBegin == tele.mVersionUpdateEnd
+        vehicles = [scor.mVehicles[index] for index in range(CONFIG.num_cars)]
+        assert sorted(veh.mPlace for veh in vehicles) == list(range(1, CONFIG.num_cars + 1))
+        ordered = sorted(vehicles, key=lambda veh: veh.mPlace)
+        progress = [veh.mTotalLaps + veh.mLapDist / CONFIG.track_length for veh in ordered]
+        assert progress == sorted(progress, reverse=True)
+        assert ordered[0].mTimeBehindLeader == 0.0
+        tele_ids = sorted(tele.mVehicles[index].mID for index in range(tele.mNumVehicles))
+        assert tele_ids == sorted(veh.mID for veh in vehicles)
+
+    def test_pit_stop(self):
+        generator = self.create(CONFIG._replace(pit_laps=1, pit_time=100.0))
+        generator.run(30.0)
+        scor = generator._scor.data
+        pitted = [scor.mVehicles[index] for index in range(CONFIG.num_cars) if scor.mVehicles[index].mInPits]
+        assert pitted
+        for veh in pitted:
+            assert veh.mNumPitstops == 1
+            assert veh.mLocalVel.z == 0.0
+
+
+if __name__ == '__main__':
+    unittest.main()
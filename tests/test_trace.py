@@ -0,0 +1,87 @@
+import unittest
+
+from process.trace import (
+    TRACE_CHANNELS,
+    SectorTrace,
+    decode_sector_trace,
+    decode_trace,
+    encode_trace,
+    extrapolate_lap_dist,
+)
+
+
+class Test_encode_trace(unittest.TestCase):
+    def test_round_trip(self):
+        values = [0, 1, 5, 100, 99, -3, 250, 250, 0, 1000000, -1000000]
+        assert decode_trace(encode_trace(values)) == values
+
+    def test_round_trip_empty(self):
+        assert decode_trace(encode_trace([])) == []
+
+    def test_quantisation_step(self):
+        values = [0.0, 0.26, 0.74, 1.5]
+        assert decode_trace(encode_trace(values, 0.5), 0.5) == [0.0, 0.5, 0.5, 1.5]
+
+    def test_encoded_is_ascii(self):
+        assert encode_trace(range(500)).isascii()
+
+
+class Test_SectorTrace(unittest.TestCase):
+    def feed(self, trace, lap, sector, distances):
+        outputs = []
+        for lap_dist in distances:
+            output = trace.update(lap, sector, lap_dist, 50.0, 0.0, lap_dist / 10, 3)
+            if output:
+                outputs.append(output)
+        return outputs
+
+    def test_flush_on_sector_change(self):
+        trace = SectorTrace(resolution=5.0)
+        assert not self.feed(trace, 1, 1, [100.0 + step * 5.0 for step in range(20)])
+        outputs = self.feed(trace, 1, 2, [200.0])
+        assert len(outputs) == 1
+        output = outputs[0]
+        assert output["lap"] == 1 and output["sector"] == 1
+        assert output["startDistance"] == 100.0
+        assert output["samples"] == 20
+        channels = decode_sector_trace(output)
+        assert set(channels) == {name for name, _ in TRACE_CHANNELS}
+        assert channels["throttle"] == [50.0] * 20
+        assert channels["speed"] == [round((100.0 + step * 5.0) / 10) for step in range(20)]
+
+    def test_flush_on_lap_change(self):
+        trace = SectorTrace()
+        self.feed(trace, 1, 3, [1000.0, 1005.0])
+        outputs = self.feed(trace, 2, 3, [0.0])
+        assert len(outputs) == 1 and outputs[0]["lap"] == 1
+
+    def test_first_sector_no_flush(self):
+        trace = SectorTrace()
+        assert trace.update(1, 1, 0.0, 0, 0, 0, 1) is None
+
+    def test_fill_missing_samples(self):
+        trace = SectorTrace(resolution=5.0)
+        trace.update(1, 1, 0.0, 10.0, 0.0, 0.0, 1)
+        trace.update(1, 1, 15.0, 20.0, 0.0, 0.0, 1)
+        channels = decode_sector_trace(trace.export())
+        assert channels["throttle"] == [10.0, 10.0, 10.0, 20.0]
+
+    def test_skip_same_sample(self):
+        trace = SectorTrace(resolution=5.0)
+        trace.update(1, 1, 0.0, 10.0, 0.0, 0.0, 1)
+        trace.update(1, 1, 4.9, 20.0, 0.0, 0.0, 1)
+        assert trace.export()["samples"] == 1
+
+
+class Test_extrapolate_lap_dist(unittest.TestCase):
+    def test_advance_by_speed(self):
+        assert extrapolate_lap_dist(100.0, 50.0, 0.1, 5000.0) == 105.0
+
+    def test_limit_time_and_track_length(self):
+        assert extrapolate_lap_dist(100.0, 50.0, 10.0, 5000.0, max_time=0.5) == 125.0
+        assert extrapolate_lap_dist(4990.0, 50.0, 0.5, 5000.0) == 5000.0
+        assert extrapolate_lap_dist(100.0, 50.0, -1.0, 5000.0) == 100.0
+
+
+if __name__ == '__main__':
+    unittest.main()